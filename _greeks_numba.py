@@ -0,0 +1,73 @@
+"""
+Numba-compiled Black-Scholes call Greeks for whole option chains
+Falls back to the same loop in pure Python when numba is not installed
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+_SQRT_2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+# Serial on purpose: a chain is a few hundred rows (tens of microseconds), and
+# numba's parallel (TBB) runtime hangs interpreter exit when the kernel is
+# called from a worker thread - which Streamlit and the async wrappers do
+@njit(fastmath=True, cache=True, error_model='numpy')
+def _bs_greeks(spot, strikes, ttes, ivs, r, out_delta, out_gamma, out_theta, out_vega):
+    """Fill the output arrays with call delta, gamma, theta/day and vega/1% IV (NaN where tte or IV <= 0)"""
+    for i in range(strikes.shape[0]):
+        tte = ttes[i]
+        iv = ivs[i]
+        if tte <= 0.0 or iv <= 0.0:
+            out_delta[i] = np.nan
+            out_gamma[i] = np.nan
+            out_theta[i] = np.nan
+            out_vega[i] = np.nan
+            continue
+
+        sqrt_t = math.sqrt(tte)
+        sig_sqrt_t = iv * sqrt_t
+        d1 = (math.log(spot / strikes[i]) + (r + 0.5 * iv * iv) * tte) / sig_sqrt_t
+        d2 = d1 - sig_sqrt_t
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        cdf_d2 = 0.5 * (1.0 + math.erf(d2 / _SQRT_2))
+
+        out_delta[i] = 0.5 * (1.0 + math.erf(d1 / _SQRT_2))
+        out_gamma[i] = pdf_d1 / (spot * sig_sqrt_t)
+        out_theta[i] = (-(spot * pdf_d1 * iv) / (2.0 * sqrt_t)
+                        - r * strikes[i] * math.exp(-r * tte) * cdf_d2) / 365.0
+        out_vega[i] = spot * pdf_d1 * sqrt_t / 100.0
+
+
+def bs_call_greeks(spot: float, strikes: np.ndarray, ttes: np.ndarray,
+                   ivs: np.ndarray, r: float) -> Tuple[np.ndarray, ...]:
+    """
+    Black-Scholes call Greeks for a whole chain in one kernel call
+
+    Returns (delta, gamma, theta per day, vega per 1% IV) arrays; entries with
+    tte <= 0 or IV <= 0 are NaN.
+    """
+    strikes = np.ascontiguousarray(strikes, dtype=np.float64)
+    ttes = np.ascontiguousarray(ttes, dtype=np.float64)
+    ivs = np.ascontiguousarray(ivs, dtype=np.float64)
+
+    delta, gamma, theta, vega = np.empty((4, strikes.shape[0]))
+    _bs_greeks(float(spot), strikes, ttes, ivs, float(r), delta, gamma, theta, vega)
+
+    return delta, gamma, theta, vega
@@ -0,0 +1,18 @@
+"""
+Streamlit version shims shared by the dashboard modules
+"""
+
+import streamlit as st
+
+# Rerun-scoped fragments (st.fragment in Streamlit 1.37+, experimental in 1.33+);
+# on older versions the decorated function simply runs as part of the full script
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+
+def rerun_app():
+    """Rerun the whole script, also when called from inside a fragment"""
+    try:
+        st.rerun(scope="app")
+    except TypeError:
+        # scope= is Streamlit 1.37+; older st.rerun always reruns the full app
+        st.rerun()
@@ -10,6 +10,101 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import json
+import math
+
+# Optional JIT compilation of the simulation kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _estimate_premium(stock_price: float, strike: float,
+                      days_to_expiry: float, volatility: float) -> float:
+    """Scalar premium estimate (see CoveredCallBacktester.estimate_option_premium)"""
+    moneyness = (strike - stock_price) / stock_price
+    time_value = volatility * math.sqrt(days_to_expiry / 365) * stock_price * 0.4
+    intrinsic_value = max(0.0, stock_price - strike)
+    premium = intrinsic_value + time_value
+    if moneyness > 0:
+        premium *= math.exp(-moneyness * 5)
+    return max(0.10, premium)
+
+
+@njit(cache=True)
+def _simulate_covered_calls(closes: np.ndarray, strike_pct: float, days: int,
+                            volatility: float, quantity: int):
+    """
+    Run the roll-every-expiry covered call simulation over a close price series
+
+    Returns:
+        (n_trades, entry_idx, expiry_idx, strikes, premiums, assigned,
+         stock_gains, missed_gains, final_entry_price)
+    """
+    n = closes.shape[0]
+    max_trades = n // (days + 1) + 1
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    expiry_idx = np.empty(max_trades, dtype=np.int64)
+    strikes = np.empty(max_trades, dtype=np.float64)
+    premiums = np.empty(max_trades, dtype=np.float64)
+    assigned = np.empty(max_trades, dtype=np.bool_)
+    stock_gains = np.empty(max_trades, dtype=np.float64)
+    missed_gains = np.empty(max_trades, dtype=np.float64)
+
+    n_trades = 0
+    entry_price = np.nan
+    current_idx = 0
+
+    while current_idx < n:
+        stock_price = closes[current_idx]
+        if math.isnan(entry_price):
+            entry_price = stock_price
+
+        strike = stock_price * (1 + strike_pct)
+        premium = _estimate_premium(stock_price, strike, days, volatility)
+
+        exp_idx = current_idx + days
+        if exp_idx >= n:
+            break
+
+        expiry_price = closes[exp_idx]
+        is_assigned = expiry_price >= strike
+
+        if is_assigned:
+            stock_gain = (strike - entry_price) * quantity
+            missed_gain = max(0.0, (expiry_price - strike) * quantity)
+            entry_price = strike
+        else:
+            stock_gain = 0.0
+            missed_gain = 0.0
+
+        entry_idx[n_trades] = current_idx
+        expiry_idx[n_trades] = exp_idx
+        strikes[n_trades] = strike
+        premiums[n_trades] = premium
+        assigned[n_trades] = is_assigned
+        stock_gains[n_trades] = stock_gain
+        missed_gains[n_trades] = missed_gain
+        n_trades += 1
+
+        current_idx = exp_idx + 1
+
+    return (n_trades, entry_idx, expiry_idx, strikes, premiums, assigned,
+            stock_gains, missed_gains, entry_price)
+
+
+def warmup_kernels():
+    """Compile the JIT kernels ahead of the first backtest (no-op without numba)"""
+    _simulate_covered_calls(np.ones(4, dtype=np.float64), 0.05, 1, 0.5, 100)
+
 
 class CoveredCallBacktester:
     """Backtester for Covered Call strategies"""
@@ -61,25 +156,9 @@ class CoveredCallBacktester:
         """
         # Simplified premium estimation
         # Real-world would use actual IV from options chain
-
-        # Calculate moneyness
-        moneyness = (strike - stock_price) / stock_price
-
-        # Time value (theta decay)
-        time_value = volatility * np.sqrt(days_to_expiry / 365) * stock_price * 0.4
-
-        # Intrinsic value
-        intrinsic_value = max(0, stock_price - strike)
-
-        # Total premium
-        premium = intrinsic_value + time_value
-
-        # Adjust for moneyness (OTM options worth less)
-        if moneyness > 0:
-            premium *= np.exp(-moneyness * 5)  # Exponential decay for OTM
-
-        # Floor at $0.10
-        return max(0.10, premium)
+        # (time value ~ vol * sqrt(T), exponential decay for OTM, floor at $0.10)
+        return _estimate_premium(float(stock_price), float(strike),
+                                 float(days_to_expiry), float(volatility))
 
     def backtest_strategy(self, strike_pct: float = 0.05, days: int = 30,
                           strategy_name: str = "Conservative") -> Dict:
@@ -117,62 +196,27 @@ class CoveredCallBacktester:
             'annualized_return_pct': 0
         }
 
-        # Start from first available trading day
-        current_idx = 0
-
-        holding_stock = True
-        entry_price = None
-
-        while current_idx < len(self.price_data):
-            current_date = self.price_data.index[current_idx]
-            stock_price = self.price_data.iloc[current_idx]['Close']
-
-            # If not holding stock, skip
-            if not holding_stock:
-                current_idx += 1
-                continue
-
-            # Set entry price
-            if entry_price is None:
-                entry_price = stock_price
-
-            # Sell Covered Call
-            strike = stock_price * (1 + strike_pct)
-
-            # Estimate premium (this is rough - real data would be better)
-            avg_volatility = self.price_data['Close'].pct_change().std() * np.sqrt(252)
-            premium = self.estimate_option_premium(
-                stock_price, strike, days, avg_volatility
-            )
+        # Simulate on contiguous arrays (JIT-compiled when numba is available)
+        closes = np.ascontiguousarray(self.price_data['Close'].to_numpy(dtype=np.float64))
+        avg_volatility = self.price_data['Close'].pct_change().std() * np.sqrt(252)
 
+        (n_trades, entry_idx, expiry_idx, strikes, premiums, assigned,
+         stock_gains, missed_gains, final_entry) = _simulate_covered_calls(
+            closes, float(strike_pct), int(days), float(avg_volatility), int(self.quantity)
+        )
+        entry_price = None if np.isnan(final_entry) else float(final_entry)
+        dates = self.price_data.index
+
+        for t in range(n_trades):
+            current_date = dates[entry_idx[t]]
+            stock_price = closes[entry_idx[t]]
+            expiry_price = closes[expiry_idx[t]]
+            strike = strikes[t]
+            premium = premiums[t]
             premium_total = premium * self.quantity
-
-            # Find expiration date (look ahead 'days' trading days)
-            expiry_idx = current_idx + days
-            if expiry_idx >= len(self.price_data):
-                # Not enough data left
-                break
-
-            expiry_date_actual = self.price_data.index[expiry_idx]
-            expiry_price = self.price_data.iloc[expiry_idx]['Close']
-
-            # Check if assigned (stock price > strike at expiry)
-            assigned = expiry_price >= strike
-
-            # Calculate P&L
-            if assigned:
-                # Stock called away at strike price
-                stock_gain = (strike - entry_price) * self.quantity
-                missed_gain = max(0, (expiry_price - strike) * self.quantity)
-                # Reset entry price to strike (as if we bought back at strike)
-                entry_price = strike
-                holding_stock = True  # We still hold the position conceptually
-            else:
-                # Keep stock
-                stock_gain = 0
-                missed_gain = 0
-                holding_stock = True
-
+            stock_gain = stock_gains[t]
+            missed_gain = missed_gains[t]
+            is_assigned = bool(assigned[t])
             total_profit = premium_total + stock_gain
 
             # Record trade
@@ -182,9 +226,9 @@ class CoveredCallBacktester:
                 'strike': round(strike, 2),
                 'premium': round(premium, 2),
                 'premium_total': round(premium_total, 2),
-                'expiry_date': expiry_date_actual.strftime('%Y-%m-%d'),
+                'expiry_date': dates[expiry_idx[t]].strftime('%Y-%m-%d'),
                 'expiry_price': round(expiry_price, 2),
-                'assigned': assigned,
+                'assigned': is_assigned,
                 'stock_gain': round(stock_gain, 2),
                 'missed_gain': round(missed_gain, 2),
                 'total_profit': round(total_profit, 2)
@@ -195,21 +239,18 @@ class CoveredCallBacktester:
             results['total_stock_gains'] += stock_gain
             results['total_missed_gains'] += missed_gain
             results['num_trades'] += 1
-            if assigned:
+            if is_assigned:
                 results['num_assigned'] += 1
 
             # Print trade summary
-            status = "🔴 ASSIGNED" if assigned else "✅ EXPIRED"
+            status = "🔴 ASSIGNED" if is_assigned else "✅ EXPIRED"
             print(f"{current_date.strftime('%Y-%m-%d')}: {status}")
             print(f"   Entry: ${stock_price:.2f} | Strike: ${strike:.2f} | Expiry: ${expiry_price:.2f}")
             print(f"   Premium: ${premium_total:.2f} | Profit: ${total_profit:.2f}")
-            if assigned:
+            if is_assigned:
                 print(f"   Missed: ${missed_gain:.2f}")
             print()
 
-            # Move to next trade date (start from expiry + 1)
-            current_idx = expiry_idx + 1
-
         # Calculate summary statistics
         if results['num_trades'] > 0:
             results['win_rate'] = (results['num_trades'] - results['num_assigned']) / results['num_trades']
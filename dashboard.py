@@ -5,11 +5,13 @@ Interactive dashboard for monitoring and managing covered call positions
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import time
 import asyncio
 import nest_asyncio
 
@@ -27,7 +29,22 @@ from trade_analytics import TradeDatabase, add_analytics_to_dashboard
 from risk_manager import RiskManager
 from demo_mode import DemoIBKRConnector
 from csv_portfolio_loader import CSVPortfolioLoader, PortfolioDataStore
-from covered_calls_backtester import CoveredCallBacktester
+from covered_calls_backtester import CoveredCallBacktester, warmup_kernels
+from _streamlit_compat import fragment
+
+
+def lazy_tabs(labels: List[str], key: str) -> List[tuple]:
+    """
+    Create tabs whose bodies only need to run while selected
+
+    Returns (tab, is_open) pairs. Streamlit versions without tab state
+    tracking report every tab as open, so all bodies run as before.
+    """
+    try:
+        tabs = st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        tabs = st.tabs(labels)
+    return [(tab, getattr(tab, 'open', None) is not False) for tab in tabs]
 
 
 # Helper function to handle both dict and object stock data
@@ -38,6 +55,55 @@ def get_stock_attr(stock, attr_name, default=None):
     return getattr(stock, attr_name, default)
 
 
+def normalize_stock(stock) -> Stock:
+    """Convert a dict-format stock position (demo/CSV) to a Stock"""
+    if isinstance(stock, Stock):
+        return stock
+    return Stock(
+        symbol=get_stock_attr(stock, 'symbol'),
+        quantity=get_stock_attr(stock, 'quantity', 0),
+        avg_cost=get_stock_attr(stock, 'avg_cost', 0),
+        current_price=get_stock_attr(stock, 'current_price', 0)
+    )
+
+
+def get_stocks() -> List[Stock]:
+    """Stock positions for the active connection, normalized once per connection"""
+    if st.session_state.get('stocks') is None:
+        raw_stocks = st.session_state.ibkr.get_stock_positions() or []
+        st.session_state.stocks = [normalize_stock(stock) for stock in raw_stocks]
+    return st.session_state.stocks
+
+
+def index_stocks_by_symbol(stocks: List[Stock]) -> Dict[str, Stock]:
+    """Map symbol -> stock, keeping the first entry per symbol"""
+    stocks_by_symbol = {}
+    for stock in stocks:
+        stocks_by_symbol.setdefault(stock.symbol, stock)
+    return stocks_by_symbol
+
+
+def format_dates(dates) -> np.ndarray:
+    """Format datetimes as 'YYYY-MM-DD' strings in one vectorized pass"""
+    return np.array(dates, dtype='datetime64[D]').astype(str)
+
+
+# Translation table for stripping currency/percent formatting in one pass
+CURRENCY_STRIP_TABLE = str.maketrans('', '', '$,%')
+
+# Display formatters for the numeric positions table
+POSITIONS_TABLE_FORMAT = {
+    'Stock Price': '${:.2f}',
+    'Strike': '${:.2f}',
+    'Premium': '${:.2f}',
+    'Max Profit': '${:.2f}',
+    'Return': '{:.2f}%',
+    'Ann. Return': '{:.2f}%',
+    'Delta': '{:.3f}',
+    'IV': '{:.1f}%'
+}
+
+
 # Page configuration
 st.set_page_config(
     page_title="Covered Calls Manager",
@@ -46,8 +112,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (injected from main() on each run)
+CUSTOM_CSS = """
 <style>
     .metric-card {
         background-color: #f0f2f6;
@@ -76,7 +142,80 @@ st.markdown("""
         margin: 10px 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+def portfolio_cache_key(portfolio: PortfolioManager) -> tuple:
+    """Content key for a portfolio - changes whenever a displayed value would"""
+    return tuple(
+        (pos.id, pos.stock.symbol, pos.stock.quantity, pos.stock.current_price,
+         pos.option.strike, pos.option.expiration, pos.option.delta, pos.option.theta,
+         pos.quantity, pos.net_premium)
+        for pos in portfolio.positions
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _metrics_bundle(_portfolio: PortfolioManager, key: tuple) -> Dict:
+    """Compute portfolio metrics once per portfolio content (key)"""
+    return {
+        'metrics': _portfolio.get_portfolio_metrics(),
+        'theta': _portfolio.calculate_total_theta(),
+        'delta': _portfolio.calculate_total_delta(),
+    }
+
+
+def get_metrics_bundle(portfolio: PortfolioManager) -> Dict:
+    """Get cached metrics, theta and delta for the portfolio"""
+    return _metrics_bundle(portfolio, portfolio_cache_key(portfolio))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _positions_for_risk(_portfolio: PortfolioManager, key: tuple) -> List[Dict]:
+    """Convert portfolio positions to risk manager format once per portfolio content"""
+    return [
+        {
+            'symbol': pos.stock.symbol,
+            'quantity': pos.stock.quantity,
+            'price': pos.stock.current_price,
+            'has_covered_call': True,
+            'option_delta': getattr(pos.option, 'delta', 0.5),
+            'days_to_expiry': pos.option.days_to_expiration
+        }
+        for pos in _portfolio.positions
+    ]
+
+
+def get_positions_for_risk(portfolio: PortfolioManager) -> List[Dict]:
+    """Get cached risk-manager position dicts for the portfolio"""
+    return _positions_for_risk(portfolio, portfolio_cache_key(portfolio))
+
+
+@st.cache_data(show_spinner=False)
+def _expiration_groups(expirations: tuple) -> List[tuple]:
+    """Sorted (date, position indices) groups for a tuple of expirations"""
+    groups: Dict[str, List[int]] = {}
+    for idx, exp_date in enumerate(format_dates(expirations)):
+        groups.setdefault(exp_date, []).append(idx)
+    return sorted(groups.items())
+
+
+@st.cache_resource(show_spinner=False)
+def warm_backtester() -> bool:
+    """Compile backtest kernels once per process, off the Run Backtest click path"""
+    warmup_kernels()
+    return True
+
+
+def get_risk_manager() -> RiskManager:
+    """Get the session's RiskManager (kept per session - it holds alert state)"""
+    if 'risk_manager' not in st.session_state:
+        st.session_state.risk_manager = RiskManager(
+            max_position_pct=0.25,
+            max_cc_pct=0.70,
+            min_cash_reserve=0.10
+        )
+    return st.session_state.risk_manager
 
 
 class DashboardState:
@@ -95,6 +234,8 @@ class DashboardState:
             st.session_state.portfolio_data = None
         if 'csv_mode' not in st.session_state:
             st.session_state.csv_mode = False
+        if 'stocks' not in st.session_state:
+            st.session_state.stocks = None
 
 
 def sidebar_config():
@@ -113,6 +254,7 @@ def sidebar_config():
         if not st.session_state.connected:
             if st.sidebar.button("🎮 Start Demo"):
                 st.session_state.ibkr = DemoIBKRConnector()
+                st.session_state.stocks = None
                 st.session_state.connected = True
                 st.session_state.demo_mode = True
                 st.sidebar.success("✅ Demo Mode Active!")
@@ -122,6 +264,7 @@ def sidebar_config():
             if st.sidebar.button("Stop Demo"):
                 st.session_state.connected = False
                 st.session_state.demo_mode = False
+                st.session_state.stocks = None
                 st.sidebar.info("Demo stopped")
                 st.rerun()
     else:
@@ -150,6 +293,7 @@ def sidebar_config():
                     with st.spinner("Connecting to IBKR..."):
                         if ibkr.connect():
                             st.session_state.ibkr = ibkr
+                            st.session_state.stocks = None
                             st.session_state.connected = True
                             st.session_state.demo_mode = False
                             st.sidebar.success("✅ Connected!")
@@ -165,6 +309,7 @@ def sidebar_config():
                     st.session_state.ibkr.disconnect()
                 st.session_state.connected = False
                 st.session_state.demo_mode = False
+                st.session_state.stocks = None
                 st.sidebar.info("Disconnected")
                 st.rerun()
 
@@ -183,11 +328,15 @@ def sidebar_config():
             # Read CSV content
             csv_content = uploaded_file.getvalue().decode('utf-8')
 
-            # Load portfolio data
+            # Load portfolio data (only when the uploaded content changes)
             if st.session_state.portfolio_data is None:
                 st.session_state.portfolio_data = PortfolioDataStore()
 
-            st.session_state.portfolio_data.load_from_csv(csv_content)
+            csv_hash = hash(csv_content)
+            if st.session_state.get('csv_hash') != csv_hash:
+                st.session_state.portfolio_data.load_from_csv(csv_content)
+                st.session_state.csv_hash = csv_hash
+                st.session_state.stocks = None
             st.session_state.csv_mode = True
             st.session_state.connected = True
             st.session_state.ibkr = st.session_state.portfolio_data
@@ -198,6 +347,10 @@ def sidebar_config():
         except Exception as e:
             st.sidebar.error(f"❌ Error loading CSV: {str(e)}")
             st.session_state.csv_mode = False
+            st.session_state.csv_hash = None
+
+    if st.session_state.connected and st.sidebar.button("🔄 Refresh Positions"):
+        st.session_state.stocks = None
 
     st.sidebar.markdown("---")
 
@@ -218,6 +371,7 @@ def sidebar_config():
         # This would need to be implemented with st.experimental_rerun
 
 
+@fragment
 def account_overview():
     """Display account overview and key metrics"""
     st.header("📊 Account Overview")
@@ -422,7 +576,8 @@ def portfolio_summary():
         st.info("📭 No active covered call positions")
         return
 
-    metrics = portfolio.get_portfolio_metrics()
+    bundle = get_metrics_bundle(portfolio)
+    metrics = bundle['metrics']
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -451,10 +606,10 @@ def portfolio_summary():
         st.metric("Avg Delta", f"{metrics['avg_delta']:.3f}")
 
     with col3:
-        total_theta = portfolio.calculate_total_theta()
-        st.metric("Total Daily Theta", f"${total_theta:.2f}")
+        st.metric("Total Daily Theta", f"${bundle['theta']:.2f}")
 
 
+@fragment
 def positions_table():
     """Display detailed positions table"""
     st.header("📋 Active Positions")
@@ -464,30 +619,28 @@ def positions_table():
     if not portfolio.positions:
         return
 
-    # Create DataFrame from positions
-    data = []
-    for pos in portfolio.positions:
-        data.append({
-            'Symbol': pos.stock.symbol,
-            'Quantity': pos.quantity,
-            'Stock Price': f"${pos.stock.current_price:.2f}",
-            'Strike': f"${pos.option.strike:.2f}",
-            'Expiration': pos.option.expiration.strftime('%Y-%m-%d'),
-            'DTE': pos.option.days_to_expiration,
-            'Premium': f"${pos.net_premium:.2f}",
-            'Max Profit': f"${pos.max_profit:.2f}",
-            'Return': f"{pos.return_if_assigned:.2f}%",
-            'Ann. Return': f"{pos.annualized_return:.2f}%",
-            'Delta': f"{pos.option.delta:.3f}",
-            'IV': f"{pos.option.implied_volatility:.1f}%",
-            'Status': pos.status.value
-        })
-
-    df = pd.DataFrame(data)
-
-    # Style the DataFrame
+    # Create DataFrame column-wise with typed numeric columns
+    positions = portfolio.positions
+    n = len(positions)
+    df = pd.DataFrame({
+        'Symbol': [pos.stock.symbol for pos in positions],
+        'Quantity': np.fromiter((pos.quantity for pos in positions), dtype=np.int64, count=n),
+        'Stock Price': np.fromiter((pos.stock.current_price for pos in positions), dtype=np.float64, count=n),
+        'Strike': np.fromiter((pos.option.strike for pos in positions), dtype=np.float64, count=n),
+        'Expiration': format_dates([pos.option.expiration for pos in positions]),
+        'DTE': np.fromiter((pos.option.days_to_expiration for pos in positions), dtype=np.int64, count=n),
+        'Premium': np.fromiter((pos.net_premium for pos in positions), dtype=np.float64, count=n),
+        'Max Profit': np.fromiter((pos.max_profit for pos in positions), dtype=np.float64, count=n),
+        'Return': np.fromiter((pos.return_if_assigned for pos in positions), dtype=np.float64, count=n),
+        'Ann. Return': np.fromiter((pos.annualized_return for pos in positions), dtype=np.float64, count=n),
+        'Delta': np.fromiter((pos.option.delta for pos in positions), dtype=np.float64, count=n),
+        'IV': np.fromiter((pos.option.implied_volatility for pos in positions), dtype=np.float64, count=n),
+        'Status': [pos.status.value for pos in positions]
+    })
+
+    # Style the DataFrame (formatting is display-only, data stays numeric)
     st.dataframe(
-        df,
+        df.style.format(POSITIONS_TABLE_FORMAT),
         use_container_width=True,
         hide_index=True
     )
@@ -507,16 +660,18 @@ def expiration_calendar():
     st.header("📅 Expiration Calendar")
 
     portfolio = st.session_state.portfolio
-    calendar = portfolio.get_expiration_calendar()
 
-    if not calendar:
+    if not portfolio.positions:
         st.info("No positions to display")
         return
 
+    calendar = _expiration_groups(tuple(pos.option.expiration for pos in portfolio.positions))
+
     # Create visualization
-    for exp_date, positions in sorted(calendar.items()):
-        with st.expander(f"**{exp_date}** - {len(positions)} position(s)"):
-            for pos in positions:
+    for exp_date, indices in calendar:
+        with st.expander(f"**{exp_date}** - {len(indices)} position(s)"):
+            for idx in indices:
+                pos = portfolio.positions[idx]
                 col1, col2, col3, col4 = st.columns(4)
 
                 with col1:
@@ -536,6 +691,18 @@ def expiration_calendar():
                         st.markdown("🟢 Safe")
 
 
+def _alerts_html(alerts: List[Dict], css_class: str) -> str:
+    """Render a group of alerts as a single HTML block"""
+    return "\n".join(
+        f'<div class="{css_class}">'
+        f"<strong>{alert['type']}</strong><br>"
+        f"{alert['message']}<br>"
+        f"<em>Action: {alert['action']}</em>"
+        f"</div>"
+        for alert in alerts
+    )
+
+
 def alerts_panel():
     """Display alerts and warnings"""
     st.header("⚠️ Alerts & Notifications")
@@ -556,34 +723,20 @@ def alerts_panel():
     # Display high severity alerts
     if high_alerts:
         st.markdown("### 🔴 High Priority")
-        for alert in high_alerts:
-            st.markdown(f"""
-            <div class="danger-box">
-                <strong>{alert['type']}</strong><br>
-                {alert['message']}<br>
-                <em>Action: {alert['action']}</em>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(_alerts_html(high_alerts, 'danger-box'), unsafe_allow_html=True)
 
     # Display medium severity alerts
     if medium_alerts:
         st.markdown("### 🟡 Medium Priority")
-        for alert in medium_alerts:
-            st.markdown(f"""
-            <div class="warning-box">
-                <strong>{alert['type']}</strong><br>
-                {alert['message']}<br>
-                <em>Action: {alert['action']}</em>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(_alerts_html(medium_alerts, 'warning-box'), unsafe_allow_html=True)
 
     # Display low severity alerts
     if low_alerts:
         with st.expander("🟢 Low Priority Alerts"):
-            for alert in low_alerts:
-                st.info(f"**{alert['type']}**: {alert['message']}")
+            st.info("\n\n".join(f"**{alert['type']}**: {alert['message']}" for alert in low_alerts))
 
 
+@fragment
 def strategy_finder():
     """Find and suggest covered call strategies"""
     st.header("🎯 Strategy Finder")
@@ -595,57 +748,33 @@ def strategy_finder():
     ibkr = st.session_state.ibkr
 
     # Get stock positions
-    stocks = ibkr.get_stock_positions()
+    stocks = get_stocks()
 
     if not stocks:
         st.info("No stock positions found")
         return
 
-    # Select stock - handle both dict and object format
-    stock_symbols = []
-    for stock in stocks:
-        if isinstance(stock, dict):
-            stock_symbols.append(stock['symbol'])
-        else:
-            stock_symbols.append(stock.symbol)
+    # Select stock
+    stocks_by_symbol = index_stocks_by_symbol(stocks)
 
     selected_symbol = st.selectbox(
         "Select Stock",
-        options=stock_symbols
+        options=list(stocks_by_symbol)
     )
 
     # Find selected stock
-    selected_stock = None
-    for s in stocks:
-        if isinstance(s, dict):
-            if s['symbol'] == selected_symbol:
-                selected_stock = s
-                break
-        else:
-            if s.symbol == selected_symbol:
-                selected_stock = s
-                break
+    selected_stock = stocks_by_symbol.get(selected_symbol)
 
     if not selected_stock:
         return
 
-    # Display stock info - handle both dict and object format
-    def get_attr(obj, attr, default=0):
-        if isinstance(obj, dict):
-            return obj.get(attr, default)
-        return getattr(obj, attr, default)
-
-    current_price = get_attr(selected_stock, 'current_price')
-    quantity = get_attr(selected_stock, 'quantity')
-    avg_cost = get_attr(selected_stock, 'avg_cost')
+    # Display stock info
+    current_price = selected_stock.current_price
+    quantity = selected_stock.quantity
+    avg_cost = selected_stock.avg_cost
 
-    # Calculate P&L if not in dict
-    if isinstance(selected_stock, dict):
-        unrealized_pnl = (current_price - avg_cost) * quantity
-        unrealized_pnl_pct = ((current_price - avg_cost) / avg_cost) * 100 if avg_cost > 0 else 0
-    else:
-        unrealized_pnl = get_attr(selected_stock, 'unrealized_pnl', 0)
-        unrealized_pnl_pct = get_attr(selected_stock, 'unrealized_pnl_pct', 0)
+    unrealized_pnl = selected_stock.unrealized_pnl
+    unrealized_pnl_pct = selected_stock.unrealized_pnl_pct if avg_cost > 0 else 0
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -675,9 +804,6 @@ def strategy_finder():
     if st.button("🔍 Find Best Strikes"):
         with st.spinner("Analyzing options..."):
             try:
-                # Get current price (handle both dict and object)
-                current_price = get_stock_attr(selected_stock, 'current_price')
-
                 # Get OTM calls
                 options = ibkr.get_otm_calls(
                     selected_symbol,
@@ -700,7 +826,20 @@ def strategy_finder():
                 # Display results
                 st.success(f"Found {len(scored_options)} suitable options")
 
-                for i, (option, score) in enumerate(scored_options, 1):
+                expiration_labels = format_dates([option.expiration for option, _ in scored_options])
+
+                # Calculate potential returns for all candidates at once
+                n_options = len(scored_options)
+                premiums = np.fromiter((option.premium for option, _ in scored_options), dtype=np.float64, count=n_options)
+                dtes = np.fromiter((option.days_to_expiration for option, _ in scored_options), dtype=np.float64, count=n_options)
+                contracts = int(quantity) // 100
+                market_value = selected_stock.market_value
+                total_premiums = premiums * (contracts * 100)
+                premium_pcts = total_premiums / market_value * 100
+                annualized_returns = premium_pcts * (365 / dtes)
+
+                for i, ((option, score), expiration_label, total_premium, premium_pct, annualized) in enumerate(
+                        zip(scored_options, expiration_labels, total_premiums, premium_pcts, annualized_returns), 1):
                     with st.expander(f"#{i} - Strike ${option.strike:.2f} (Score: {score:.0f}/100)"):
                         col1, col2, col3 = st.columns(3)
 
@@ -708,7 +847,7 @@ def strategy_finder():
                             st.write("**Contract Details**")
                             st.write(f"Strike: ${option.strike:.2f}")
                             st.write(f"Premium: ${option.premium:.2f}")
-                            st.write(f"Expiration: {option.expiration.strftime('%Y-%m-%d')}")
+                            st.write(f"Expiration: {expiration_label}")
                             st.write(f"DTE: {option.days_to_expiration}")
 
                         with col2:
@@ -719,12 +858,6 @@ def strategy_finder():
 
                         with col3:
                             st.write("**Returns**")
-                            # Calculate potential returns
-                            contracts = selected_stock.quantity // 100
-                            total_premium = option.premium * contracts * 100
-                            premium_pct = (total_premium / selected_stock.market_value) * 100
-                            annualized = premium_pct * (365 / option.days_to_expiration)
-
                             st.write(f"Premium: ${total_premium:.2f}")
                             st.write(f"Return: {premium_pct:.2f}%")
                             st.write(f"Annualized: {annualized:.2f}%")
@@ -746,30 +879,21 @@ def strategy_finder():
                             # Display trade summary
                             st.write(f"**Symbol:** {selected_symbol}")
                             st.write(f"**Strike:** ${option.strike:.2f}")
-                            st.write(f"**Expiration:** {option.expiration.strftime('%Y-%m-%d')}")
+                            st.write(f"**Expiration:** {expiration_label}")
                             st.write(f"**Premium:** ${total_premium:.2f}")
                             st.write(f"**Contracts:** {contracts}")
 
                             # Risk validation
                             try:
-                                from risk_manager import RiskManager
-                                risk_manager = RiskManager()
+                                risk_manager = get_risk_manager()
+                                portfolio = st.session_state.portfolio
 
                                 # Get account value from session state or estimate
                                 account_value = st.session_state.get('account_value',
                                                                     sum(pos.stock.market_value for pos in portfolio.positions) if portfolio.positions else 100000)
 
-                                # Convert existing positions for risk check
-                                existing_positions = []
-                                for pos in portfolio.positions:
-                                    existing_positions.append({
-                                        'symbol': get_stock_attr(pos.stock, 'symbol'),
-                                        'quantity': get_stock_attr(pos.stock, 'quantity'),
-                                        'price': get_stock_attr(pos.stock, 'current_price'),
-                                        'has_covered_call': True,
-                                        'option_delta': get_stock_attr(pos.option, 'delta', 0.5),
-                                        'days_to_expiry': get_stock_attr(pos.option, 'days_to_expiration', 30)
-                                    })
+                                # Existing positions for risk check
+                                existing_positions = get_positions_for_risk(portfolio)
 
                                 approved, reason = risk_manager.validate_new_position(
                                     symbol=selected_symbol,
@@ -828,6 +952,7 @@ def strategy_finder():
                 st.error(f"Error: {e}")
 
 
+@fragment
 def performance_charts():
     """Display performance charts and analytics"""
     st.header("📈 Performance Analytics")
@@ -839,36 +964,39 @@ def performance_charts():
         return
 
     # Create tabs for different charts
-    tab1, tab2, tab3, tab4 = st.tabs(["Returns Distribution", "Greeks Exposure", "Expiration Timeline", "🛡️ Risk Management"])
+    (tab1, show1), (tab2, show2), (tab3, show3), (tab4, show4) = lazy_tabs(
+        ["Returns Distribution", "Greeks Exposure", "Expiration Timeline", "🛡️ Risk Management"],
+        key="performance_tabs"
+    )
 
     with tab1:
         # Returns distribution
-        if portfolio.positions:
-            returns_data = [
-                {
-                    'Symbol': pos.stock.symbol,
-                    'Return if Assigned': pos.return_if_assigned,
-                    'Annualized Return': pos.annualized_return
-                }
-                for pos in portfolio.positions
-            ]
-            df = pd.DataFrame(returns_data)
-
-            fig = px.bar(
-                df,
-                x='Symbol',
-                y=['Return if Assigned', 'Annualized Return'],
-                title="Expected Returns by Position",
-                barmode='group'
-            )
+        if show1 and portfolio.positions:
+            positions = portfolio.positions
+            symbols = [pos.stock.symbol for pos in positions]
+
+            fig = go.Figure(data=[
+                go.Bar(
+                    name='Return if Assigned',
+                    x=symbols,
+                    y=np.fromiter((pos.return_if_assigned for pos in positions), dtype=np.float64, count=len(positions))
+                ),
+                go.Bar(
+                    name='Annualized Return',
+                    x=symbols,
+                    y=np.fromiter((pos.annualized_return for pos in positions), dtype=np.float64, count=len(positions))
+                )
+            ])
+            fig.update_layout(title="Expected Returns by Position", barmode='group')
             st.plotly_chart(fig, use_container_width=True)
 
     with tab2:
         # Greeks exposure
-        if portfolio.positions:
+        if show2 and portfolio.positions:
+            bundle = get_metrics_bundle(portfolio)
             greeks_data = {
-                'Delta': portfolio.calculate_total_delta(),
-                'Theta': portfolio.calculate_total_theta(),
+                'Delta': bundle['delta'],
+                'Theta': bundle['theta'],
             }
 
             fig = go.Figure(data=[
@@ -883,50 +1011,41 @@ def performance_charts():
 
     with tab3:
         # Expiration timeline
-        if portfolio.positions:
-            timeline_data = [
-                {
-                    'Symbol': pos.stock.symbol,
-                    'Expiration': pos.option.expiration,
-                    'DTE': pos.option.days_to_expiration,
-                    'Premium': pos.net_premium
-                }
-                for pos in portfolio.positions
-            ]
-            df = pd.DataFrame(timeline_data)
-
-            fig = px.scatter(
-                df,
-                x='Expiration',
-                y='Premium',
-                size='DTE',
-                color='Symbol',
-                title="Expiration Timeline",
-                hover_data=['DTE']
-            )
+        if show3 and portfolio.positions:
+            positions = portfolio.positions
+            n = len(positions)
+            symbols = np.array([pos.stock.symbol for pos in positions])
+            expirations = np.array([pos.option.expiration for pos in positions], dtype='datetime64[s]')
+            dtes = np.fromiter((pos.option.days_to_expiration for pos in positions), dtype=np.float64, count=n)
+            premiums = np.fromiter((pos.net_premium for pos in positions), dtype=np.float64, count=n)
+
+            # Marker area proportional to DTE (same scaling as px.scatter size_max=20)
+            sizes = np.clip(dtes, 0, None)
+            sizeref = 2.0 * sizes.max() / (20 ** 2) if sizes.max() > 0 else 1.0
+
+            fig = go.Figure()
+            for symbol in dict.fromkeys(symbols):
+                mask = symbols == symbol
+                fig.add_trace(go.Scattergl(
+                    name=symbol,
+                    x=expirations[mask],
+                    y=premiums[mask],
+                    mode='markers',
+                    marker=dict(size=sizes[mask], sizemode='area', sizeref=sizeref),
+                    customdata=dtes[mask],
+                    hovertemplate="%{x}<br>Premium: $%{y:.2f}<br>DTE: %{customdata:.0f}"
+                ))
+            fig.update_layout(title="Expiration Timeline", xaxis_title="Expiration", yaxis_title="Premium")
             st.plotly_chart(fig, use_container_width=True)
 
     with tab4:
         # Risk Management Dashboard
-        try:
-            # Initialize Risk Manager
-            risk_manager = RiskManager(
-                max_position_pct=0.25,
-                max_cc_pct=0.70,
-                min_cash_reserve=0.10
-            )
+        if not show4:
+            return
 
-            # Convert portfolio positions to risk manager format
-            positions_for_risk = []
-            for pos in portfolio.positions:
-                positions_for_risk.append({
-                    'symbol': pos.stock.symbol,
-                    'quantity': pos.stock.quantity,
-                    'price': pos.stock.current_price,
-                    'has_covered_call': True,
-                    'option_delta': pos.option.delta if hasattr(pos.option, 'delta') else 0.5,
-                    'days_to_expiry': pos.option.days_to_expiration
-                })
+        try:
+            risk_manager = get_risk_manager()
+            positions_for_risk = get_positions_for_risk(portfolio)
 
             # Calculate account value and cash
             account_value = sum(pos.stock.quantity * pos.stock.current_price for pos in portfolio.positions)
@@ -956,6 +1075,18 @@ def performance_charts():
             st.info("Risk management features require active portfolio positions")
 
 
+def run_backtest(symbol: str, start_date: str, end_date: str, quantity: int) -> pd.DataFrame:
+    """Download history and compare strategies (safe to run in a worker thread)"""
+    backtester = CoveredCallBacktester(
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        quantity=quantity
+    )
+    return backtester.compare_strategies()
+
+
+@fragment
 def backtesting_tab():
     """Historical backtesting of covered calls strategies"""
     st.header("📊 Strategy Backtesting")
@@ -969,26 +1100,20 @@ def backtesting_tab():
         st.warning("⚠️ Connect to IBKR or upload CSV to see your positions")
         return
 
-    ibkr = st.session_state.ibkr
-    stocks = ibkr.get_stock_positions()
+    stocks = get_stocks()
 
     if not stocks:
         st.info("No stock positions found")
         return
 
-    # Extract symbols
-    stock_symbols = []
-    for stock in stocks:
-        if isinstance(stock, dict):
-            stock_symbols.append(stock['symbol'])
-        else:
-            stock_symbols.append(stock.symbol)
+    # Index stocks by symbol
+    stocks_by_symbol = index_stocks_by_symbol(stocks)
 
     # Backtester settings
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        selected_symbol = st.selectbox("📈 Symbol", options=stock_symbols)
+        selected_symbol = st.selectbox("📈 Symbol", options=list(stocks_by_symbol))
 
     with col2:
         start_date = st.date_input(
@@ -1005,15 +1130,10 @@ def backtesting_tab():
         )
 
     # Get quantity for selected symbol
-    selected_stock = None
-    for s in stocks:
-        symbol = s['symbol'] if isinstance(s, dict) else s.symbol
-        if symbol == selected_symbol:
-            selected_stock = s
-            break
+    selected_stock = stocks_by_symbol.get(selected_symbol)
 
     if selected_stock:
-        quantity = selected_stock['quantity'] if isinstance(selected_stock, dict) else selected_stock.quantity
+        quantity = selected_stock.quantity
         st.info(f"📊 Your position: {int(quantity)} shares of {selected_symbol}")
     else:
         quantity = 100
@@ -1021,99 +1141,146 @@ def backtesting_tab():
     # Run backtest button
     if st.button("🚀 Run Backtest", type="primary"):
         try:
-            with st.spinner(f"Running backtest on {selected_symbol}..."):
-                # Create backtester
-                backtester = CoveredCallBacktester(
-                    symbol=selected_symbol,
-                    start_date=start_date.strftime('%Y-%m-%d'),
-                    end_date=end_date.strftime('%Y-%m-%d'),
-                    quantity=int(quantity)
-                )
+            # Run the download + simulation off the script thread and poll for progress
+            with st.status(f"Running backtest on {selected_symbol}...") as status:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(
+                        run_backtest,
+                        selected_symbol,
+                        start_date.strftime('%Y-%m-%d'),
+                        end_date.strftime('%Y-%m-%d'),
+                        int(quantity)
+                    )
+                    started = time.monotonic()
+                    while not future.done():
+                        status.update(
+                            label=f"Running backtest on {selected_symbol}... "
+                                  f"({time.monotonic() - started:.0f}s)"
+                        )
+                        time.sleep(0.2)
+                    comparison = future.result()
+                status.update(label="✅ Backtest Complete!", state="complete", expanded=False)
+
+            # Display results table
+            st.subheader("📊 Strategy Comparison")
+            st.dataframe(comparison, use_container_width=True)
+
+            # Create visualization
+            st.subheader("📈 Returns Comparison")
+
+            # Extract numeric values for plotting
+            comparison_plot = comparison.copy()
+            comparison_plot['Total Return $'] = pd.to_numeric(
+                comparison['Total Return'].str.translate(CURRENCY_STRIP_TABLE), errors='coerce'
+            )
+            comparison_plot['Annualized %'] = pd.to_numeric(
+                comparison['Annualized %'].str.rstrip('%'), errors='coerce'
+            )
 
-                # Compare strategies
-                comparison = backtester.compare_strategies()
+            col1, col2 = st.columns(2)
+
+            with col1:
+                fig1 = go.Figure(go.Bar(
+                    x=comparison_plot['Strategy'].to_numpy(),
+                    y=comparison_plot['Total Return $'].to_numpy()
+                ))
+                fig1.update_layout(
+                    title="Total Return by Strategy",
+                    xaxis_title='Strategy',
+                    yaxis_title='Total Return ($)'
+                )
+                fig1.update_xaxes(tickangle=-45)
+                st.plotly_chart(fig1, use_container_width=True)
+
+            with col2:
+                annualized = comparison_plot['Annualized %'].to_numpy()
+                fig2 = go.Figure(go.Bar(
+                    x=comparison_plot['Strategy'].to_numpy(),
+                    y=annualized,
+                    marker=dict(
+                        color=annualized,
+                        colorscale='RdYlGn',
+                        showscale=True,
+                        colorbar=dict(title='Annualized %')
+                    )
+                ))
+                fig2.update_layout(
+                    title="Annualized Return by Strategy",
+                    xaxis_title='Strategy',
+                    yaxis_title='Annualized Return (%)'
+                )
+                fig2.update_xaxes(tickangle=-45)
+                st.plotly_chart(fig2, use_container_width=True)
 
-                st.success("✅ Backtest Complete!")
+            # Insights
+            st.subheader("💡 Key Insights")
 
-                # Display results table
-                st.subheader("📊 Strategy Comparison")
-                st.dataframe(comparison, use_container_width=True)
+            # Best performing strategy
+            best_idx = int(np.nanargmax(comparison_plot['Total Return $'].to_numpy()))
+            best_strategy = comparison.iloc[best_idx]
 
-                # Create visualization
-                st.subheader("📈 Returns Comparison")
+            col1, col2, col3 = st.columns(3)
 
-                # Extract numeric values for plotting
-                comparison_plot = comparison.copy()
-                comparison_plot['Total Return $'] = comparison['Total Return'].str.replace('$', '').str.replace(',', '').astype(float)
-                comparison_plot['Annualized %'] = comparison['Annualized %'].str.replace('%', '').astype(float)
+            with col1:
+                st.metric(
+                    "🏆 Best Strategy",
+                    best_strategy['Strategy'].split('(')[0].strip(),
+                    delta=best_strategy['Total Return']
+                )
 
-                col1, col2 = st.columns(2)
+            with col2:
+                st.metric(
+                    "📊 Annualized Return",
+                    best_strategy['Annualized %']
+                )
 
-                with col1:
-                    fig1 = px.bar(
-                        comparison_plot,
-                        x='Strategy',
-                        y='Total Return $',
-                        title="Total Return by Strategy",
-                        labels={'Total Return $': 'Total Return ($)'}
-                    )
-                    fig1.update_xaxes(tickangle=-45)
-                    st.plotly_chart(fig1, use_container_width=True)
+            with col3:
+                st.metric(
+                    "✅ Win Rate",
+                    best_strategy['Win Rate']
+                )
 
-                with col2:
-                    fig2 = px.bar(
-                        comparison_plot,
-                        x='Strategy',
-                        y='Annualized %',
-                        title="Annualized Return by Strategy",
-                        labels={'Annualized %': 'Annualized Return (%)'},
-                        color='Annualized %',
-                        color_continuous_scale='RdYlGn'
-                    )
-                    fig2.update_xaxes(tickangle=-45)
-                    st.plotly_chart(fig2, use_container_width=True)
+            # Export option
+            csv = comparison.to_csv(index=False)
+            st.download_button(
+                label="💾 Download Results (CSV)",
+                data=csv,
+                file_name=f"backtest_{selected_symbol}_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
 
-                # Insights
-                st.subheader("💡 Key Insights")
+        except Exception as e:
+            st.error(f"❌ Error running backtest: {str(e)}")
+            import traceback
+            st.code(traceback.format_exc())
 
-                # Best performing strategy
-                best_idx = comparison_plot['Total Return $'].idxmax()
-                best_strategy = comparison.iloc[best_idx]
 
-                col1, col2, col3 = st.columns(3)
+def render_overview_tab():
+    """Overview tab - account summary and portfolio"""
+    st.header("Portfolio Overview")
+    account_overview()
+    st.markdown("---")
+    open_orders_table()
+    st.markdown("---")
+    portfolio_summary()
+    st.markdown("---")
+    alerts_panel()
+    st.markdown("---")
+    positions_table()
 
-                with col1:
-                    st.metric(
-                        "🏆 Best Strategy",
-                        best_strategy['Strategy'].split('(')[0].strip(),
-                        delta=best_strategy['Total Return']
-                    )
 
-                with col2:
-                    st.metric(
-                        "📊 Annualized Return",
-                        best_strategy['Annualized %']
-                    )
+def render_analytics_tab():
+    """Analytics tab - trade performance & database analytics"""
+    st.header("📊 Trade Analytics & Performance")
 
-                with col3:
-                    st.metric(
-                        "✅ Win Rate",
-                        best_strategy['Win Rate']
-                    )
+    # Add the full analytics dashboard from trade_analytics.py
+    add_analytics_to_dashboard()
 
-                # Export option
-                csv = comparison.to_csv(index=False)
-                st.download_button(
-                    label="💾 Download Results (CSV)",
-                    data=csv,
-                    file_name=f"backtest_{selected_symbol}_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
+    st.markdown("---")
 
-        except Exception as e:
-            st.error(f"❌ Error running backtest: {str(e)}")
-            import traceback
-            st.code(traceback.format_exc())
+    # Original performance charts (portfolio-level)
+    st.subheader("📈 Portfolio Performance Charts")
+    performance_charts()
 
 
 def main():
@@ -1121,6 +1288,12 @@ def main():
     # Initialize state
     DashboardState()
 
+    # Custom CSS - must be re-emitted each run or Streamlit drops it from the page
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+    # JIT warm-up (cached - only the first run in the process pays for it)
+    warm_backtester()
+
     # Sidebar
     sidebar_config()
 
@@ -1128,53 +1301,41 @@ def main():
     st.title("📈 Covered Calls Management Dashboard")
 
     # Create tabs for organized navigation
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    # Only the selected tab's body runs (where Streamlit supports it)
+    (tab1, show1), (tab2, show2), (tab3, show3), (tab4, show4), (tab5, show5) = lazy_tabs([
         "📊 Overview",
         "🔍 Strategy Finder",
         "📈 Active Positions",
         "📉 Backtesting",
         "⚙️ Analytics"
-    ])
+    ], key="main_tabs")
 
     with tab1:
         # Overview Tab - Account summary and portfolio
-        st.header("Portfolio Overview")
-        account_overview()
-        st.markdown("---")
-        open_orders_table()
-        st.markdown("---")
-        portfolio_summary()
-        st.markdown("---")
-        alerts_panel()
-        st.markdown("---")
-        positions_table()
+        if show1:
+            render_overview_tab()
 
     with tab2:
         # Strategy Finder Tab
-        strategy_finder()
+        if show2:
+            strategy_finder()
 
     with tab3:
         # Active Positions Tab
-        active_positions_table()
-        st.markdown("---")
-        expiration_calendar()
+        if show3:
+            active_positions_table()
+            st.markdown("---")
+            expiration_calendar()
 
     with tab4:
         # Backtesting Tab
-        backtesting_tab()
+        if show4:
+            backtesting_tab()
 
     with tab5:
         # Analytics Tab - Trade Performance & Database Analytics
-        st.header("📊 Trade Analytics & Performance")
-
-        # Add the full analytics dashboard from trade_analytics.py
-        add_analytics_to_dashboard()
-
-        st.markdown("---")
-
-        # Original performance charts (portfolio-level)
-        st.subheader("📈 Portfolio Performance Charts")
-        performance_charts()
+        if show5:
+            render_analytics_tab()
 
     # Footer
     st.markdown("---")
@@ -14,6 +14,38 @@ from risk_manager import RiskManager, RiskLevel, format_risk_report
 from typing import Dict, List
 import pandas as pd
 
+from _streamlit_compat import fragment
+
+
+# פורמטרים מוכנים מראש לאחוזים ולדולרים
+_PCT1 = "{:.1f}%".format
+_PCT0 = "{:.0f}%".format
+_USD = "${:,.0f}".format
+
+# אימוג'י לפי רמת סיכון
+_RISK_EMOJIS = {
+    RiskLevel.LOW: "🟢",
+    RiskLevel.MEDIUM: "🟡",
+    RiskLevel.HIGH: "🟠",
+    RiskLevel.CRITICAL: "🔴"
+}
+
+# סדר הצגת התראות - החמורה ביותר ראשונה
+_SEVERITY_ORDER = {
+    RiskLevel.CRITICAL: 0,
+    RiskLevel.HIGH: 1,
+    RiskLevel.MEDIUM: 2,
+    RiskLevel.LOW: 3
+}
+
+
+def _bordered_container():
+    """מיכל עם מסגרת (border נתמך מ-Streamlit 1.29)"""
+    try:
+        return st.container(border=True)
+    except TypeError:
+        return st.container()
+
 
 def render_risk_dashboard(risk_analysis: Dict):
     """רנדור לוח בקרת סיכונים מלא"""
@@ -26,6 +58,25 @@ def render_risk_dashboard(risk_analysis: Dict):
     st.markdown("---")
     
     # 4 מדדים מרכזיים
+    _render_metric_cards(risk_analysis)
+    
+    st.markdown("---")
+    
+    # Alerts
+    if risk_analysis['alerts']:
+        _render_alerts_panel(risk_analysis['alerts'])
+        st.markdown("---")
+    
+    # Recommendations
+    _render_recommendations(risk_analysis['recommendations'])
+    
+    # Detailed Analysis - נבנה רק כשהמשתמש מבקש
+    _render_detailed_section(risk_analysis)
+
+
+def _render_metric_cards(risk_analysis: Dict):
+    """שורת 4 הכרטיסים המרכזיים"""
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
@@ -39,59 +90,24 @@ def render_risk_dashboard(risk_analysis: Dict):
     
     with col4:
         _render_assignment_risk_card(risk_analysis['assignment_risk'])
+
+
+@fragment
+def _render_detailed_section(risk_analysis: Dict):
+    """מתג הניתוח המפורט - fragment, כך שהחלפת המתג לא בונה מחדש את הכרטיסים"""
     
-    st.markdown("---")
-    
-    # Alerts
-    if risk_analysis['alerts']:
-        _render_alerts_panel(risk_analysis['alerts'])
-        st.markdown("---")
-    
-    # Recommendations
-    _render_recommendations(risk_analysis['recommendations'])
-    
-    # Detailed Analysis - Expandable
-    with st.expander("📊 ניתוח מפורט", expanded=False):
+    # (גוף של expander סגור עדיין רץ בכל rerun, לכן מתג)
+    if st.toggle("📊 ניתוח מפורט", value=False, key="risk_detailed_analysis"):
         _render_detailed_analysis(risk_analysis)
 
 
 def _render_overall_risk(risk_level: RiskLevel):
     """כרטיס רמת סיכון כללית - גדול ובולט"""
     
-    colors = {
-        RiskLevel.LOW: "#28a745",
-        RiskLevel.MEDIUM: "#ffc107",
-        RiskLevel.HIGH: "#fd7e14",
-        RiskLevel.CRITICAL: "#dc3545"
-    }
-    
-    emojis = {
-        RiskLevel.LOW: "🟢",
-        RiskLevel.MEDIUM: "🟡",
-        RiskLevel.HIGH: "🟠",
-        RiskLevel.CRITICAL: "🔴"
-    }
-    
-    color = colors.get(risk_level, "#6c757d")
-    emoji = emojis.get(risk_level, "⚪")
-    
-    st.markdown(f"""
-    <div style="
-        background: linear-gradient(135deg, {color}22 0%, {color}11 100%);
-        border-right: 5px solid {color};
-        padding: 30px;
-        border-radius: 15px;
-        text-align: center;
-        margin-bottom: 20px;
-    ">
-        <h1 style="margin: 0; color: {color}; font-size: 3em;">
-            {emoji}
-        </h1>
-        <h2 style="margin: 10px 0; color: {color};">
-            רמת סיכון: {risk_level.value}
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
+    emoji = _RISK_EMOJIS.get(risk_level, "⚪")
+    
+    with _bordered_container():
+        st.metric(label="רמת סיכון", value=f"{emoji} {risk_level.value}")
 
 
 def _render_concentration_card(concentration: Dict):
@@ -101,21 +117,10 @@ def _render_concentration_card(concentration: Dict):
     largest = concentration.get('largest_position', 'N/A')
     pct = concentration.get('largest_pct', 0)
     
-    color = "#dc3545" if status == "WARNING" else "#28a745"
-    
-    st.markdown(f"""
-    <div style="
-        background: {color}11;
-        border: 2px solid {color};
-        padding: 20px;
-        border-radius: 10px;
-        text-align: center;
-    ">
-        <h3 style="margin: 0;">🎯 ריכוזיות</h3>
-        <h2 style="color: {color}; margin: 10px 0;">{pct:.1f}%</h2>
-        <p style="margin: 0; font-size: 0.9em;">{largest}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with _bordered_container():
+        st.subheader("🎯 ריכוזיות")
+        st.metric(label=largest, value=_PCT1(pct),
+                  delta=None if status == "OK" else status, delta_color="inverse")
 
 
 def _render_cash_reserve_card(cash_reserve: Dict):
@@ -125,21 +130,10 @@ def _render_cash_reserve_card(cash_reserve: Dict):
     pct = cash_reserve.get('cash_pct', 0)
     required = cash_reserve.get('required_pct', 10)
     
-    color = "#dc3545" if status == "LOW" else "#28a745"
-    
-    st.markdown(f"""
-    <div style="
-        background: {color}11;
-        border: 2px solid {color};
-        padding: 20px;
-        border-radius: 10px;
-        text-align: center;
-    ">
-        <h3 style="margin: 0;">💰 מזומן</h3>
-        <h2 style="color: {color}; margin: 10px 0;">{pct:.1f}%</h2>
-        <p style="margin: 0; font-size: 0.9em;">נדרש: {required:.0f}%</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with _bordered_container():
+        st.subheader("💰 מזומן")
+        st.metric(label="נדרש: " + _PCT0(required), value=_PCT1(pct),
+                  delta=None if status == "OK" else status, delta_color="inverse")
 
 
 def _render_cc_exposure_card(cc_exposure: Dict):
@@ -149,26 +143,10 @@ def _render_cc_exposure_card(cc_exposure: Dict):
     pct = cc_exposure.get('exposure_pct', 0)
     num_positions = cc_exposure.get('num_positions', 0)
     
-    color_map = {
-        'OK': '#28a745',
-        'MEDIUM': '#ffc107',
-        'HIGH': '#dc3545'
-    }
-    color = color_map.get(status, '#6c757d')
-    
-    st.markdown(f"""
-    <div style="
-        background: {color}11;
-        border: 2px solid {color};
-        padding: 20px;
-        border-radius: 10px;
-        text-align: center;
-    ">
-        <h3 style="margin: 0;">📊 חשיפת CC</h3>
-        <h2 style="color: {color}; margin: 10px 0;">{pct:.1f}%</h2>
-        <p style="margin: 0; font-size: 0.9em;">{num_positions} פוזיציות</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with _bordered_container():
+        st.subheader("📊 חשיפת CC")
+        st.metric(label=f"{num_positions} פוזיציות", value=_PCT1(pct),
+                  delta=None if status == "OK" else status, delta_color="inverse")
 
 
 def _render_assignment_risk_card(assignment_risk: Dict):
@@ -176,21 +154,10 @@ def _render_assignment_risk_card(assignment_risk: Dict):
     
     high_risk = assignment_risk.get('high_risk_count', 0)
     
-    color = "#dc3545" if high_risk > 0 else "#28a745"
-    
-    st.markdown(f"""
-    <div style="
-        background: {color}11;
-        border: 2px solid {color};
-        padding: 20px;
-        border-radius: 10px;
-        text-align: center;
-    ">
-        <h3 style="margin: 0;">⚠️ סיכון הקצאה</h3>
-        <h2 style="color: {color}; margin: 10px 0;">{high_risk}</h2>
-        <p style="margin: 0; font-size: 0.9em;">פוזיציות בסיכון</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with _bordered_container():
+        st.subheader("⚠️ סיכון הקצאה")
+        st.metric(label="פוזיציות בסיכון", value=high_risk,
+                  delta="HIGH" if high_risk > 0 else None, delta_color="inverse")
 
 
 def _render_alerts_panel(alerts: List):
@@ -198,23 +165,12 @@ def _render_alerts_panel(alerts: List):
     
     st.markdown("### ⚠️ התראות")
     
-    for alert in alerts:
-        color_map = {
-            RiskLevel.LOW: "info",
-            RiskLevel.MEDIUM: "warning",
-            RiskLevel.HIGH: "error",
-            RiskLevel.CRITICAL: "error"
-        }
-        
-        alert_type = color_map.get(alert.level, "info")
-        
-        with st.container():
-            if alert_type == "error":
-                st.error(f"**{alert.title}**\n\n{alert.message}")
-            elif alert_type == "warning":
-                st.warning(f"**{alert.title}**\n\n{alert.message}")
-            else:
-                st.info(f"**{alert.title}**\n\n{alert.message}")
+    # כל ההתראות ב-markdown אחד, מקובצות לפי חומרה (הגבוהה ראשונה)
+    parts = [
+        f"> {_RISK_EMOJIS.get(alert.level, '⚪')} **{alert.title}**: {alert.message}"
+        for alert in sorted(alerts, key=lambda a: _SEVERITY_ORDER.get(a.level, len(_SEVERITY_ORDER)))
+    ]
+    st.markdown("\n\n".join(parts))
 
 
 def _render_recommendations(recommendations: List[str]):
@@ -230,39 +186,57 @@ def _render_recommendations(recommendations: List[str]):
         st.markdown(f"- {rec}")
 
 
+@st.cache_data(show_spinner=False)
+def _build_breakdown_table(breakdown_items: tuple) -> pd.DataFrame:
+    """טבלת התפלגות פוזיציות - נשמרת במטמון לפי תוכן ה-breakdown"""
+    return pd.DataFrame({
+        'סימול': [symbol for symbol, _ in breakdown_items],
+        'ערך ($)': list(map(_USD, (value for _, value in breakdown_items)))
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _build_pie(breakdown_items: tuple) -> go.Figure:
+    """גרף עוגה של התפלגות התיק - נשמר במטמון לפי תוכן ה-breakdown"""
+    fig = go.Figure(data=[go.Pie(
+        labels=[symbol for symbol, _ in breakdown_items],
+        values=[value for _, value in breakdown_items],
+        hole=0.3
+    )])
+    
+    fig.update_layout(
+        title="התפלגות תיק",
+        height=400,
+        uirevision='positions'
+    )
+    
+    return fig
+
+
 def _render_detailed_analysis(risk_analysis: Dict):
     """ניתוח מפורט"""
     
+    if 'positions_breakdown' not in risk_analysis['concentration']:
+        return
+    
+    breakdown_items = tuple(risk_analysis['concentration']['positions_breakdown'].items())
+    
+    # טביעת אצבע - אם ה-breakdown לא השתנה מאז הרינדור הקודם, משתמשים שוב באותם אובייקטים
+    fingerprint = hash(breakdown_items)
+    if st.session_state.get('_risk_fp') != fingerprint:
+        st.session_state._risk_fp = fingerprint
+        st.session_state._risk_views = (_build_breakdown_table(breakdown_items), _build_pie(breakdown_items))
+    table, fig = st.session_state._risk_views
+    
     # טבלת ריכוזיות
-    if 'positions_breakdown' in risk_analysis['concentration']:
-        st.markdown("#### התפלגות פוזיציות")
-        
-        breakdown = risk_analysis['concentration']['positions_breakdown']
-        df = pd.DataFrame([
-            {'סימול': symbol, 'ערך ($)': f"${value:,.0f}"}
-            for symbol, value in breakdown.items()
-        ])
-        
-        st.dataframe(df, use_container_width=True)
+    st.markdown("#### התפלגות פוזיציות")
+    st.dataframe(table, use_container_width=True)
     
     # גרף ריכוזיות
-    if 'positions_breakdown' in risk_analysis['concentration']:
-        breakdown = risk_analysis['concentration']['positions_breakdown']
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=list(breakdown.keys()),
-            values=list(breakdown.values()),
-            hole=0.3
-        )])
-        
-        fig.update_layout(
-            title="התפלגות תיק",
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True)
 
 
+@fragment
 def render_position_validator(risk_manager: RiskManager,
                              account_value: float,
                              existing_positions: List[Dict]):
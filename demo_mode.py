@@ -1,9 +1,197 @@
 """
 Demo Mode - Mock IBKR data for testing the dashboard without live connection
 """
-from datetime import datetime, timedelta
-from typing import List, Dict
-import random
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Tuple
+import zlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from ibkr_connector import IBKRChainSpec
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _demo_account_summary() -> Dict:
+    """Mock account data (cached across reruns)"""
+    return {
+        'NetLiquidation': 125750.50,
+        'TotalCashValue': 45250.00,
+        'UnrealizedPnL': 3250.75,
+        'RealizedPnL': 1850.25,
+        'BuyingPower': 250000.00,
+        'AvailableFunds': 45250.00
+    }
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _demo_stock_positions() -> List[Dict]:
+    """Mock stock positions (cached across reruns)"""
+    return [
+        {
+            'symbol': 'AAPL',
+            'quantity': 200,
+            'avg_cost': 175.50,
+            'current_price': 182.30
+        },
+        {
+            'symbol': 'MSFT',
+            'quantity': 100,
+            'avg_cost': 385.00,
+            'current_price': 392.15
+        },
+        {
+            'symbol': 'TSLA',
+            'quantity': 300,
+            'avg_cost': 245.75,
+            'current_price': 248.50
+        }
+    ]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _demo_covered_call_positions() -> List[Dict]:
+    """Mock covered call positions (cached across reruns)"""
+    today = datetime.now()
+
+    return [
+        {
+            'symbol': 'AAPL',
+            'stock_qty': 200,
+            'stock_price': 182.30,
+            'option_strike': 185.0,
+            'option_expiry': today + timedelta(days=15),
+            'option_dte': 15,
+            'contracts': -2,  # Short 2 contracts
+            'premium_received': 580.00,
+            'current_option_value': 320.00,
+            'unrealized_pnl': 260.00,
+            'delta': -0.35,
+            'theta': 0.08
+        },
+        {
+            'symbol': 'MSFT',
+            'stock_qty': 100,
+            'stock_price': 392.15,
+            'option_strike': 400.0,
+            'option_expiry': today + timedelta(days=22),
+            'option_dte': 22,
+            'contracts': -1,
+            'premium_received': 450.00,
+            'current_option_value': 280.00,
+            'unrealized_pnl': 170.00,
+            'delta': -0.28,
+            'theta': 0.06
+        },
+        {
+            'symbol': 'TSLA',
+            'stock_qty': 300,
+            'stock_price': 248.50,
+            'option_strike': 255.0,
+            'option_expiry': today + timedelta(days=8),
+            'option_dte': 8,
+            'contracts': -3,
+            'premium_received': 1350.00,
+            'current_option_value': 990.00,
+            'unrealized_pnl': 360.00,
+            'delta': -0.42,
+            'theta': 0.12
+        }
+    ]
+
+
+@lru_cache(maxsize=32)
+def _strike_grid(symbol: str, date_ordinal: int) -> Tuple[tuple, tuple]:
+    """Strikes and expirations for the mock chain - cached per (symbol, day)"""
+    today = date.fromordinal(date_ordinal)
+    current_price = {
+        'AAPL': 182.30,
+        'MSFT': 392.15,
+        'TSLA': 248.50,
+        'NVDA': 875.50
+    }.get(symbol, 150.00)
+
+    # 3 expirations
+    exp_dates = tuple(
+        (today + timedelta(days=days)).strftime('%Y%m%d') for days in (15, 30, 45)
+    )
+
+    # 10 strikes around current price
+    base_strike = round(current_price / 5) * 5
+    strikes = tuple((base_strike + np.arange(-4, 6) * 5).tolist())
+
+    return strikes, exp_dates
+
+
+# Ranges for the random fields of a mock option row: premium noise, volume,
+# open interest, IV, gamma, vega (integer fields use a half-open upper bound)
+_NOISE_LOW = np.array([0.9, 50, 100, 0.20, 0.001, 0.05])[:, None]
+_NOISE_SPAN = np.array([0.2, 451, 1901, 0.25, 0.009, 0.10])[:, None]
+
+
+def _parse_expiration(expiration: str) -> datetime:
+    """Parse 'YYYYMMDD' by slicing - much cheaper than strptime"""
+    return datetime(int(expiration[:4]), int(expiration[4:6]), int(expiration[6:8]))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _demo_call_options(symbol: str, expiration: str, dte: int,
+                       min_strike: float = None, max_strike: float = None) -> List[Dict]:
+    """Mock call options for a specific expiration (cached per symbol/expiration/DTE/strike range)"""
+
+    current_price = {
+        'AAPL': 182.30,
+        'MSFT': 392.15,
+        'TSLA': 248.50,
+        'NVDA': 875.50
+    }.get(symbol, 150.00)
+
+    exp_date = _parse_expiration(expiration)
+
+    # Generate strikes
+    base_strike = round(current_price / 5) * 5
+    if min_strike is None:
+        min_strike = base_strike - 20
+    if max_strike is None:
+        max_strike = base_strike + 30
+
+    # Seeded per (symbol, expiration) so the cached chain is reproducible
+    rng = np.random.default_rng(zlib.crc32(f"{symbol}:{expiration}".encode()))
+
+    strikes = np.arange(int(min_strike), int(max_strike) + 1, 5)
+    n = len(strikes)
+
+    # Simple premium calculation - OTM vs ITM
+    premium = np.where(
+        strikes > current_price,
+        np.maximum(0.50, (strikes - current_price) * 0.15 * (dte / 30)),
+        (current_price - strikes) + max(0.50, 5.0 * (dte / 30))
+    )
+
+    # All random fields in a single draw
+    noise, volume, open_interest, iv, gamma, vega = _NOISE_LOW + _NOISE_SPAN * rng.random((6, n))
+    premium = premium * noise
+
+    # Calculate Greeks (simplified)
+    delta = np.clip(0.5 + (current_price - strikes) / (current_price * 0.1), 0.05, 0.95)
+    theta = -premium / dte if dte > 0 else np.full(n, -0.10)
+
+    return pd.DataFrame({
+        'strike': strikes.tolist(),
+        'expiration': pd.Series([exp_date] * n, dtype=object),
+        'last_price': np.round(premium, 2),
+        'bid': np.round(premium * 0.97, 2),
+        'ask': np.round(premium * 1.03, 2),
+        'volume': volume.astype(np.int64).tolist(),
+        'openInterest': open_interest.astype(np.int64).tolist(),
+        'impliedVolatility': np.round(iv, 4),
+        'delta': np.round(delta, 4),
+        'gamma': np.round(gamma, 4),
+        'theta': np.round(theta, 4),
+        'vega': np.round(vega, 4)
+    }).to_dict('records')
 
 
 class DemoIBKRConnector:
@@ -24,192 +212,57 @@ class DemoIBKRConnector:
 
     def get_account_summary(self) -> Dict:
         """Return mock account data"""
-        return {
-            'NetLiquidation': 125750.50,
-            'TotalCashValue': 45250.00,
-            'UnrealizedPnL': 3250.75,
-            'RealizedPnL': 1850.25,
-            'BuyingPower': 250000.00,
-            'AvailableFunds': 45250.00
-        }
+        return _demo_account_summary()
 
     def get_stock_positions(self) -> List[Dict]:
         """Return mock stock positions"""
-        return [
-            {
-                'symbol': 'AAPL',
-                'quantity': 200,
-                'avg_cost': 175.50,
-                'current_price': 182.30
-            },
-            {
-                'symbol': 'MSFT',
-                'quantity': 100,
-                'avg_cost': 385.00,
-                'current_price': 392.15
-            },
-            {
-                'symbol': 'TSLA',
-                'quantity': 300,
-                'avg_cost': 245.75,
-                'current_price': 248.50
-            }
-        ]
+        return _demo_stock_positions()
 
     def get_covered_call_positions(self) -> List[Dict]:
         """Return mock covered call positions"""
-        today = datetime.now()
-
-        return [
-            {
-                'symbol': 'AAPL',
-                'stock_qty': 200,
-                'stock_price': 182.30,
-                'option_strike': 185.0,
-                'option_expiry': today + timedelta(days=15),
-                'option_dte': 15,
-                'contracts': -2,  # Short 2 contracts
-                'premium_received': 580.00,
-                'current_option_value': 320.00,
-                'unrealized_pnl': 260.00,
-                'delta': -0.35,
-                'theta': 0.08
-            },
-            {
-                'symbol': 'MSFT',
-                'stock_qty': 100,
-                'stock_price': 392.15,
-                'option_strike': 400.0,
-                'option_expiry': today + timedelta(days=22),
-                'option_dte': 22,
-                'contracts': -1,
-                'premium_received': 450.00,
-                'current_option_value': 280.00,
-                'unrealized_pnl': 170.00,
-                'delta': -0.28,
-                'theta': 0.06
-            },
-            {
-                'symbol': 'TSLA',
-                'stock_qty': 300,
-                'stock_price': 248.50,
-                'option_strike': 255.0,
-                'option_expiry': today + timedelta(days=8),
-                'option_dte': 8,
-                'contracts': -3,
-                'premium_received': 1350.00,
-                'current_option_value': 990.00,
-                'unrealized_pnl': 360.00,
-                'delta': -0.42,
-                'theta': 0.12
-            }
-        ]
-
-    def get_option_chain(self, symbol: str, exchange: str = "SMART"):
+        return _demo_covered_call_positions()
+
+    def get_option_chain_spec(self, symbol: str, exchange: str = "SMART") -> IBKRChainSpec:
+        """Return mock option chain spec (same type as IBKRConnector.get_option_chain_spec)"""
+        strikes, exp_dates = _strike_grid(symbol, date.today().toordinal())
+        return IBKRChainSpec(
+            symbol=symbol,
+            expirations=tuple(exp_dates),
+            strikes=tuple(float(strike) for strike in strikes),
+            exchange=exchange
+        )
+
+    def get_option_chain(self, symbol: str, exchange: str = "SMART") -> pd.DataFrame:
         """Return mock option chain"""
-        import pandas as pd
-
-        today = datetime.now()
-        current_price = {
-            'AAPL': 182.30,
-            'MSFT': 392.15,
-            'TSLA': 248.50,
-            'NVDA': 875.50
-        }.get(symbol, 150.00)
-
-        # Generate strikes around current price
-        strikes = []
-        expirations = []
-
-        # 3 expirations
-        exp_dates = [
-            (today + timedelta(days=15)).strftime('%Y%m%d'),
-            (today + timedelta(days=30)).strftime('%Y%m%d'),
-            (today + timedelta(days=45)).strftime('%Y%m%d')
-        ]
-
-        # 10 strikes around current price
-        base_strike = round(current_price / 5) * 5
-        for i in range(-4, 6):
-            strikes.append(base_strike + (i * 5))
-
+        chain = self.get_option_chain_spec(symbol, exchange)
         return pd.DataFrame({
-            'expirations': [exp_dates],
-            'strikes': [strikes]
+            'symbol': chain.symbol,
+            'expirations': [list(chain.expirations)],
+            'strikes': [list(chain.strikes)],
+            'exchange': chain.exchange
         })
 
     def get_call_options(self, symbol: str, expiration: str,
                         min_strike: float = None, max_strike: float = None):
         """Return mock call options for a specific expiration"""
+        return self._get_call_options(symbol, expiration, datetime.now(), min_strike, max_strike)
 
-        current_price = {
-            'AAPL': 182.30,
-            'MSFT': 392.15,
-            'TSLA': 248.50,
-            'NVDA': 875.50
-        }.get(symbol, 150.00)
-
-        # Parse expiration to calculate DTE
-        exp_date = datetime.strptime(expiration, '%Y%m%d')
-        dte = (exp_date - datetime.now()).days
-
-        # Generate strikes
-        base_strike = round(current_price / 5) * 5
-        if min_strike is None:
-            min_strike = base_strike - 20
-        if max_strike is None:
-            max_strike = base_strike + 30
-
-        options = []
-
-        for strike in range(int(min_strike), int(max_strike) + 1, 5):
-            # Calculate mock option price based on moneyness
-            moneyness = (strike - current_price) / current_price
-
-            # Simple premium calculation
-            if strike > current_price:  # OTM
-                premium = max(0.50, (strike - current_price) * 0.15 * (dte / 30))
-            else:  # ITM
-                premium = (current_price - strike) + max(0.50, 5.0 * (dte / 30))
-
-            # Add some randomness
-            premium *= random.uniform(0.9, 1.1)
-
-            # Calculate Greeks (simplified)
-            delta = max(0.05, min(0.95, 0.5 + (current_price - strike) / (current_price * 0.1)))
-            theta = -premium / dte if dte > 0 else -0.10
-
-            options.append({
-                'strike': strike,
-                'expiration': exp_date,
-                'last_price': round(premium, 2),
-                'bid': round(premium * 0.97, 2),
-                'ask': round(premium * 1.03, 2),
-                'volume': random.randint(50, 500),
-                'openInterest': random.randint(100, 2000),
-                'impliedVolatility': round(random.uniform(0.20, 0.45), 4),
-                'delta': round(delta, 4),
-                'gamma': round(random.uniform(0.001, 0.01), 4),
-                'theta': round(theta, 4),
-                'vega': round(random.uniform(0.05, 0.15), 4)
-            })
-
-        return options
+    def _get_call_options(self, symbol: str, expiration: str, now: datetime,
+                          min_strike: float = None, max_strike: float = None) -> List[Dict]:
+        """Call options relative to a caller-supplied 'now'"""
+        dte = (_parse_expiration(expiration) - now).days
+        return _demo_call_options(symbol, expiration, dte, min_strike, max_strike)
 
     def get_otm_calls(self, symbol: str, current_price: float, days_to_expiration: int = 30) -> List[Dict]:
         """Get out-of-the-money call options"""
         # Find closest expiration
-        today = datetime.now()
-        target_date = today + timedelta(days=days_to_expiration)
+        now = datetime.now()
+        target_date = now + timedelta(days=days_to_expiration)
         expiration = target_date.strftime('%Y%m%d')
 
-        # Get all call options for this expiration
-        all_options = self.get_call_options(symbol, expiration)
-
-        # Filter for OTM only (strike > current_price)
-        otm_options = [opt for opt in all_options if opt['strike'] > current_price]
-
-        return otm_options
+        # Generate OTM strikes only - first $5 strike above current_price
+        min_strike = (int(current_price // 5) + 1) * 5
+        return self._get_call_options(symbol, expiration, now, min_strike=min_strike)
 
     def sell_covered_call(self, symbol: str, quantity: int, strike: float,
                          expiration: str, limit_price: float = None):
@@ -6,14 +6,28 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from safety_features import SafetyManager, TradingMode
 from earnings_calendar import EarningsCalendar
 from trade_analytics import TradeDatabase
+from _streamlit_compat import fragment, rerun_app
 import random
 
 st.set_page_config(page_title="🎮 Demo Trading System", layout="wide")
 
+
+# DB reads cached per database file; cleared after each recorded trade
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_open_positions(_db: TradeDatabase, db_path: str) -> pd.DataFrame:
+    return _db.get_open_positions()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_summary(_db: TradeDatabase, db_path: str) -> dict:
+    return _db.get_performance_summary()
+
+
 # Initialize components
 if 'safety' not in st.session_state:
     st.session_state.safety = SafetyManager(mode=TradingMode.DEMO)
@@ -25,17 +39,17 @@ if 'db' not in st.session_state:
     st.session_state.db = TradeDatabase()
 
 if 'demo_positions' not in st.session_state:
-    # Create demo stock positions
-    st.session_state.demo_positions = [
-        {'symbol': 'AAPL', 'quantity': 300, 'currentPrice': 178.50, 'avgCost': 165.00},
-        {'symbol': 'MSFT', 'quantity': 200, 'currentPrice': 420.30, 'avgCost': 395.00},
-        {'symbol': 'NVDA', 'quantity': 100, 'currentPrice': 875.20, 'avgCost': 720.00},
-        {'symbol': 'TSLA', 'quantity': 400, 'currentPrice': 242.80, 'avgCost': 210.00},
-        {'symbol': 'GOOGL', 'quantity': 150, 'currentPrice': 142.50, 'avgCost': 130.00},
-        {'symbol': 'MSTR', 'quantity': 200, 'currentPrice': 385.00, 'avgCost': 280.00},
-        {'symbol': 'AMZN', 'quantity': 250, 'currentPrice': 175.30, 'avgCost': 155.00},
-        {'symbol': 'META', 'quantity': 150, 'currentPrice': 485.20, 'avgCost': 420.00},
-    ]
+    # Create demo stock positions - column arrays (SoA) for vectorized P&L
+    st.session_state.demo_positions = {
+        'symbols': np.array(['AAPL', 'MSFT', 'NVDA', 'TSLA', 'GOOGL', 'MSTR', 'AMZN', 'META']),
+        'quantity': np.array([300, 200, 100, 400, 150, 200, 250, 150], dtype=np.int32),
+        'currentPrice': np.array([178.50, 420.30, 875.20, 242.80, 142.50, 385.00, 175.30, 485.20], dtype=np.float64),
+        'avgCost': np.array([165.00, 395.00, 720.00, 210.00, 130.00, 280.00, 155.00, 420.00], dtype=np.float64),
+    }
+    positions = st.session_state.demo_positions
+    positions['pnl'] = (positions['currentPrice'] - positions['avgCost']) * positions['quantity']
+    # symbol -> row index for O(1) lookup
+    st.session_state.demo_symbol_index = {symbol: i for i, symbol in enumerate(positions['symbols'].tolist())}
 
 if 'trades_today' not in st.session_state:
     st.session_state.trades_today = 0
@@ -67,167 +81,211 @@ with st.sidebar:
     st.metric("Remaining", remaining)
 
 # Main content
-st.markdown("## 🚀 Execute Covered Call")
-
-# Position selector
-col1, col2 = st.columns([2, 3])
-
-with col1:
-    symbols = [p['symbol'] for p in st.session_state.demo_positions]
-    selected_symbol = st.selectbox("📈 Select Position:", symbols)
-
-    # Get selected position
-    position = next((p for p in st.session_state.demo_positions if p['symbol'] == selected_symbol), None)
-
-    if position:
-        st.markdown("#### Position Details")
-        st.write(f"**Shares:** {position['quantity']}")
-        st.write(f"**Current Price:** ${position['currentPrice']:.2f}")
-        st.write(f"**Avg Cost:** ${position['avgCost']:.2f}")
-        pnl = (position['currentPrice'] - position['avgCost']) * position['quantity']
-        st.write(f"**P&L:** ${pnl:,.2f}")
-
-with col2:
-    if position:
-        st.markdown("#### Trade Configuration")
-
-        current_price = position['currentPrice']
-        contracts_available = position['quantity'] // 100
-
-        if contracts_available == 0:
-            st.error(f"❌ Need at least 100 shares. You have: {position['quantity']}")
-        else:
-            # Trade inputs
-            col_a, col_b, col_c = st.columns(3)
-
-            with col_a:
-                contracts = st.number_input(
-                    "Contracts",
-                    min_value=1,
-                    max_value=contracts_available,
-                    value=min(2, contracts_available)
-                )
-
-            with col_b:
-                # Strike selection
-                otm_pct = st.slider("OTM %", 1, 10, 3)
-                strike = current_price * (1 + otm_pct/100)
-                st.metric("Strike", f"${strike:.2f}")
-
-            with col_c:
-                dte = st.slider("DTE", 21, 45, 30)
-                expiration = (datetime.now() + timedelta(days=dte)).strftime('%Y%m%d')
-                st.metric("Expiration", expiration)
-
-            # Estimate Greeks and premium
-            moneyness = (strike - current_price) / current_price
-            estimated_delta = max(0.1, 0.5 - moneyness * 2)
-            estimated_premium = current_price * 0.02 * (dte/30) * (1 - moneyness * 5)
-
-            st.markdown("---")
-            st.markdown("#### 📊 Estimated Metrics")
-
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                st.metric("Premium/Contract", f"${estimated_premium * 100:.2f}")
-            with col2:
-                st.metric("Delta", f"{estimated_delta:.3f}")
-            with col3:
-                total_premium = estimated_premium * 100 * contracts
-                st.metric("Total Premium", f"${total_premium:.2f}")
-            with col4:
-                capital_at_risk = current_price * 100 * contracts
-                annual_return = (total_premium / capital_at_risk) * (365/dte) * 100
-                st.metric("Annual Return", f"{annual_return:.1f}%")
-
-            st.markdown("---")
-
-            # Execute button
-            execute_clicked = st.button("🚀 EXECUTE DEMO TRADE", type="primary", use_container_width=True)
-
-            if execute_clicked:
-
-                # Build trade request
-                trade_request = {
-                    'symbol': selected_symbol,
-                    'contracts': contracts,
-                    'delta': estimated_delta,
-                    'dte': dte,
-                    'premium': estimated_premium,
-                    'strike': strike
-                }
-
-                # Step 1: Safety validation
-                st.info("🔍 Running safety checks...")
-                approved, safety_messages = st.session_state.safety.pre_trade_validation(trade_request)
-
-                for msg in safety_messages:
-                    st.write(msg)
-
-                if not approved:
-                    st.error("❌ Trade rejected by safety system")
-                else:
-                    # Step 2: Check earnings
-                    st.info("📅 Checking earnings calendar...")
-                    earnings_check = st.session_state.calendar.check_before_trade(selected_symbol, dte)
-
-                    if not earnings_check['safe']:
-                        st.warning(f"⚠️ {earnings_check['reason']}")
-                        st.write(earnings_check['recommendation'])
-
-                    # Step 3: Execute
-                    st.success("✅ All safety checks passed!")
-
-                    # Generate demo trade ID
-                    trade_id = f"DEMO_{selected_symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-                    # Save to database
-                    st.session_state.db.record_trade({
+# Fragment: slider/input changes rerun only the trade form, not the history below
+@fragment
+def execute_covered_call():
+    st.markdown("## 🚀 Execute Covered Call")
+
+    # Result of the last executed trade - kept across the full-app rerun that follows it
+    last_trade = st.session_state.get('last_demo_trade')
+    if last_trade is not None:
+        # Checks that ran before the rerun - earnings warnings must stay visible
+        for msg in last_trade['safety_messages']:
+            st.write(msg)
+        if last_trade['earnings_warning'] is not None:
+            st.warning(f"⚠️ {last_trade['earnings_warning']['reason']}")
+            st.write(last_trade['earnings_warning']['recommendation'])
+        st.success("✅ All safety checks passed!")
+
+        st.success(f"✅ Demo trade executed! ID: {last_trade['trade_id']}")
+        st.info(f"💾 Trade saved to database")
+        if last_trade.pop('celebrate', False):
+            st.balloons()
+
+        # Show trade summary
+        with st.expander("📋 Trade Summary", expanded=True):
+            st.write(f"""
+            **Trade Details:**
+            - Symbol: {last_trade['symbol']}
+            - Contracts: {last_trade['contracts']}
+            - Strike: ${last_trade['strike']:.2f} ({last_trade['otm_pct']}% OTM)
+            - Expiration: {last_trade['expiration']} ({last_trade['dte']} days)
+            - Premium: ${last_trade['premium']:.2f}
+            - Delta: {last_trade['delta']:.3f}
+            - Annual Return: {last_trade['annual_return']:.1f}%
+            """)
+
+        # Clears the summary before the rerun the click triggers
+        st.button("✅ Done - Back to Trading", type="secondary", use_container_width=True,
+                  on_click=st.session_state.pop, args=('last_demo_trade', None))
+
+    # Position selector
+    col1, col2 = st.columns([2, 3])
+
+    with col1:
+        positions = st.session_state.demo_positions
+        selected_symbol = st.selectbox("📈 Select Position:", list(st.session_state.demo_symbol_index))
+
+        # Get selected position (row index into the column arrays)
+        row = st.session_state.demo_symbol_index.get(selected_symbol)
+
+        if row is not None:
+            quantity = int(positions['quantity'][row])
+            current_price = float(positions['currentPrice'][row])
+
+            st.markdown("#### Position Details")
+            st.write(f"**Shares:** {quantity}")
+            st.write(f"**Current Price:** ${current_price:.2f}")
+            st.write(f"**Avg Cost:** ${positions['avgCost'][row]:.2f}")
+            st.write(f"**P&L:** ${positions['pnl'][row]:,.2f}")
+
+    with col2:
+        if row is not None:
+            st.markdown("#### Trade Configuration")
+
+            contracts_available = quantity // 100
+
+            if contracts_available == 0:
+                st.error(f"❌ Need at least 100 shares. You have: {quantity}")
+            else:
+                # Trade inputs
+                col_a, col_b, col_c = st.columns(3)
+
+                with col_a:
+                    contracts = st.number_input(
+                        "Contracts",
+                        min_value=1,
+                        max_value=contracts_available,
+                        value=min(2, contracts_available)
+                    )
+
+                with col_b:
+                    # Strike selection
+                    otm_pct = st.slider("OTM %", 1, 10, 3)
+                    strike = current_price * (1 + otm_pct/100)
+                    st.metric("Strike", f"${strike:.2f}")
+
+                with col_c:
+                    dte = st.slider("DTE", 21, 45, 30)
+                    expiration = (datetime.now() + timedelta(days=dte)).strftime('%Y%m%d')
+                    st.metric("Expiration", expiration)
+
+                # Estimate Greeks and premium
+                moneyness = (strike - current_price) / current_price
+                estimated_delta = max(0.1, 0.5 - moneyness * 2)
+                estimated_premium = current_price * 0.02 * (dte/30) * (1 - moneyness * 5)
+
+                st.markdown("---")
+                st.markdown("#### 📊 Estimated Metrics")
+
+                col1, col2, col3, col4 = st.columns(4)
+
+                with col1:
+                    st.metric("Premium/Contract", f"${estimated_premium * 100:.2f}")
+                with col2:
+                    st.metric("Delta", f"{estimated_delta:.3f}")
+                with col3:
+                    total_premium = estimated_premium * 100 * contracts
+                    st.metric("Total Premium", f"${total_premium:.2f}")
+                with col4:
+                    capital_at_risk = current_price * 100 * contracts
+                    annual_return = (total_premium / capital_at_risk) * (365/dte) * 100
+                    st.metric("Annual Return", f"{annual_return:.1f}%")
+
+                st.markdown("---")
+
+                # Execute button
+                execute_clicked = st.button("🚀 EXECUTE DEMO TRADE", type="primary", use_container_width=True)
+
+                if execute_clicked:
+
+                    # Build trade request
+                    trade_request = {
                         'symbol': selected_symbol,
-                        'strike': strike,
-                        'expiration': expiration,
                         'contracts': contracts,
-                        'quantity': contracts * 100,  # Required field - shares covered
-                        'premium': total_premium,
                         'delta': estimated_delta,
                         'dte': dte,
-                        'entry_price': current_price,
-                        'strategy': 'covered_call',
-                        'action': 'SELL',  # Required field
-                        'mode': 'DEMO'
-                    })
-
-                    # Update counters
-                    st.session_state.trades_today += 1
-                    st.session_state.safety.todays_trades += 1
-
-                    st.success(f"✅ Demo trade executed! ID: {trade_id}")
-                    st.info(f"💾 Trade saved to database")
-                    st.balloons()
-
-                    # Show trade summary
-                    with st.expander("📋 Trade Summary", expanded=True):
-                        st.write(f"""
-                        **Trade Details:**
-                        - Symbol: {selected_symbol}
-                        - Contracts: {contracts}
-                        - Strike: ${strike:.2f} ({otm_pct}% OTM)
-                        - Expiration: {expiration} ({dte} days)
-                        - Premium: ${total_premium:.2f}
-                        - Delta: {estimated_delta:.3f}
-                        - Annual Return: {annual_return:.1f}%
-                        """)
-
-                    # Add refresh button to go back
-                    if st.button("✅ Done - Back to Trading", type="secondary", use_container_width=True):
-                        st.rerun()
+                        'premium': estimated_premium,
+                        'strike': strike
+                    }
+
+                    # Step 1: Safety validation
+                    st.info("🔍 Running safety checks...")
+                    approved, safety_messages = st.session_state.safety.pre_trade_validation(trade_request)
+
+                    for msg in safety_messages:
+                        st.write(msg)
+
+                    if not approved:
+                        st.error("❌ Trade rejected by safety system")
+                    else:
+                        # Step 2: Check earnings
+                        st.info("📅 Checking earnings calendar...")
+                        earnings_check = st.session_state.calendar.check_before_trade(selected_symbol, dte)
+
+                        if not earnings_check['safe']:
+                            st.warning(f"⚠️ {earnings_check['reason']}")
+                            st.write(earnings_check['recommendation'])
+
+                        # Step 3: Execute
+                        st.success("✅ All safety checks passed!")
+
+                        # Generate demo trade ID
+                        trade_id = f"DEMO_{selected_symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+                        # Save to database
+                        st.session_state.db.record_trade({
+                            'symbol': selected_symbol,
+                            'strike': strike,
+                            'expiration': expiration,
+                            'contracts': contracts,
+                            'quantity': contracts * 100,  # Required field - shares covered
+                            'premium': total_premium,
+                            'delta': estimated_delta,
+                            'dte': dte,
+                            'entry_price': current_price,
+                            'strategy': 'covered_call',
+                            'action': 'SELL',  # Required field
+                            'mode': 'DEMO'
+                        })
+                        _cached_open_positions.clear()
+                        _cached_summary.clear()
+
+                        # Update counters
+                        st.session_state.trades_today += 1
+                        st.session_state.safety.todays_trades += 1
+
+                        st.session_state.last_demo_trade = {
+                            'trade_id': trade_id,
+                            'symbol': selected_symbol,
+                            'contracts': contracts,
+                            'strike': strike,
+                            'otm_pct': otm_pct,
+                            'expiration': expiration,
+                            'dte': dte,
+                            'premium': total_premium,
+                            'delta': estimated_delta,
+                            'annual_return': annual_return,
+                            'safety_messages': list(safety_messages),
+                            'earnings_warning': None if earnings_check['safe'] else {
+                                'reason': earnings_check['reason'],
+                                'recommendation': earnings_check['recommendation']
+                            },
+                            'celebrate': True
+                        }
+
+                        # Full-app rerun - Trade History, Performance Summary and the
+                        # sidebar counters live outside this fragment
+                        rerun_app()
+
+
+execute_covered_call()
 
 # Show recent trades from database
 st.markdown("---")
 st.markdown("## 📊 Trade History")
 
-recent_trades = st.session_state.db.get_open_positions()
+recent_trades = _cached_open_positions(st.session_state.db, str(st.session_state.db.db_path))
 if recent_trades is not None and len(recent_trades) > 0:
     df = pd.DataFrame(recent_trades)
     st.dataframe(df, use_container_width=True)
@@ -238,7 +296,7 @@ else:
 st.markdown("---")
 st.markdown("## 📈 Performance Summary")
 
-summary = st.session_state.db.get_performance_summary()
+summary = _cached_summary(st.session_state.db, str(st.session_state.db.db_path))
 if summary:
     col1, col2, col3, col4 = st.columns(4)
 
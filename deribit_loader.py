@@ -4,21 +4,85 @@ Handles connection, data retrieval for BTC/ETH options from Deribit
 """
 
 import asyncio
+import functools
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 import logging
+from scipy.stats import norm
 from deribit_wrapper import DeribitClient
 
+# Optional Arrow backing for option chain tables
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from _greeks_numba import NUMBA_AVAILABLE, bs_call_greeks as _bs_call_greeks_jit
 from covered_calls_system import (
     Stock, OptionContract, OptionType, CoveredCall,
-    PositionStatus, GreeksCalculator
+    PositionStatus
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CRYPTO_CURRENCIES = ('BTC', 'ETH')
+
+RISK_FREE_RATE = 0.05
+
+# Deribit option instrument name: <CURRENCY>-<DMMMYY>-<STRIKE>-<C|P>
+_INSTRUMENT_RE = re.compile(r'^([A-Z]+)-(\d{1,2}[A-Z]{3}\d{2})-(\d+(?:\.\d+)?)-([CP])$')
+
+# Cache lifetimes (seconds) - index moves fast, the instrument list rarely changes
+INDEX_PRICE_TTL = 2.0
+INSTRUMENTS_TTL = 30.0
+ORDER_BOOK_TTL = 1.0
+
+# JSON-RPC over HTTP endpoints (used for batch requests)
+DERIBIT_API_URLS = {
+    'test': 'https://test.deribit.com/api/v2',
+    'prod': 'https://www.deribit.com/api/v2'
+}
+
+
+_US_PER_DAY = 86_400 * 1_000_000
+
+
+def _days_until(expiration: np.ndarray, now: datetime) -> np.ndarray:
+    """Whole days from now to each datetime64[us] expiration (floored, like timedelta.days)"""
+    # Plain int64 epoch-microsecond arithmetic on the raw buffer
+    return (expiration.view(np.int64) - np.datetime64(now, 'us').astype(np.int64)) // _US_PER_DAY
+
+
+def _bs_call_greeks(spot: float, strikes: np.ndarray, tte: np.ndarray,
+                    ivs: np.ndarray, r: float) -> Tuple[np.ndarray, ...]:
+    """
+    Black-Scholes call Greeks for a whole chain (same formulas as GreeksCalculator)
+
+    Returns (delta, gamma, theta per day, vega per 1% IV) arrays.
+    """
+    sqrt_t = np.sqrt(tte)
+    sig_sqrt_t = ivs * sqrt_t
+    d1 = (np.log(spot / strikes) + (r + 0.5 * ivs ** 2) * tte) / sig_sqrt_t
+    d2 = d1 - sig_sqrt_t
+    pdf_d1 = norm.pdf(d1)
+
+    delta = norm.cdf(d1)
+    gamma = pdf_d1 / (spot * sig_sqrt_t)
+    theta = (-(spot * pdf_d1 * ivs) / (2 * sqrt_t) - r * strikes * np.exp(-r * tte) * norm.cdf(d2)) / 365
+    vega = spot * pdf_d1 * sqrt_t / 100
+
+    return delta, gamma, theta, vega
+
 
 @dataclass
 class DeribitConfig:
@@ -27,6 +91,135 @@ class DeribitConfig:
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
     simulated: bool = True  # True for simulated trading
+    max_concurrency: int = 10  # Max in-flight per-instrument requests (Deribit rate limits)
+
+
+@dataclass
+class OptionChain:
+    """
+    Columnar (structure-of-arrays) option chain
+
+    One numpy array per field instead of one OptionContract object per
+    option - compact, and lets Greeks/filters/DataFrames work on whole columns.
+    """
+    symbol: str
+    contract_id: np.ndarray     # object (instrument names)
+    strike: np.ndarray          # float64
+    expiration: np.ndarray      # datetime64[us]
+    is_call: np.ndarray         # bool
+    bid: np.ndarray             # float64
+    ask: np.ndarray             # float64
+    last: np.ndarray            # float64
+    iv: np.ndarray              # float64, decimal (0.55 = 55%)
+    volume: np.ndarray          # float64
+    open_interest: np.ndarray   # float64
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    @classmethod
+    def empty(cls, symbol: str) -> 'OptionChain':
+        """Chain with no options"""
+        return cls.from_instruments(symbol, [])
+
+    @classmethod
+    def from_instruments(cls, symbol: str, instruments: List[Dict],
+                         now: Optional[datetime] = None,
+                         min_dte: Optional[int] = None,
+                         max_dte: Optional[int] = None) -> 'OptionChain':
+        """
+        Build a chain from Deribit get_instruments() records
+
+        Names that are not option instruments (e.g. perpetuals) are skipped.
+        If min_dte/max_dte are given, options outside the window are dropped.
+        """
+        # Parse instrument names: BTC-31MAY24-50000-C
+        records = []
+        groups = []
+        for inst in instruments:
+            match = _INSTRUMENT_RE.match(inst.get('instrument_name', ''))
+            if match:
+                records.append(inst)
+                groups.append(match.groups())
+
+        n = len(records)
+        # Parse all expiration dates in one vectorized call
+        expiration = pd.to_datetime(
+            [g[1] for g in groups], format='%d%b%y'
+        ).to_numpy().astype('datetime64[us]')
+
+        if n and (min_dte is not None or max_dte is not None):
+            dte = _days_until(expiration, now or datetime.utcnow())
+            keep = np.ones(n, dtype=bool)
+            if min_dte is not None:
+                keep &= dte >= min_dte
+            if max_dte is not None:
+                keep &= dte <= max_dte
+            idx = np.flatnonzero(keep)
+            records = [records[i] for i in idx]
+            groups = [groups[i] for i in idx]
+            expiration = expiration[idx]
+
+        def column(key: str) -> np.ndarray:
+            # Deribit sends null for missing quotes - treat as 0
+            return np.fromiter((inst.get(key) or 0 for inst in records), dtype=np.float64, count=len(records))
+
+        return cls(
+            symbol=symbol,
+            contract_id=np.array([inst['instrument_name'] for inst in records], dtype=object),
+            strike=np.array([g[2] for g in groups], dtype=np.float64),
+            expiration=expiration,
+            is_call=np.array([g[3] == 'C' for g in groups], dtype=bool),
+            bid=column('bid_price'),
+            ask=column('ask_price'),
+            last=column('last_price'),
+            iv=column('mark_iv') / 100,  # Convert from % to decimal
+            volume=column('volume'),
+            open_interest=column('open_interest')
+        )
+
+    def take(self, idx) -> 'OptionChain':
+        """Sub-chain selected by a boolean mask or index array"""
+        return OptionChain(
+            symbol=self.symbol,
+            **{f: getattr(self, f)[idx] for f in _CHAIN_COLUMNS}
+        )
+
+    def days_to_expiration(self, now: Optional[datetime] = None) -> np.ndarray:
+        """Whole days to expiration for every option (floored, like timedelta.days)"""
+        return _days_until(self.expiration, now or datetime.now())
+
+    def iter_contracts(self) -> Iterator[OptionContract]:
+        """Lazily build OptionContract objects, one at a time"""
+        for i, exp_date in enumerate(self.expiration.tolist()):
+            try:
+                # Greeks aren't part of the instrument list - see calculate_covered_call_premium
+                yield OptionContract(
+                    symbol=self.symbol,
+                    strike=float(self.strike[i]),
+                    expiration=exp_date,
+                    option_type=OptionType.CALL if self.is_call[i] else OptionType.PUT,
+                    premium=float(self.last[i]),
+                    implied_volatility=float(self.iv[i]),
+                    delta=0.0,
+                    gamma=0.0,
+                    theta=0.0,
+                    vega=0.0,
+                    volume=int(self.volume[i]),
+                    open_interest=int(self.open_interest[i]),
+                    bid=float(self.bid[i]),
+                    ask=float(self.ask[i])
+                )
+            except Exception as e:
+                logger.debug(f"Could not build contract {self.contract_id[i]}: {e}")
+
+    def to_contracts(self) -> List[OptionContract]:
+        """Legacy list-of-OptionContract view"""
+        return list(self.iter_contracts())
+
+
+_CHAIN_COLUMNS = ('contract_id', 'strike', 'expiration', 'is_call', 'bid', 'ask',
+                  'last', 'iv', 'volume', 'open_interest')
 
 
 class DeribitConnector:
@@ -37,18 +230,63 @@ class DeribitConnector:
         self.client = None
         self.connected = False
         self._positions_cache = {}
-        self._options_cache = {}
+        self._options_cache = {}      # currency -> (timestamp, instruments)
+        self._index_cache = {}        # currency -> (timestamp, index price)
+        self._order_book_cache = {}   # (instrument, depth) -> (timestamp, book)
+        self._pool = None
+        self._fanout_pool = None
+        self._start_pools()
+        # One pooled keep-alive HTTP session for the connector's lifetime (JSON-RPC batch requests)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    @staticmethod
+    def _cache_get(cache: Dict, key, ttl: float):
+        """Return a cached value if it is younger than ttl seconds, else None"""
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    @staticmethod
+    def _cache_put(cache: Dict, key, value):
+        cache[key] = (time.monotonic(), value)
+        return value
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """
+        Run a blocking call on the worker pool without stalling the event loop
+
+        func may fan out on _fanout_pool (never on _pool), so a full _pool of
+        waiting calls can't starve the requests they are waiting for.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
+
+    def _start_pools(self):
+        """Create the worker pools (again after a disconnect)"""
+        workers = max(4, self.config.max_concurrency)
+        # Worker pool for the async wrappers' blocking calls (which may fan out below)
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        # Fan-out pool for single REST requests only - its tasks never submit work to
+        # a pool themselves, so a fan-out can't wait on a worker it is occupying
+        self._fanout_pool = ThreadPoolExecutor(max_workers=workers)
 
     def connect(self) -> bool:
         """Connect to Deribit API"""
         try:
-            # Initialize Deribit client
-            self.client = DeribitClient(
-                env=self.config.env,
-                client_id=self.config.client_id,
-                client_secret=self.config.client_secret,
-                simulated=self.config.simulated
-            )
+            # Initialize Deribit client once - reconnecting keeps its open connections
+            if self.client is None:
+                self.client = DeribitClient(
+                    env=self.config.env,
+                    client_id=self.config.client_id,
+                    client_secret=self.config.client_secret,
+                    simulated=self.config.simulated
+                )
+            if self._pool is None:
+                self._start_pools()
 
             # Test connection by getting BTC index
             try:
@@ -68,8 +306,57 @@ class DeribitConnector:
         """Disconnect from Deribit"""
         self.connected = False
         self.client = None
+        # Stop the worker threads - queued requests are dropped, in-flight ones finish
+        for pool in (self._pool, self._fanout_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._fanout_pool = None
         logger.info("Disconnected from Deribit")
 
+    def _fetch_currency_positions(self, currency: str) -> Optional[Dict]:
+        """Fetch the active position for one currency (runs on the worker pool)"""
+        position = None
+
+        try:
+            pos_data = self.client.get_positions(currency=currency)
+
+            for pos in pos_data:
+                if pos['size'] != 0:  # Only active positions
+                    # Calculate current price from mark price
+                    mark_price = pos.get('mark_price', 0)
+
+                    position = {
+                        'quantity': abs(pos['size']),  # Convert to positive
+                        'avg_cost': pos.get('average_price', 0),
+                        'current_price': mark_price,
+                        'pnl': pos.get('total_profit_loss', 0),
+                        'direction': 'long' if pos['size'] > 0 else 'short'
+                    }
+
+                    logger.info(f"📊 {currency}: {pos['size']} @ ${mark_price:,.2f}")
+
+        except Exception as e:
+            logger.warning(f"Could not get {currency} positions: {e}")
+
+        return position
+
+    async def get_crypto_positions_async(self) -> Dict[str, Dict]:
+        """
+        Get current crypto positions (BTC, ETH) without blocking the event loop
+
+        Both currency requests run concurrently on the connector's thread pool.
+        """
+        if not self.connected or not self.client:
+            logger.error("Not connected to Deribit")
+            return {}
+
+        results = await asyncio.gather(*(
+            self._run_blocking(self._fetch_currency_positions, currency)
+            for currency in CRYPTO_CURRENCIES
+        ))
+
+        return {currency: pos for currency, pos in zip(CRYPTO_CURRENCIES, results) if pos}
+
     def get_crypto_positions(self) -> Dict[str, Dict]:
         """
         Get current crypto positions (BTC, ETH)
@@ -82,38 +369,22 @@ class DeribitConnector:
         positions = {}
 
         try:
-            # Get BTC and ETH positions
-            for currency in ['BTC', 'ETH']:
-                try:
-                    pos_data = self.client.get_positions(currency=currency)
-
-                    for pos in pos_data:
-                        if pos['size'] != 0:  # Only active positions
-                            # Calculate current price from mark price
-                            mark_price = pos.get('mark_price', 0)
-
-                            positions[currency] = {
-                                'quantity': abs(pos['size']),  # Convert to positive
-                                'avg_cost': pos.get('average_price', 0),
-                                'current_price': mark_price,
-                                'pnl': pos.get('total_profit_loss', 0),
-                                'direction': 'long' if pos['size'] > 0 else 'short'
-                            }
+            # Get BTC and ETH positions concurrently
+            results = self._fanout_pool.map(self._fetch_currency_positions, CRYPTO_CURRENCIES)
 
-                            logger.info(f"📊 {currency}: {pos['size']} @ ${mark_price:,.2f}")
-
-                except Exception as e:
-                    logger.warning(f"Could not get {currency} positions: {e}")
+            for currency, pos in zip(CRYPTO_CURRENCIES, results):
+                if pos:
+                    positions[currency] = pos
 
         except Exception as e:
             logger.error(f"Error fetching crypto positions: {e}")
 
         return positions
 
-    def get_available_options(self, currency: str = 'BTC',
-                            min_dte: int = 7, max_dte: int = 90) -> List[OptionContract]:
+    def get_option_chain_columns(self, currency: str = 'BTC',
+                                 min_dte: int = 7, max_dte: int = 90) -> OptionChain:
         """
-        Get available options for a cryptocurrency
+        Get available options for a cryptocurrency as a columnar OptionChain
 
         Args:
             currency: 'BTC' or 'ETH'
@@ -122,62 +393,72 @@ class DeribitConnector:
         """
         if not self.connected or not self.client:
             logger.error("Not connected to Deribit")
-            return []
-
-        options = []
+            return OptionChain.empty(currency)
 
         try:
             # Get all instruments for currency
-            instruments = self.client.get_instruments(currency=currency, kind='option')
-
-            current_time = datetime.utcnow()
-
-            for inst in instruments:
-                try:
-                    # Parse instrument name: BTC-31MAY24-50000-C
-                    parts = inst['instrument_name'].split('-')
-                    if len(parts) != 4:
-                        continue
-
-                    exp_str = parts[1]  # e.g., "31MAY24"
-                    strike = float(parts[2])
-                    opt_type = parts[3]  # 'C' or 'P'
-
-                    # Parse expiration date
-                    exp_date = datetime.strptime(exp_str, '%d%b%y')
-                    dte = (exp_date - current_time).days
-
-                    # Filter by DTE
-                    if dte < min_dte or dte > max_dte:
-                        continue
-
-                    # Create OptionContract
-                    option = OptionContract(
-                        symbol=currency,
-                        strike=strike,
-                        expiration=exp_date,
-                        option_type=OptionType.CALL if opt_type == 'C' else OptionType.PUT,
-                        contract_id=inst['instrument_name'],
-                        bid=inst.get('bid_price', 0),
-                        ask=inst.get('ask_price', 0),
-                        last=inst.get('last_price', 0),
-                        volume=inst.get('volume', 0),
-                        open_interest=inst.get('open_interest', 0),
-                        implied_volatility=inst.get('mark_iv', 0) / 100  # Convert from % to decimal
-                    )
-
-                    options.append(option)
+            instruments = self._cache_get(self._options_cache, currency, INSTRUMENTS_TTL)
+            if instruments is None:
+                instruments = self._cache_put(
+                    self._options_cache, currency,
+                    self.client.get_instruments(currency=currency, kind='option')
+                )
 
-                except Exception as e:
-                    logger.debug(f"Could not parse instrument {inst.get('instrument_name')}: {e}")
-                    continue
+            chain = OptionChain.from_instruments(
+                currency, instruments, now=datetime.utcnow(), min_dte=min_dte, max_dte=max_dte
+            )
 
-            logger.info(f"📋 Found {len(options)} {currency} options ({min_dte}-{max_dte} DTE)")
+            logger.info(f"📋 Found {len(chain)} {currency} options ({min_dte}-{max_dte} DTE)")
+            return chain
 
         except Exception as e:
             logger.error(f"Error fetching {currency} options: {e}")
+            return OptionChain.empty(currency)
+
+    def _iter_available_options(self, currency: str = 'BTC',
+                                min_dte: int = 7, max_dte: int = 90) -> Iterator[OptionContract]:
+        """Available options as OptionContract objects, built lazily from the columnar chain"""
+        yield from self.get_option_chain_columns(currency, min_dte, max_dte).iter_contracts()
+
+    def get_available_options(self, currency: str = 'BTC',
+                            min_dte: int = 7, max_dte: int = 90) -> List[OptionContract]:
+        """
+        Get available options for a cryptocurrency
+
+        Args:
+            currency: 'BTC' or 'ETH'
+            min_dte: Minimum days to expiration
+            max_dte: Maximum days to expiration
+        """
+        return list(self._iter_available_options(currency, min_dte, max_dte))
 
-        return options
+    def _select_chain(self, currency: str, expiration: Optional[datetime]) -> OptionChain:
+        """Chain for currency, optionally restricted to a single expiration date"""
+        chain = self.get_option_chain_columns(currency)
+
+        if expiration:
+            chain = chain.take(chain.expiration.astype('datetime64[D]') == np.datetime64(expiration.date(), 'D'))
+
+        return chain
+
+    @staticmethod
+    def _chain_table_columns(chain: OptionChain) -> Dict[str, np.ndarray]:
+        """Option chain table columns, straight from the chain's arrays (sorted by expiration, strike)"""
+        # Stable sort of the column arrays up front - no DataFrame sort_values copy afterwards
+        chain = chain.take(np.lexsort((chain.strike, chain.expiration)))
+        return {
+            'Strike': chain.strike,
+            'Type': np.where(chain.is_call, 'Call', 'Put').astype(object),
+            'Expiration': chain.expiration,
+            'DTE': chain.days_to_expiration(datetime.now()),
+            'Bid': chain.bid,
+            'Ask': chain.ask,
+            'Last': chain.last,
+            'IV': chain.iv,
+            'Volume': chain.volume,
+            'OI': chain.open_interest,
+            'Contract': chain.contract_id
+        }
 
     def get_option_chain(self, currency: str = 'BTC',
                         expiration: Optional[datetime] = None) -> pd.DataFrame:
@@ -188,50 +469,60 @@ class DeribitConnector:
             currency: 'BTC' or 'ETH'
             expiration: Specific expiration date (None for all)
         """
-        options = self.get_available_options(currency)
+        chain = self._select_chain(currency, expiration)
 
-        if expiration:
-            options = [opt for opt in options if opt.expiration.date() == expiration.date()]
-
-        if not options:
+        if not len(chain):
             return pd.DataFrame()
 
-        # Convert to DataFrame
-        data = []
-        for opt in options:
-            data.append({
-                'Strike': opt.strike,
-                'Type': 'Call' if opt.option_type == OptionType.CALL else 'Put',
-                'Expiration': opt.expiration,
-                'DTE': (opt.expiration - datetime.now()).days,
-                'Bid': opt.bid,
-                'Ask': opt.ask,
-                'Last': opt.last,
-                'IV': opt.implied_volatility,
-                'Volume': opt.volume,
-                'OI': opt.open_interest,
-                'Contract': opt.contract_id
-            })
-
-        df = pd.DataFrame(data)
-        df = df.sort_values(['Expiration', 'Strike'])
+        columns = self._chain_table_columns(chain)
+        if PYARROW_AVAILABLE:
+            # Build in Arrow, hand the buffers to pandas without an extra consolidation copy
+            df = pa.table(columns).to_pandas(split_blocks=True, self_destruct=True)
+        else:
+            df = pd.DataFrame(columns, copy=False)
 
         return df
 
+    def get_option_chain_arrow(self, currency: str = 'BTC',
+                               expiration: Optional[datetime] = None) -> 'pa.Table':
+        """
+        Get option chain as a pyarrow Table (same columns and order as get_option_chain)
+
+        For consumers that read Arrow directly (IPC, Polars) - requires pyarrow.
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for get_option_chain_arrow")
+
+        chain = self._select_chain(currency, expiration)
+        return pa.table(self._chain_table_columns(chain))
+
     def get_index_price(self, currency: str = 'BTC') -> float:
         """Get current index price for BTC or ETH"""
         if not self.connected or not self.client:
             logger.error("Not connected to Deribit")
             return 0.0
 
+        cached = self._cache_get(self._index_cache, currency, INDEX_PRICE_TTL)
+        if cached is not None:
+            return cached
+
         try:
             index_name = f"{currency.lower()}_usd"
             result = self.client.get_index_price(index_name=index_name)
-            return result.get('index_price', 0.0)
+            price = result.get('index_price', 0.0)
+            return self._cache_put(self._index_cache, currency, price) if price else price
         except Exception as e:
             logger.error(f"Error getting {currency} index price: {e}")
             return 0.0
 
+    def get_index_prices(self, currencies: List[str] = CRYPTO_CURRENCIES) -> Dict[str, float]:
+        """Get index prices for several currencies with concurrent requests"""
+        if not self.connected or not self.client:
+            logger.error("Not connected to Deribit")
+            return {currency: 0.0 for currency in currencies}
+
+        return dict(zip(currencies, self._fanout_pool.map(self.get_index_price, currencies)))
+
     def get_order_book(self, instrument_name: str, depth: int = 5) -> Dict:
         """
         Get order book for a specific instrument
@@ -244,21 +535,171 @@ class DeribitConnector:
             logger.error("Not connected to Deribit")
             return {}
 
+        cached = self._cache_get(self._order_book_cache, (instrument_name, depth), ORDER_BOOK_TTL)
+        if cached is not None:
+            return cached
+
         try:
             order_book = self.client.get_order_book(
                 instrument_name=instrument_name,
                 depth=depth
             )
-            return order_book
+            return self._cache_put(self._order_book_cache, (instrument_name, depth), order_book)
         except Exception as e:
             logger.error(f"Error getting order book for {instrument_name}: {e}")
             return {}
 
+    def get_order_books(self, instrument_names: List[str], depth: int = 5) -> Dict[str, Dict]:
+        """
+        Get order books for many instruments in a single JSON-RPC batch request
+
+        Args:
+            instrument_names: e.g., ['BTC-31MAY24-50000-C', ...]
+            depth: Number of price levels to retrieve
+
+        Returns: dict instrument_name -> order book. Books still in the
+        get_order_book cache are reused; only the rest are requested (and
+        cached). Falls back to concurrent per-instrument requests if the
+        batch call fails.
+        """
+        if not self.connected or not self.client:
+            logger.error("Not connected to Deribit")
+            return {}
+
+        books = {}
+        names = []
+        for name in instrument_names:
+            cached = self._cache_get(self._order_book_cache, (name, depth), ORDER_BOOK_TTL)
+            if cached is not None:
+                books[name] = cached
+            else:
+                names.append(name)
+
+        if not names:
+            return books
+
+        batch = [
+            {
+                'jsonrpc': '2.0',
+                'id': i,
+                'method': 'public/get_order_book',
+                'params': {'instrument_name': name, 'depth': depth}
+            }
+            for i, name in enumerate(names)
+        ]
+
+        try:
+            response = self._session.post(DERIBIT_API_URLS[self.config.env], json=batch, timeout=10)
+            response.raise_for_status()
+            replies = response.json()
+            if not isinstance(replies, list):
+                raise ValueError(f"unexpected batch reply: {replies!r:.200}")
+
+            # Replies may arrive in any order - demux by id
+            for reply in replies:
+                idx = reply.get('id')
+                if 'result' in reply and isinstance(idx, int) and 0 <= idx < len(names):
+                    books[names[idx]] = self._cache_put(
+                        self._order_book_cache, (names[idx], depth), reply['result']
+                    )
+                elif 'error' in reply:
+                    logger.debug(f"Order book error for id {idx}: {reply['error']}")
+            return books
+
+        except Exception as e:
+            logger.warning(f"Batch order book request failed ({e}), falling back to single requests")
+            fetched = self._fanout_pool.map(lambda name: self.get_order_book(name, depth), names)
+            books.update((name, book) for name, book in zip(names, fetched) if book)
+            return books
+
+    def get_ticker(self, instrument_name: str) -> Dict:
+        """
+        Get ticker for an instrument (mark price, mark IV and server-side Greeks)
+
+        Args:
+            instrument_name: e.g., 'BTC-31MAY24-50000-C'
+        """
+        if not self.connected or not self.client:
+            logger.error("Not connected to Deribit")
+            return {}
+
+        try:
+            return self.client.get_ticker(instrument_name=instrument_name)
+        except Exception as e:
+            logger.error(f"Error getting ticker for {instrument_name}: {e}")
+            return {}
+
+    # Async wrappers - same results as the sync methods, run on the worker pool
+    # so servers (FastAPI, websockets) keep serving while Deribit responds
+
+    async def get_index_price_async(self, currency: str = 'BTC') -> float:
+        """Get current index price without blocking the event loop (see get_index_price)"""
+        return await self._run_blocking(self.get_index_price, currency)
+
+    async def get_order_book_async(self, instrument_name: str, depth: int = 5) -> Dict:
+        """Get order book for an instrument without blocking the event loop (see get_order_book)"""
+        return await self._run_blocking(self.get_order_book, instrument_name, depth)
+
+    async def get_option_chain_columns_async(self, currency: str = 'BTC',
+                                             min_dte: int = 7, max_dte: int = 90) -> OptionChain:
+        """All options, calls and puts, as a columnar chain without blocking the event loop (see get_option_chain_columns)"""
+        return await self._run_blocking(self.get_option_chain_columns, currency, min_dte, max_dte)
+
+    async def get_option_chain_async(self, currency: str = 'BTC',
+                                     expiration: Optional[datetime] = None) -> pd.DataFrame:
+        """Get option chain DataFrame without blocking the event loop (see get_option_chain)"""
+        return await self._run_blocking(self.get_option_chain, currency, expiration)
+
+    async def calculate_covered_call_premium_async(self, currency: str = 'BTC', **kwargs) -> List[Dict]:
+        """Covered call opportunities without blocking the event loop (see calculate_covered_call_premium)"""
+        return await self._run_blocking(self.calculate_covered_call_premium, currency, **kwargs)
+
+    async def get_tickers_async(self, instrument_names: List[str]) -> Dict[str, Dict]:
+        """
+        Get tickers for many instruments concurrently
+
+        At most config.max_concurrency requests are in flight at once, to stay
+        under Deribit's rate limits.
+        """
+        if not self.connected or not self.client:
+            logger.error("Not connected to Deribit")
+            return {}
+
+        names = list(instrument_names)
+        sem = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def _fetch_ticker(name: str) -> Dict:
+            async with sem:
+                return await self._run_blocking(self.get_ticker, name)
+
+        tickers = await asyncio.gather(*(_fetch_ticker(name) for name in names))
+
+        return {name: ticker for name, ticker in zip(names, tickers) if ticker}
+
+    def _apply_server_greeks(self, contract_ids: np.ndarray, wanted: np.ndarray,
+                             delta: np.ndarray, gamma: np.ndarray,
+                             theta: np.ndarray, vega: np.ndarray):
+        """Overwrite local Greeks in place with ticker mark Greeks where Deribit returns them"""
+        rows = np.flatnonzero(wanted)
+        names = contract_ids[rows].tolist()
+        # At most max(4, config.max_concurrency) in flight - the fan-out pool's size
+        tickers = self._fanout_pool.map(self.get_ticker, names)
+
+        for i, ticker in zip(rows, tickers):
+            server = ticker.get('greeks') if ticker else None
+            if server:
+                delta[i] = server.get('delta', delta[i])
+                gamma[i] = server.get('gamma', gamma[i])
+                theta[i] = server.get('theta', theta[i])
+                vega[i] = server.get('vega', vega[i])
+
     def calculate_covered_call_premium(self, currency: str = 'BTC',
                                       quantity: float = 1.0,
                                       min_dte: int = 7,
                                       max_dte: int = 30,
-                                      delta_range: Tuple[float, float] = (0.2, 0.4)) -> List[Dict]:
+                                      delta_range: Tuple[float, float] = (0.2, 0.4),
+                                      server_greeks: bool = False,
+                                      max_results: Optional[int] = None) -> List[Dict]:
         """
         Calculate potential covered call strategies
 
@@ -268,6 +709,9 @@ class DeribitConnector:
             min_dte: Minimum days to expiration
             max_dte: Maximum days to expiration
             delta_range: Target delta range for calls
+            server_greeks: Use Deribit's mark Greeks (one ticker request per
+                unexpired call) instead of the local Black-Scholes values
+            max_results: Return only the best N strategies (None for all)
         """
         if not self.connected:
             logger.error("Not connected to Deribit")
@@ -279,71 +723,70 @@ class DeribitConnector:
             return []
 
         # Get available options
-        options = self.get_available_options(currency, min_dte, max_dte)
-
-        # Filter for calls only
-        calls = [opt for opt in options if opt.option_type == OptionType.CALL]
+        chain = self.get_option_chain_columns(currency, min_dte, max_dte)
 
-        # Calculate potential strategies
-        strategies = []
+        # Filter for calls with valid pricing
+        calls = chain.take(chain.is_call & (chain.ask != 0) & (chain.bid != 0))
 
-        for call in calls:
-            # Skip if no valid pricing
-            if call.ask == 0 or call.bid == 0:
-                continue
-
-            # Calculate Greeks (simplified - Deribit provides greeks in API)
-            dte_years = (call.expiration - datetime.now()).days / 365
-
-            try:
-                greeks = GreeksCalculator.calculate(
-                    spot_price=current_price,
-                    strike=call.strike,
-                    time_to_expiry=dte_years,
-                    volatility=call.implied_volatility,
-                    risk_free_rate=0.05,
-                    option_type=OptionType.CALL
-                )
-
-                # Filter by delta
-                if not (delta_range[0] <= abs(greeks.delta) <= delta_range[1]):
-                    continue
-
-                # Calculate premium
-                mid_price = (call.bid + call.ask) / 2
-                premium = mid_price * quantity
-
-                # Calculate annualized return
-                days_to_exp = (call.expiration - datetime.now()).days
-                annualized_return = (premium / (current_price * quantity)) * (365 / days_to_exp) * 100
-
-                strategy = {
-                    'strike': call.strike,
-                    'expiration': call.expiration,
-                    'dte': days_to_exp,
-                    'premium': premium,
-                    'premium_per_coin': mid_price,
-                    'delta': greeks.delta,
-                    'gamma': greeks.gamma,
-                    'theta': greeks.theta,
-                    'vega': greeks.vega,
-                    'iv': call.implied_volatility,
-                    'bid': call.bid,
-                    'ask': call.ask,
-                    'volume': call.volume,
-                    'open_interest': call.open_interest,
-                    'annualized_return': annualized_return,
-                    'contract': call.contract_id
-                }
-
-                strategies.append(strategy)
+        if not len(calls):
+            logger.info(f"📊 Found 0 covered call opportunities for {currency}")
+            return []
 
-            except Exception as e:
-                logger.debug(f"Could not calculate Greeks for {call.contract_id}: {e}")
-                continue
+        # Column arrays for the whole chain
+        now = datetime.now()
+        strikes = calls.strike
+        bids = calls.bid
+        asks = calls.ask
+        ivs = calls.iv
+        days_to_exp = calls.days_to_expiration(now)
+
+        # Calculate Greeks for all calls at once (Black-Scholes, JIT kernel when numba is installed)
+        greeks = _bs_call_greeks_jit if NUMBA_AVAILABLE else _bs_call_greeks
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta, gamma, theta, vega = greeks(
+                current_price, strikes, days_to_exp / 365, ivs, RISK_FREE_RATE
+            )
 
-        # Sort by annualized return
-        strategies.sort(key=lambda x: x['annualized_return'], reverse=True)
+        if server_greeks:
+            self._apply_server_greeks(calls.contract_id, days_to_exp > 0, delta, gamma, theta, vega)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Filter by delta - call deltas are in [0, 1], so no abs()
+            # (expired / zero-IV contracts have no Greeks)
+            mask = ((days_to_exp > 0) & (ivs > 0)
+                    & (delta >= delta_range[0]) & (delta <= delta_range[1]))
+
+            # Calculate premium and annualized return
+            mid_prices = (bids + asks) / 2
+            premiums = mid_prices * quantity
+            annualized = (premiums / (current_price * quantity)) * (365 / days_to_exp) * 100
+
+        # Sort by annualized return (stable, like list.sort); dicts only for the top N
+        selected = np.flatnonzero(mask)
+        selected = selected[np.argsort(-annualized[selected], kind='stable')][:max_results]
+
+        expirations = calls.expiration[selected].tolist()
+        strategies = [
+            {
+                'strike': float(strikes[i]),
+                'expiration': expiration,
+                'dte': int(days_to_exp[i]),
+                'premium': float(premiums[i]),
+                'premium_per_coin': float(mid_prices[i]),
+                'delta': float(delta[i]),
+                'gamma': float(gamma[i]),
+                'theta': float(theta[i]),
+                'vega': float(vega[i]),
+                'iv': float(ivs[i]),
+                'bid': float(bids[i]),
+                'ask': float(asks[i]),
+                'volume': float(calls.volume[i]),
+                'open_interest': float(calls.open_interest[i]),
+                'annualized_return': float(annualized[i]),
+                'contract': calls.contract_id[i]
+            }
+            for i, expiration in zip(selected, expirations)
+        ]
 
         logger.info(f"📊 Found {len(strategies)} covered call opportunities for {currency}")
 
@@ -360,13 +803,10 @@ def test_connection():
     if connector.connect():
         print("✅ Connected to Deribit!")
 
-        # Get BTC index price
-        btc_price = connector.get_index_price('BTC')
-        print(f"\n💰 BTC Index: ${btc_price:,.2f}")
-
-        # Get ETH index price
-        eth_price = connector.get_index_price('ETH')
-        print(f"💰 ETH Index: ${eth_price:,.2f}")
+        # Get BTC and ETH index prices in one batch
+        prices = connector.get_index_prices(['BTC', 'ETH'])
+        print(f"\n💰 BTC Index: ${prices['BTC']:,.2f}")
+        print(f"💰 ETH Index: ${prices['ETH']:,.2f}")
 
         # Get available BTC options
         print("\n📋 Getting BTC options...")
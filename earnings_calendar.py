@@ -3,10 +3,103 @@
 Prevents risky trades during earnings announcements
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import sqlite3
+import time
 import yfinance as yf
 
+# Earnings dates change at most weekly - refetch at most every 12 hours
+EARNINGS_CACHE_TTL = 12 * 3600
+# No date found (yfinance also returns nothing when rate-limited) - retry after 15 minutes
+EARNINGS_MISS_TTL = 15 * 60
+
+_MISSING = object()
+
+
+class EarningsCache:
+    """
+    Small SQLite-backed TTL cache: symbol -> earnings date (ISO string or None)
+
+    Survives restarts, so steady-state checks never reach yfinance.
+    A None value (no date found) is kept only for miss_ttl.
+    Storage errors are treated as cache misses.
+    """
+
+    def __init__(self, db_path: str = None, ttl: float = EARNINGS_CACHE_TTL,
+                 miss_ttl: float = EARNINGS_MISS_TTL):
+        if db_path is None:
+            db_path = Path.home() / ".cache" / "ccmgr" / "earnings.db"
+
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS earnings ("
+                    "symbol TEXT PRIMARY KEY, earnings_date TEXT, expires_at REAL NOT NULL)"
+                )
+        except (OSError, sqlite3.Error):
+            pass
+
+    def get(self, symbol: str, default=None):
+        """Cached value for symbol, or default if missing/expired"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT earnings_date FROM earnings WHERE symbol = ? AND expires_at > ?",
+                    (symbol, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return default
+        return default if row is None else row[0]
+
+    def set(self, symbol: str, earnings_date: Optional[str]):
+        """Store value for symbol for the next ttl seconds (miss_ttl for None)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO earnings (symbol, earnings_date, expires_at) VALUES (?, ?, ?)",
+                    (symbol, earnings_date,
+                     time.time() + (self.ttl if earnings_date is not None else self.miss_ttl))
+                )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, symbol: str):
+        """Drop the cached value for symbol"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM earnings WHERE symbol = ?", (symbol,))
+        except sqlite3.Error:
+            pass
+
+
+def _to_iso(earnings_date) -> Optional[str]:
+    """Normalize a raw yfinance earnings date for storage (parsed back by fromisoformat)"""
+    if earnings_date is None:
+        return None
+    if isinstance(earnings_date, (int, float)):
+        earnings_date = datetime.fromtimestamp(earnings_date)
+    if isinstance(earnings_date, datetime):
+        return earnings_date.isoformat()
+    return str(earnings_date)
+
+
+def _is_past(earnings_iso: Optional[str]) -> bool:
+    """True if a cached earnings date has already happened"""
+    if earnings_iso is None:
+        return False
+    try:
+        earnings_date = datetime.fromisoformat(earnings_iso)
+    except ValueError:
+        return False
+    return earnings_date.replace(tzinfo=None) < datetime.now()
+
 
 class EarningsCalendar:
     """
@@ -15,8 +108,122 @@ class EarningsCalendar:
     Uses yfinance to check upcoming earnings dates
     """
 
-    def __init__(self):
-        self.cache = {}  # Cache earnings dates to avoid repeated API calls
+    def __init__(self, cache_path: str = None):
+        self.cache = EarningsCache(cache_path)  # persistent - avoids repeated API calls
+
+    def _fetch_earnings_date(self, symbol: str) -> Optional[str]:
+        """
+        Earnings date for a symbol as an ISO string (or None)
+
+        Served from the on-disk cache for EARNINGS_CACHE_TTL; a cached date that
+        has already passed is refetched.
+        """
+        hit = self.cache.get(symbol, _MISSING)
+        if hit is not _MISSING:
+            if not _is_past(hit):
+                return hit
+            self.cache.delete(symbol)
+
+        # Get ticker
+        ticker = yf.Ticker(symbol)
+
+        # Try to get earnings date
+        earnings_date = None
+
+        # Method 1: Try calendar (dict on current yfinance, DataFrame on older releases)
+        try:
+            calendar = ticker.calendar
+        except Exception:
+            calendar = None  # Request failed (network, rate limit) - fall back to ticker.info
+
+        try:
+            if isinstance(calendar, dict):
+                earnings_date = calendar.get('Earnings Date')
+            elif hasattr(calendar, 'iloc') and not calendar.empty:
+                earnings_date = calendar.iloc[0, 0]
+        except (KeyError, AttributeError, ValueError, IndexError):
+            pass
+
+        # Method 2: Try info dict
+        if earnings_date is None:
+            try:
+                info = ticker.info
+                if isinstance(info, dict):
+                    # earningsDate is often a timestamp
+                    earnings_date = info.get('earningsDate')
+            except (KeyError, AttributeError, ValueError):
+                pass
+
+        earnings_date = _to_iso(earnings_date)
+        self.cache.set(symbol, earnings_date)
+        return earnings_date
+
+    @staticmethod
+    def _check_failed(error: Exception) -> Dict:
+        """Result when earnings could not be checked - allow with a warning"""
+        return {
+            'safe': True,
+            'reason': f'Could not check earnings: {str(error)}',
+            'recommendation': '⚠️ Manual earnings check recommended',
+            'earnings_date': None
+        }
+
+    def _evaluate_earnings(self, earnings_date, dte: int) -> Dict:
+        """Decide whether an earnings date is safe for an option with this DTE"""
+        # If we couldn't find earnings date, be conservative
+        if earnings_date is None:
+            return {
+                'safe': True,  # Allow trade but warn
+                'reason': 'Earnings date unavailable - exercise caution',
+                'recommendation': 'Consider checking earnings manually',
+                'earnings_date': None
+            }
+
+        # Convert to datetime if needed
+        if isinstance(earnings_date, (int, float)):
+            earnings_date = datetime.fromtimestamp(earnings_date)
+        elif not isinstance(earnings_date, datetime):
+            try:
+                earnings_date = datetime.fromisoformat(str(earnings_date))
+            except ValueError:
+                earnings_date = None
+
+        if earnings_date is None:
+            return {
+                'safe': True,
+                'reason': 'Could not parse earnings date',
+                'recommendation': 'Consider checking earnings manually',
+                'earnings_date': None
+            }
+
+        # Calculate days until earnings
+        days_until_earnings = (earnings_date - datetime.now()).days
+
+        # Check if earnings is before option expiration
+        if days_until_earnings <= dte and days_until_earnings >= 0:
+            return {
+                'safe': False,
+                'reason': f'Earnings in {days_until_earnings} days (before expiration)',
+                'recommendation': f'⚠️ Wait until after earnings ({earnings_date.strftime("%Y-%m-%d")})',
+                'earnings_date': earnings_date.strftime('%Y-%m-%d')
+            }
+
+        # Check if earnings is very soon (within 7 days)
+        elif days_until_earnings < 7 and days_until_earnings >= 0:
+            return {
+                'safe': True,  # Allow but warn
+                'reason': f'Earnings in {days_until_earnings} days (after expiration)',
+                'recommendation': f'⚠️ Earnings soon ({earnings_date.strftime("%Y-%m-%d")}) - consider shorter DTE',
+                'earnings_date': earnings_date.strftime('%Y-%m-%d')
+            }
+
+        # Earnings is far enough away
+        return {
+            'safe': True,
+            'reason': f'Earnings in ~{days_until_earnings} days',
+            'recommendation': '✅ Safe to trade',
+            'earnings_date': earnings_date.strftime('%Y-%m-%d') if earnings_date else None
+        }
 
     def check_before_trade(self, symbol: str, dte: int) -> Dict:
         """
@@ -34,97 +241,35 @@ class EarningsCalendar:
                 - earnings_date: str or None
         """
         try:
-            # Get ticker
-            ticker = yf.Ticker(symbol)
+            return self._evaluate_earnings(self._fetch_earnings_date(symbol), dte)
+        except Exception as e:
+            # If we can't check, be conservative and allow (with warning)
+            return self._check_failed(e)
 
-            # Try to get earnings date
-            earnings_date = None
+    def check_portfolio(self, positions: List[Tuple[str, int]]) -> Dict[str, Dict]:
+        """
+        Check several (symbol, dte) pairs at once
 
-            # Method 1: Try calendar
-            try:
-                calendar = ticker.calendar
-                if calendar is not None and len(calendar) > 0:
-                    # Calendar returns DataFrame with earnings dates
-                    if hasattr(calendar, 'iloc'):
-                        earnings_date = calendar.iloc[0, 0]
-                    elif isinstance(calendar, dict) and 'Earnings Date' in calendar:
-                        earnings_date = calendar['Earnings Date']
-            except:
-                pass
+        Earnings dates for all symbols are fetched concurrently, then each
+        position is evaluated like check_before_trade.
 
-            # Method 2: Try info dict
-            if earnings_date is None:
-                try:
-                    info = ticker.info
-                    if 'earningsDate' in info:
-                        # earningsDate is often a timestamp
-                        earnings_date = info['earningsDate']
-                except:
-                    pass
-
-            # If we couldn't find earnings date, be conservative
-            if earnings_date is None:
-                return {
-                    'safe': True,  # Allow trade but warn
-                    'reason': 'Earnings date unavailable - exercise caution',
-                    'recommendation': 'Consider checking earnings manually',
-                    'earnings_date': None
-                }
-
-            # Convert to datetime if needed
-            if isinstance(earnings_date, (int, float)):
-                earnings_date = datetime.fromtimestamp(earnings_date)
-            elif not isinstance(earnings_date, datetime):
-                try:
-                    earnings_date = datetime.fromisoformat(str(earnings_date))
-                except:
-                    earnings_date = None
-
-            if earnings_date is None:
-                return {
-                    'safe': True,
-                    'reason': 'Could not parse earnings date',
-                    'recommendation': 'Consider checking earnings manually',
-                    'earnings_date': None
-                }
-
-            # Calculate days until earnings
-            days_until_earnings = (earnings_date - datetime.now()).days
-
-            # Check if earnings is before option expiration
-            if days_until_earnings <= dte and days_until_earnings >= 0:
-                return {
-                    'safe': False,
-                    'reason': f'Earnings in {days_until_earnings} days (before expiration)',
-                    'recommendation': f'⚠️ Wait until after earnings ({earnings_date.strftime("%Y-%m-%d")})',
-                    'earnings_date': earnings_date.strftime('%Y-%m-%d')
-                }
-
-            # Check if earnings is very soon (within 7 days)
-            elif days_until_earnings < 7 and days_until_earnings >= 0:
-                return {
-                    'safe': True,  # Allow but warn
-                    'reason': f'Earnings in {days_until_earnings} days (after expiration)',
-                    'recommendation': f'⚠️ Earnings soon ({earnings_date.strftime("%Y-%m-%d")}) - consider shorter DTE',
-                    'earnings_date': earnings_date.strftime('%Y-%m-%d')
-                }
-
-            # Earnings is far enough away
-            return {
-                'safe': True,
-                'reason': f'Earnings in ~{days_until_earnings} days',
-                'recommendation': '✅ Safe to trade',
-                'earnings_date': earnings_date.strftime('%Y-%m-%d') if earnings_date else None
-            }
+        Returns:
+            Dict symbol -> check_before_trade-style result (a repeated
+            symbol keeps the result for its last DTE)
+        """
+        symbols = list(dict.fromkeys(symbol for symbol, _ in positions))
 
-        except Exception as e:
-            # If we can't check, be conservative and allow (with warning)
-            return {
-                'safe': True,
-                'reason': f'Could not check earnings: {str(e)}',
-                'recommendation': '⚠️ Manual earnings check recommended',
-                'earnings_date': None
-            }
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            futures = {symbol: pool.submit(self._fetch_earnings_date, symbol) for symbol in symbols}
+
+        results = {}
+        for symbol, dte in positions:
+            try:
+                results[symbol] = self._evaluate_earnings(futures[symbol].result(), dte)
+            except Exception as e:
+                results[symbol] = self._check_failed(e)
+
+        return results
 
     def get_earnings_info(self, symbol: str) -> Dict:
         """
@@ -6,16 +6,17 @@ Handles connection, data retrieval, and order execution with IBKR TWS/Gateway
 import asyncio
 import nest_asyncio
 
-# Fix for Python 3.13 event loop issue
-nest_asyncio.apply()
-
 from ib_async import *
 from ib_async import Stock as IBStock  # Rename to avoid conflict
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 import logging
+import threading
 import time
 from covered_calls_system import (
     Stock, OptionContract, OptionType, CoveredCall,
@@ -25,6 +26,59 @@ from covered_calls_system import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One long-lived worker thread for IB calls made while an event loop is already
+# running (Streamlit) - instead of spinning up a new executor per call
+_IBKR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ibkr")
+
+# Qualified option contracts are static within a session - re-qualify at most hourly
+OPTION_CONTRACT_TTL = 3600
+
+# Contract-details requests per qualifyContracts batch (IBKR paces bursts)
+QUALIFY_CHUNK_SIZE = 50
+
+# Expirations/strikes only change when new series are listed - refetch every 5 minutes
+OPTION_CHAIN_TTL = 300
+
+
+def _ensure_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop for the calling thread, created if missing and made re-entrant
+
+    Done on connect rather than at import: Streamlit imports this module on its
+    ScriptRunner thread, which may have no (or a closed) event loop.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    # Fix for Python 3.13 event loop issue (ib_async re-enters the loop from sync calls)
+    nest_asyncio.apply(loop)
+    return loop
+
+
+# Numeric BarData fields, in util.df column order (between 'date' and 'barCount')
+_BAR_FLOAT_FIELDS = ('open', 'high', 'low', 'close', 'volume', 'average')
+
+
+def _bars_to_df(bars) -> pd.DataFrame:
+    """
+    DataFrame from historical bars, built column-wise
+
+    Same columns and dtypes as util.df(bars), without a per-row record hop.
+    No bars gives an empty frame (util.df returns None).
+    """
+    n = len(bars)
+    data = {'date': [bar.date for bar in bars]}  # date or tz-aware datetime - kept as objects
+    for name in _BAR_FLOAT_FIELDS:
+        data[name] = np.fromiter((getattr(bar, name) for bar in bars), dtype=np.float64, count=n)
+    data['barCount'] = np.fromiter((bar.barCount for bar in bars), dtype=np.int64, count=n)
+    return pd.DataFrame(data)
+
 
 @dataclass
 class IBKRConfig:
@@ -33,24 +87,49 @@ class IBKRConfig:
     port: int = 7497  # 7497 for TWS paper, 7496 for TWS live, 4002 for Gateway paper, 4001 for Gateway live
     client_id: int = 1
     readonly: bool = False  # Set True for read-only mode (no order execution)
+    connect_timeout: int = 10  # Seconds to wait for the TWS/Gateway handshake
+    qualify_timeout: int = 5  # Seconds to wait for contract details (qualifyContracts)
+    mkt_data_wait: float = 1.5  # Max seconds to wait for stock prices (returns early once all arrive)
+    greeks_wait: float = 2.0  # Max seconds to wait for option quotes + Greeks (returns early once all arrive)
+
+
+@dataclass(frozen=True)
+class IBKRChainSpec:
+    """Available expirations and strikes for a symbol (from reqSecDefOptParams)"""
+    symbol: str
+    expirations: Tuple[str, ...]  # 'YYYYMMDD', sorted
+    strikes: Tuple[float, ...]    # sorted
+    exchange: str
 
 
 class IBKRConnector:
     """Main connector class for Interactive Brokers"""
 
+    # One IB session per (host, port, client_id), shared by every connector -
+    # Streamlit reruns reuse the open TCP session instead of opening new clients
+    _shared_ibs: Dict[Tuple[str, int, int], IB] = {}
+    _shared_refcounts: Dict[Tuple[str, int, int], int] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, config: IBKRConfig = None):
         self.config = config or IBKRConfig()
-        self.ib = IB()
+        self._shared_key = (self.config.host, self.config.port, self.config.client_id)
+        with IBKRConnector._shared_lock:
+            if self._shared_key not in IBKRConnector._shared_ibs:
+                IBKRConnector._shared_ibs[self._shared_key] = IB()
+            self.ib = IBKRConnector._shared_ibs[self._shared_key]
         self.connected = False
         self._positions_cache = {}
-        self._options_cache = {}
+        self._options_cache = {}  # contract spec or ('chain', symbol, exchange) -> (value, expires_at)
 
     def connect(self) -> bool:
         """Connect to IBKR TWS or Gateway"""
+        _ensure_event_loop()
+
         # Check if already connected
         if self.ib.isConnected():
             logger.info("Already connected to IBKR")
-            self.connected = True
+            self._retain()
             return True
 
         try:
@@ -67,11 +146,11 @@ class IBKRConnector:
                     port=self.config.port,
                     clientId=self.config.client_id,
                     readonly=self.config.readonly,
-                    timeout=10
+                    timeout=self.config.connect_timeout
                 )
             )
 
-            self.connected = True
+            self._retain()
             logger.info(f"✅ Connected to IBKR on {self.config.host}:{self.config.port} - self.connected={self.connected}, id(self)={id(self)}")
             return True
 
@@ -81,12 +160,37 @@ class IBKRConnector:
             return False
 
     def disconnect(self):
-        """Disconnect from IBKR"""
-        if self.connected:
+        """Disconnect from IBKR (the shared session closes when its last connector disconnects)"""
+        if not self.connected:
+            return
+
+        with IBKRConnector._shared_lock:
+            remaining = IBKRConnector._shared_refcounts.get(self._shared_key, 1) - 1
+            IBKRConnector._shared_refcounts[self._shared_key] = max(remaining, 0)
+        self.connected = False
+
+        if remaining <= 0:
             self.ib.disconnect()
-            self.connected = False
             logger.info("Disconnected from IBKR")
 
+    def _retain(self):
+        """Mark this connector connected, taking one reference on the shared session"""
+        if not self.connected:
+            with IBKRConnector._shared_lock:
+                IBKRConnector._shared_refcounts[self._shared_key] = \
+                    IBKRConnector._shared_refcounts.get(self._shared_key, 0) + 1
+        self.connected = True
+
+    @staticmethod
+    def _run_off_loop(func, *args, timeout: float = 10):
+        """Call func directly, or on the shared IBKR worker thread if this thread runs an event loop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return func(*args)
+
+        return _IBKR_EXECUTOR.submit(func, *args).result(timeout=timeout)
+
     def __enter__(self):
         """Context manager entry"""
         self.connect()
@@ -128,43 +232,29 @@ class IBKRConnector:
             raise ConnectionError("Not connected to IBKR")
 
         try:
-            # Check if we're in a running event loop (Streamlit)
-            try:
-                loop = asyncio.get_running_loop()
-                in_running_loop = True
-            except RuntimeError:
-                in_running_loop = False
-
-            if in_running_loop:
-                # Use ThreadPoolExecutor to avoid event loop conflict
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self.ib.positions)
-                    positions = future.result(timeout=10)
-            else:
-                positions = self.ib.positions()
-
-            stocks = []
-
-            for pos in positions:
-                if isinstance(pos.contract, IBStock):
-                    # Get current market price
-                    if in_running_loop:
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(self.ib.reqMktData, pos.contract)
-                            ticker = future.result(timeout=10)
-                    else:
-                        ticker = self.ib.reqMktData(pos.contract)
-
-                    time.sleep(1)  # Wait for data
+            # Off the event loop thread when running under Streamlit
+            positions = self._run_off_loop(self.ib.positions)
+
+            # Request market data for every stock position up front (subscriptions
+            # are cancelled on exit - only one price per stock is needed)...
+            stock_positions = [pos for pos in positions if isinstance(pos.contract, IBStock)]
+            with self._mkt_data([pos.contract for pos in stock_positions]) as tickers:
+                # ...then wait once for all of them instead of once per symbol
+                self._await_tickers(
+                    tickers,
+                    lambda t: not util.isNan(t.marketPrice()) or not util.isNan(t.close),
+                    timeout=self.config.mkt_data_wait
+                )
 
-                    stock = Stock(
+                stocks = [
+                    Stock(
                         symbol=pos.contract.symbol,
                         quantity=int(pos.position),
                         avg_cost=pos.avgCost,
                         current_price=ticker.marketPrice() or ticker.close
                     )
-                    stocks.append(stock)
+                    for pos, ticker in zip(stock_positions, tickers)
+                ]
 
             logger.info(f"Retrieved {len(stocks)} stock positions")
             return stocks
@@ -178,21 +268,8 @@ class IBKRConnector:
             raise ConnectionError("Not connected to IBKR")
 
         try:
-            # Check if we're in a running event loop (Streamlit)
-            try:
-                loop = asyncio.get_running_loop()
-                in_running_loop = True
-            except RuntimeError:
-                in_running_loop = False
-
-            if in_running_loop:
-                # Use ThreadPoolExecutor to avoid event loop conflict
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self.ib.positions)
-                    positions = future.result(timeout=10)
-            else:
-                positions = self.ib.positions()
+            # Off the event loop thread when running under Streamlit
+            positions = self._run_off_loop(self.ib.positions)
 
             options = []
 
@@ -234,21 +311,8 @@ class IBKRConnector:
             raise ConnectionError("Not connected to IBKR")
 
         try:
-            # Check if we're in a running event loop (Streamlit)
-            try:
-                loop = asyncio.get_running_loop()
-                in_running_loop = True
-            except RuntimeError:
-                in_running_loop = False
-
-            # Get all positions
-            if in_running_loop:
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self.ib.positions)
-                    positions = future.result(timeout=10)
-            else:
-                positions = self.ib.positions()
+            # Get all positions (off the event loop thread when running under Streamlit)
+            positions = self._run_off_loop(self.ib.positions)
 
             # Separate stocks and options
             stocks = {}
@@ -277,44 +341,47 @@ class IBKRConnector:
                         })
 
             # Match short calls with stock holdings (covered calls)
+            covered_calls = [
+                call for call in short_calls
+                if call['symbol'] in stocks
+                and stocks[call['symbol']]['quantity'] >= abs(call['contracts']) * 100
+            ]
+
+            # Get Greeks for all of them in one snapshot request (reqTickers waits for the model Greeks).
+            # Called on this thread - it drives the IB socket's own event loop
+            tickers = [None] * len(covered_calls)
+            if covered_calls:
+                try:
+                    tickers = self.ib.reqTickers(*(call['contract'] for call in covered_calls))
+                except Exception as e:
+                    logger.warning(f"Could not get Greeks for covered calls: {e}")
+
+            # Calculate days to expiration - all expiries parsed in one vectorized call
+            expiries = pd.to_datetime([call['expiry'] for call in covered_calls], format='%Y%m%d')
+            dtes = (expiries - pd.Timestamp(datetime.now())).days.to_numpy()
+
             covered_positions = []
 
-            for call in short_calls:
+            for call, ticker, expiry_date, dte in zip(
+                covered_calls, tickers, expiries.to_pydatetime(), dtes.tolist()
+            ):
                 symbol = call['symbol']
-                if symbol in stocks and stocks[symbol]['quantity'] >= abs(call['contracts']) * 100:
-                    # Calculate days to expiration
-                    from datetime import datetime
-                    expiry_str = call['expiry']
-                    expiry_date = datetime.strptime(expiry_str, '%Y%m%d')
-                    dte = (expiry_date - datetime.now()).days
-
-                    # Get Greeks
-                    if in_running_loop:
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(self.ib.reqMktData, call['contract'], '', False, False)
-                            ticker = future.result(timeout=10)
-                    else:
-                        ticker = self.ib.reqMktData(call['contract'], '', False, False)
-
-                    time.sleep(0.5)
-
-                    delta = getattr(ticker, 'modelGreeks', None)
-                    theta = getattr(ticker, 'modelGreeks', None)
-
-                    covered_positions.append({
-                        'symbol': symbol,
-                        'stock_qty': stocks[symbol]['quantity'],
-                        'stock_price': stocks[symbol]['current_price'],
-                        'option_strike': call['strike'],
-                        'option_expiry': expiry_date,
-                        'option_dte': dte,
-                        'contracts': call['contracts'],
-                        'premium_received': -call['avg_cost'] * abs(call['contracts']) * 100,
-                        'current_option_value': call['market_value'],
-                        'unrealized_pnl': call['unrealized_pnl'],
-                        'delta': delta.delta if delta else None,
-                        'theta': delta.theta if delta else None
-                    })
+                greeks = ticker.modelGreeks if ticker else None
+
+                covered_positions.append({
+                    'symbol': symbol,
+                    'stock_qty': stocks[symbol]['quantity'],
+                    'stock_price': stocks[symbol]['current_price'],
+                    'option_strike': call['strike'],
+                    'option_expiry': expiry_date,
+                    'option_dte': dte,
+                    'contracts': call['contracts'],
+                    'premium_received': -call['avg_cost'] * abs(call['contracts']) * 100,
+                    'current_option_value': call['market_value'],
+                    'unrealized_pnl': call['unrealized_pnl'],
+                    'delta': greeks.delta if greeks else None,
+                    'theta': greeks.theta if greeks else None
+                })
 
             logger.info(f"Retrieved {len(covered_positions)} covered call positions")
             return covered_positions
@@ -324,48 +391,123 @@ class IBKRConnector:
 
     # ==================== Market Data ====================
 
+    @contextmanager
+    def _mkt_data(self, contracts: List[Contract]):
+        """
+        Streaming market data for contracts, as a list of tickers
+
+        Every subscription is cancelled on exit (even on error), so repeated
+        dashboard reloads don't pile up against IBKR's market data line limit.
+        """
+        tickers = []
+        try:
+            for contract in contracts:
+                tickers.append(self.ib.reqMktData(contract))
+            yield tickers
+        finally:
+            for ticker in tickers:
+                self.ib.cancelMktData(ticker.contract)
+
+    def _await_tickers(self, tickers: List[Ticker], ready, timeout: float) -> bool:
+        """
+        Run the event loop until ready(ticker) holds for every ticker
+
+        Wakes on each network update instead of sleeping a fixed interval, so it
+        returns as soon as the data is in. Gives up after timeout seconds;
+        returns False if some tickers were still not ready.
+        """
+        deadline = time.monotonic() + timeout
+        pending = [t for t in tickers if not ready(t)]
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.ib.waitOnUpdate(timeout=remaining)
+            pending = [t for t in pending if not ready(t)]
+
+        return not pending
+
+    def _await_greeks(self, tickers: List[Ticker], timeout: float = None) -> bool:
+        """Wait until every option ticker has model Greeks and a bid (see _await_tickers)"""
+        return self._await_tickers(
+            tickers,
+            lambda t: t.modelGreeks is not None and not util.isNan(t.bid),
+            self.config.greeks_wait if timeout is None else timeout
+        )
+
     def get_stock_price(self, symbol: str, exchange: str = "SMART") -> float:
         """Get current stock price"""
         if not self.connected:
             raise ConnectionError("Not connected to IBKR")
 
         contract = IBStock(symbol, exchange, 'USD')
-        ticker = self.ib.reqMktData(contract, '', False, False)
-        time.sleep(1)
+        # Snapshot - returns once the price arrives and leaves no subscription behind
+        ticker, = self.ib.reqTickers(contract)
 
         price = ticker.marketPrice() or ticker.last or ticker.close
         return price
 
-    def get_option_chain(self, symbol: str, exchange: str = "SMART") -> pd.DataFrame:
+    def _fetch_chain(self, symbol: str, exchange: str = "SMART") -> Optional[IBKRChainSpec]:
         """
-        Get full option chain for a symbol
+        Option chain for a symbol (sorted expirations and strikes)
 
-        Returns: DataFrame with all available strikes and expirations
+        Memoized in the contract cache for OPTION_CHAIN_TTL, so get_otm_calls and
+        get_options_for_expiration share a single reqSecDefOptParams round-trip.
+        Returns None if IBKR has no chain for the symbol (not cached).
         """
-        if not self.connected:
-            raise ConnectionError("Not connected to IBKR")
+        key = ('chain', symbol, exchange)
+        cached = self._options_cache.get(key)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
 
         stock = IBStock(symbol, exchange, 'USD')
-        self.ib.qualifyContracts(stock)
+        self._qualify_contracts(stock)
 
         # Get option chain
         chains = self.ib.reqSecDefOptParams(stock.symbol, '', stock.secType, stock.conId)
 
         if not chains:
             logger.warning(f"No option chain found for {symbol}")
-            return pd.DataFrame()
+            return None
 
-        chain = chains[0]
-        expirations = sorted(chain.expirations)
-        strikes = sorted(chain.strikes)
+        chain = IBKRChainSpec(
+            symbol=symbol,
+            expirations=tuple(sorted(chains[0].expirations)),
+            strikes=tuple(sorted(chains[0].strikes)),
+            exchange=chains[0].exchange
+        )
+        self._options_cache[key] = (chain, time.time() + OPTION_CHAIN_TTL)
 
         logger.info(f"Retrieved option chain for {symbol}: "
-                   f"{len(expirations)} expirations, {len(strikes)} strikes")
+                   f"{len(chain.expirations)} expirations, {len(chain.strikes)} strikes")
+        return chain
+
+    def get_option_chain_spec(self, symbol: str, exchange: str = "SMART") -> Optional[IBKRChainSpec]:
+        """
+        Get full option chain for a symbol, without the DataFrame wrapper
+
+        Returns: IBKRChainSpec with all available expirations and strikes, or None
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to IBKR")
+
+        return self._fetch_chain(symbol, exchange)
+
+    def get_option_chain(self, symbol: str, exchange: str = "SMART") -> pd.DataFrame:
+        """
+        Get full option chain for a symbol
+
+        Returns: DataFrame with all available strikes and expirations (empty if none)
+        """
+        chain = self.get_option_chain_spec(symbol, exchange)
+        if chain is None:
+            return pd.DataFrame()
 
         return pd.DataFrame({
-            'symbol': symbol,
-            'expirations': [expirations],
-            'strikes': [strikes],
+            'symbol': chain.symbol,
+            'expirations': [list(chain.expirations)],
+            'strikes': [list(chain.strikes)],
             'exchange': chain.exchange
         })
 
@@ -374,7 +516,8 @@ class IBKRConnector:
         symbol: str,
         expiration: str,
         option_type: OptionType = OptionType.CALL,
-        exchange: str = "SMART"
+        exchange: str = "SMART",
+        strike_filter: Optional[Callable[[np.ndarray], np.ndarray]] = None
     ) -> List[OptionContract]:
         """
         Get all options for specific expiration
@@ -384,6 +527,9 @@ class IBKRConnector:
             expiration: Expiration date in format 'YYYYMMDD'
             option_type: CALL or PUT
             exchange: Exchange (default SMART)
+            strike_filter: Vectorized strike filter - called once with all chain
+                strikes as a float64 array, returns a boolean mask of strikes to
+                fetch (applied before any contract or market data request)
 
         Returns: List of OptionContract objects with Greeks
         """
@@ -391,61 +537,58 @@ class IBKRConnector:
             raise ConnectionError("Not connected to IBKR")
 
         # Get available strikes
-        chain_df = self.get_option_chain(symbol, exchange)
-        if chain_df.empty:
+        chain = self._fetch_chain(symbol, exchange)
+        if chain is None:
             return []
 
-        strikes = chain_df.iloc[0]['strikes']
+        strikes = chain.strikes
+        if strike_filter is not None:
+            strikes_arr = np.asarray(strikes, dtype=np.float64)
+            strikes = strikes_arr[strike_filter(strikes_arr)].tolist()
 
-        # Create option contracts
+        # Qualify the whole chain in one request (get full contract details) - results
+        # go into the contract cache, so a following sell/roll needs no round-trip
         right = 'C' if option_type == OptionType.CALL else 'P'
-        contracts = [
-            Option(symbol, expiration, strike, right, exchange)
+        contracts = self._qualify_options([
+            (symbol, expiration, strike, right, exchange)
             for strike in strikes
-        ]
-
-        # Qualify contracts (get full contract details)
-        qualified = self.ib.qualifyContracts(*contracts)
-
-        # Request market data and Greeks
-        options_list = []
-        for contract in qualified:
-            try:
-                # Request market data with Greeks
-                ticker = self.ib.reqMktData(
-                    contract,
-                    genericTickList='',
-                    snapshot=False,
-                    regulatorySnapshot=False
-                )
-                time.sleep(0.5)  # Brief pause for data
-
-                # Get Greeks from model calculation if not available from IBKR
-                greeks = ticker.modelGreeks
-                if not greeks:
-                    greeks = ticker.lastGreeks
-
-                option = OptionContract(
-                    symbol=symbol,
-                    strike=contract.strike,
-                    expiration=datetime.strptime(contract.lastTradeDateOrContractMonth, '%Y%m%d'),
-                    option_type=option_type,
-                    premium=ticker.marketPrice() or ticker.last or 0,
-                    implied_volatility=greeks.impliedVol * 100 if greeks else 0,
-                    delta=greeks.delta if greeks else 0,
-                    gamma=greeks.gamma if greeks else 0,
-                    theta=greeks.theta if greeks else 0,
-                    vega=greeks.vega if greeks else 0,
-                    volume=ticker.volume or 0,
-                    open_interest=ticker.openInterest or 0,
-                    bid=ticker.bid or 0,
-                    ask=ticker.ask or 0
-                )
-                options_list.append(option)
+        ])
+        qualified = [c for c in contracts if c.conId]  # Skip strikes IBKR could not resolve
+
+        # Request market data and Greeks for all strikes up front (cancelled once read)...
+        with self._mkt_data(qualified) as tickers:
+            # ...then wait until they have all arrived (at most greeks_wait for illiquid strikes)
+            self._await_greeks(tickers)
+
+            options_list = []
+            for contract, ticker in zip(qualified, tickers):
+                try:
+                    # Get Greeks from model calculation if not available from IBKR
+                    greeks = ticker.modelGreeks
+                    if not greeks:
+                        greeks = ticker.lastGreeks
+
+                    option = OptionContract(
+                        symbol=symbol,
+                        strike=contract.strike,
+                        expiration=datetime.strptime(contract.lastTradeDateOrContractMonth, '%Y%m%d'),
+                        option_type=option_type,
+                        premium=ticker.marketPrice() or ticker.last or 0,
+                        implied_volatility=greeks.impliedVol * 100 if greeks else 0,
+                        delta=greeks.delta if greeks else 0,
+                        gamma=greeks.gamma if greeks else 0,
+                        theta=greeks.theta if greeks else 0,
+                        vega=greeks.vega if greeks else 0,
+                        volume=ticker.volume or 0,
+                        open_interest=ticker.openInterest or 0,
+                        bid=ticker.bid or 0,
+                        ask=ticker.ask or 0
+                    )
+                    options_list.append(option)
 
-            except Exception as e:
-                logger.warning(f"Failed to get data for strike {contract.strike}: {e}")
-                continue
+                except Exception as e:
+                    logger.warning(f"Failed to get data for strike {contract.strike}: {e}")
+                    continue
 
         logger.info(f"Retrieved {len(options_list)} options for {symbol} {expiration}")
         return options_list
@@ -470,42 +613,112 @@ class IBKRConnector:
 
         Returns: List of OTM call options
         """
+        if not self.connected:
+            raise ConnectionError("Not connected to IBKR")
+
         # Get option chain
-        chain_df = self.get_option_chain(symbol)
-        if chain_df.empty:
+        chain = self._fetch_chain(symbol)
+        if chain is None:
             return []
 
-        expirations = chain_df.iloc[0]['expirations']
+        expirations = chain.expirations
 
-        # Filter expirations by DTE
-        target_date = datetime.now() + timedelta(days=days_to_expiration)
-        min_date = datetime.now() + timedelta(days=min_dte)
-        max_date = datetime.now() + timedelta(days=max_dte)
+        # Filter expirations by DTE - all expirations parsed in one vectorized call
+        now = datetime.now()
+        exp_arr = pd.to_datetime(expirations, format='%Y%m%d').to_numpy().astype('datetime64[us]')
+        target_date = np.datetime64(now + timedelta(days=days_to_expiration), 'us')
+        min_date = np.datetime64(now + timedelta(days=min_dte), 'us')
+        max_date = np.datetime64(now + timedelta(days=max_dte), 'us')
 
-        valid_expirations = [
-            exp for exp in expirations
-            if min_date <= datetime.strptime(exp, '%Y%m%d') <= max_date
-        ]
+        valid_idx = np.flatnonzero((exp_arr >= min_date) & (exp_arr <= max_date))
 
-        if not valid_expirations:
+        if not len(valid_idx):
             logger.warning(f"No expirations found in range {min_dte}-{max_dte} days")
             return []
 
-        # Get closest expiration to target
-        target_exp = min(
-            valid_expirations,
-            key=lambda x: abs((datetime.strptime(x, '%Y%m%d') - target_date).days)
-        )
+        # Get closest expiration to target (whole days, first one on ties)
+        distance = np.abs((exp_arr[valid_idx] - target_date) // np.timedelta64(1, 'D'))
+        target_exp = expirations[valid_idx[np.argmin(distance)]]
 
-        # Get all options for that expiration
-        all_options = self.get_options_for_expiration(symbol, target_exp, OptionType.CALL)
-
-        # Filter OTM options (strike > current price)
-        otm_options = [opt for opt in all_options if opt.strike > current_price]
+        # Get OTM options for that expiration (strike > current price) - ITM strikes
+        # are never qualified or subscribed to
+        otm_options = self.get_options_for_expiration(
+            symbol, target_exp, OptionType.CALL,
+            strike_filter=lambda strikes: strikes > current_price
+        )
 
         logger.info(f"Found {len(otm_options)} OTM calls for {symbol} expiring {target_exp}")
         return otm_options
 
+    # ==================== Contracts ====================
+
+    def _qualify_contracts(self, *contracts: Contract) -> List[Optional[Contract]]:
+        """
+        qualifyContracts bounded by config.qualify_timeout
+
+        On timeout every slot is None and the contracts stay unqualified, as
+        with any contract IBKR cannot resolve - callers keep their usual
+        error paths instead of seeing asyncio.TimeoutError.
+        """
+        try:
+            return util.run(
+                self.ib.qualifyContractsAsync(*contracts), timeout=self.config.qualify_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out qualifying {len(contracts)} contract(s) "
+                           f"after {self.config.qualify_timeout}s")
+            return [None] * len(contracts)
+
+    def _qualify_chunked(self, contracts: List[Contract], chunk: int = QUALIFY_CHUNK_SIZE) -> List[Optional[Contract]]:
+        """
+        Qualify contracts in batches of chunk requests
+
+        Large chains (SPY has 500+ strikes per expiry) would otherwise fire every
+        contract-details request at once, which IBKR paces and can silently drop.
+        Requests within a batch run concurrently; batches are spaced by a short pause.
+        """
+        qualified = []
+        for i in range(0, len(contracts), chunk):
+            if i:
+                self.ib.sleep(0.1)  # Stay under IBKR's request pacing
+            qualified.extend(self._qualify_contracts(*contracts[i:i + chunk]))
+        return qualified
+
+    def _qualify_options(self, specs: List[Tuple[str, str, float, str, str]]) -> List[Option]:
+        """
+        Qualified Option contracts for (symbol, expiration, strike, right, exchange) specs
+
+        Served from the contract cache when possible; all misses are qualified
+        in one IBKR request. A contract IBKR cannot resolve is returned
+        unqualified (and not cached).
+        """
+        now = time.time()
+        contracts = []
+        missing = []
+
+        for spec in specs:
+            key = (spec[0], spec[1], float(spec[2]), spec[3], spec[4])
+            cached = self._options_cache.get(key)
+            if cached is not None and cached[1] > now:
+                contracts.append(cached[0])
+            else:
+                contract = Option(*key)
+                contracts.append(contract)
+                missing.append((key, contract))
+
+        if missing:
+            qualified = self._qualify_chunked([contract for _, contract in missing])
+            for (key, _), contract in zip(missing, qualified):
+                if contract:
+                    self._options_cache[key] = (contract, now + OPTION_CONTRACT_TTL)
+
+        return contracts
+
+    def _qualify(self, symbol: str, expiration: str, strike: float,
+                 right: str = 'C', exchange: str = "SMART") -> Option:
+        """Qualified Option contract (cached, see _qualify_options)"""
+        return self._qualify_options([(symbol, expiration, strike, right, exchange)])[0]
+
     # ==================== Order Execution ====================
 
     def sell_covered_call(
@@ -538,8 +751,7 @@ class IBKRConnector:
             return None
 
         # Create option contract
-        contract = Option(symbol, expiration, strike, 'C', exchange)
-        self.ib.qualifyContracts(contract)
+        contract = self._qualify(symbol, expiration, strike, 'C', exchange)
 
         # Create sell order
         if limit_price:
@@ -585,8 +797,7 @@ class IBKRConnector:
             logger.warning("Read-only mode - order not submitted")
             return None
 
-        contract = Option(symbol, expiration, strike, 'C', exchange)
-        self.ib.qualifyContracts(contract)
+        contract = self._qualify(symbol, expiration, strike, 'C', exchange)
 
         if limit_price:
             order = LimitOrder('BUY', quantity, limit_price)
@@ -611,9 +822,12 @@ class IBKRConnector:
         new_expiration: str,
         net_credit_limit: float,
         exchange: str = "SMART"
-    ) -> Optional[List[Trade]]:
+    ) -> Optional[Trade]:
         """
-        Roll covered call (close old, open new)
+        Roll covered call (close old, open new) as one combo order
+
+        Both legs go out as a single BAG order, so IBKR fills them together
+        (no leg risk) at a net credit of at least net_credit_limit.
 
         Args:
             symbol: Stock symbol
@@ -625,7 +839,7 @@ class IBKRConnector:
             net_credit_limit: Minimum net credit required
             exchange: Exchange
 
-        Returns: List of [buy_trade, sell_trade] or None
+        Returns: Trade for the combo order or None
         """
         if not self.connected:
             raise ConnectionError("Not connected to IBKR")
@@ -635,14 +849,12 @@ class IBKRConnector:
             return None
 
         # Get current prices
-        old_contract = Option(symbol, old_expiration, old_strike, 'C', exchange)
-        new_contract = Option(symbol, new_expiration, new_strike, 'C', exchange)
+        old_contract, new_contract = self._qualify_options([
+            (symbol, old_expiration, old_strike, 'C', exchange),
+            (symbol, new_expiration, new_strike, 'C', exchange)
+        ])
 
-        self.ib.qualifyContracts(old_contract, new_contract)
-
-        old_ticker = self.ib.reqMktData(old_contract)
-        new_ticker = self.ib.reqMktData(new_contract)
-        time.sleep(1)
+        old_ticker, new_ticker = self.ib.reqTickers(old_contract, new_contract)
 
         # Calculate net credit
         buyback_cost = old_ticker.ask
@@ -655,20 +867,29 @@ class IBKRConnector:
             )
             return None
 
-        # Execute roll
+        # Execute roll - buy back the old call and sell the new one in one combo
         try:
-            buy_order = MarketOrder('BUY', quantity)
-            buy_trade = self.ib.placeOrder(old_contract, buy_order)
+            combo = Contract(
+                secType='BAG',
+                symbol=symbol,
+                exchange=exchange,
+                currency='USD',
+                comboLegs=[
+                    ComboLeg(conId=old_contract.conId, ratio=1, action='BUY', exchange=exchange),
+                    ComboLeg(conId=new_contract.conId, ratio=1, action='SELL', exchange=exchange)
+                ]
+            )
 
-            sell_order = MarketOrder('SELL', quantity)
-            sell_trade = self.ib.placeOrder(new_contract, sell_order)
+            # Buying the combo at a negative price = receiving at least the net credit
+            order = LimitOrder('BUY', quantity, -net_credit_limit)
+            trade = self.ib.placeOrder(combo, order)
 
             logger.info(
                 f"Rolled {symbol}: {old_strike}C {old_expiration} -> {new_strike}C {new_expiration} "
                 f"for net credit ${net_credit:.2f}"
             )
 
-            return [buy_trade, sell_trade]
+            return trade
 
         except Exception as e:
             logger.error(f"Failed to roll position: {e}")
@@ -698,7 +919,7 @@ class IBKRConnector:
             raise ConnectionError("Not connected to IBKR")
 
         contract = IBStock(symbol, 'SMART', 'USD')
-        self.ib.qualifyContracts(contract)
+        self._qualify_contracts(contract)
 
         bars = self.ib.reqHistoricalData(
             contract,
@@ -709,7 +930,7 @@ class IBKRConnector:
             useRTH=True
         )
 
-        df = util.df(bars)
+        df = _bars_to_df(bars)
         logger.info(f"Retrieved {len(df)} bars of historical data for {symbol}")
         return df
 
@@ -724,8 +945,7 @@ class IBKRConnector:
         if not self.connected:
             raise ConnectionError("Not connected to IBKR")
 
-        contract = Option(symbol, expiration, strike, 'C', 'SMART')
-        self.ib.qualifyContracts(contract)
+        contract = self._qualify(symbol, expiration, strike, 'C', 'SMART')
 
         bars = self.ib.reqHistoricalData(
             contract,
@@ -736,7 +956,7 @@ class IBKRConnector:
             useRTH=True
         )
 
-        df = util.df(bars)
+        df = _bars_to_df(bars)
         logger.info(f"Retrieved IV history for {symbol} {strike}C")
         return df
 
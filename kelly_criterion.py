@@ -17,14 +17,21 @@ For trading safety, we use "Fractional Kelly" (typically 25-50% of full Kelly)
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
+import time
 
 from trade_analytics import TradeDatabase
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Trade history only changes when trades close - reuse Kelly results for 5 minutes
+KELLY_CACHE_TTL = 300
+
+# Below this many closed trades the win rate is noise - fall back to a conservative default
+MIN_KELLY_TRADES = 20
+
 
 class KellyCriterionCalculator:
     """Calculate optimal position sizing using Kelly Criterion"""
@@ -38,6 +45,27 @@ class KellyCriterionCalculator:
         """
         self.db = db
         self.kelly_fraction = kelly_fraction  # Fractional Kelly for safety
+        # (symbol, days) -> (expires_at, db revision, result)
+        self._kelly_cache: Dict[Tuple[Optional[str], int], Tuple[float, Optional[int], Dict]] = {}
+
+    def clear_cache(self):
+        """Forget cached Kelly results (e.g. after recording new trades)"""
+        self._kelly_cache.clear()
+
+    def _cached_result(self, symbol: Optional[str], days: int) -> Optional[Dict]:
+        """Copy of a cached Kelly result, or None if expired or the trade DB has changed"""
+        cached = self._kelly_cache.get((symbol, days))
+        if cached is None:
+            return None
+
+        expires_at, revision, result = cached
+        if expires_at <= time.monotonic() or revision != getattr(self.db, 'revision', None):
+            return None
+        return dict(result)
+
+    def _cache_result(self, symbol: Optional[str], days: int, result: Dict, expires_at: float):
+        """Cache a Kelly result, tagged with the trade DB revision it was computed from"""
+        self._kelly_cache[(symbol, days)] = (expires_at, getattr(self.db, 'revision', None), result)
 
     def calculate_kelly_fraction(self,
                                  symbol: Optional[str] = None,
@@ -51,67 +79,179 @@ class KellyCriterionCalculator:
 
         Returns:
             Dictionary with Kelly fraction and supporting metrics
+
+        Results are cached per (symbol, days) for KELLY_CACHE_TTL seconds, so
+        get_position_size/get_portfolio_allocation don't re-query the database.
+        A trade recorded or closed through the same TradeDatabase invalidates them.
         """
+        cached = self._cached_result(symbol, days)
+        if cached is not None:
+            return cached
+
+        result = self._kelly_core(symbol, days)
+        self._cache_result(symbol, days, result, time.monotonic() + KELLY_CACHE_TTL)
+        return dict(result)
+
+    def _kelly_core(self, symbol: Optional[str], days: int) -> Dict:
+        """Kelly fraction from the trade history (uncached, see calculate_kelly_fraction)"""
         logger.info(f"📊 Calculating Kelly Criterion for {symbol or 'all symbols'}...")
 
         # Get trade history
         trades = self._get_trades_dataframe(days, symbol)
 
-        if trades is None or len(trades) < 20:
-            logger.warning(f"⚠️  Insufficient data: {len(trades) if trades is not None else 0} trades")
-            return {
-                'kelly_fraction': 0.10,  # Conservative default
-                'safe_kelly': 0.10,
-                'win_probability': 0.0,
-                'avg_win': 0.0,
-                'avg_loss': 0.0,
-                'odds_ratio': 0.0,
-                'sample_size': 0,
-                'confidence': 'low'
-            }
+        if trades is None:
+            return self._insufficient_data_result()
+
+        # Win/loss counts and sums in masked NumPy reductions (no filtered DataFrames)
+        pl = trades['profit_loss'].to_numpy(dtype=np.float64)
+        wins = pl > 0
+        losses = pl < 0
 
-        # Separate winning and losing trades
-        winning_trades = trades[trades['profit_loss'] > 0]
-        losing_trades = trades[trades['profit_loss'] < 0]
+        result, = self._kelly_from_stats(
+            n=[pl.size],
+            n_win=[wins.sum()],
+            n_loss=[losses.sum()],
+            sum_win=[pl.sum(where=wins)],
+            sum_loss=[pl.sum(where=losses)]
+        )
 
-        # Calculate win probability
-        p = len(winning_trades) / len(trades)  # Win probability
-        q = 1 - p  # Loss probability
+        self._print_kelly_results(result, symbol)
+        return result
 
-        # Calculate average win/loss
-        avg_win = winning_trades['profit_loss'].mean() if len(winning_trades) > 0 else 0
-        avg_loss = abs(losing_trades['profit_loss'].mean()) if len(losing_trades) > 0 else 1
+    @staticmethod
+    def _insufficient_data_result() -> Dict:
+        """Conservative Kelly result when there are fewer than MIN_KELLY_TRADES trades"""
+        return {
+            'kelly_fraction': 0.10,  # Conservative default
+            'safe_kelly': 0.10,
+            'win_probability': 0.0,
+            'avg_win': 0.0,
+            'avg_loss': 0.0,
+            'odds_ratio': 0.0,
+            'sample_size': 0,
+            'confidence': 'low'
+        }
 
-        # Calculate odds (b = avg win / avg loss)
-        b = avg_win / avg_loss if avg_loss > 0 else 1.0
+    def _kelly_from_stats(self, n, n_win, n_loss, sum_win, sum_loss) -> List[Dict]:
+        """
+        Kelly results from per-symbol win/loss counts and P&L sums
 
-        # Kelly Formula: f* = (bp - q) / b
-        kelly_full = (b * p - q) / b if b > 0 else 0
+        All arguments are equal-length array-likes (one entry per symbol); the
+        math runs as NumPy array operations over all symbols at once.
 
-        # Apply fractional Kelly for safety (typically 25-50%)
-        kelly_safe = kelly_full * self.kelly_fraction
+        Args:
+            n: Number of trades
+            n_win / n_loss: Number of winning / losing trades
+            sum_win: Total profit of winning trades
+            sum_loss: Total (negative) P&L of losing trades
 
-        # Ensure it's positive and reasonable
-        kelly_safe = max(0, min(kelly_safe, 0.30))  # Cap at 30% of portfolio
+        Returns:
+            One result dict per entry, in order
+        """
+        n = np.asarray(n, dtype=np.int64)
+        n_win = np.asarray(n_win, dtype=np.int64)
+        n_loss = np.asarray(n_loss, dtype=np.int64)
+        sum_win = np.asarray(sum_win, dtype=np.float64)
+        sum_loss = np.asarray(sum_loss, dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Calculate win probability
+            p = n_win / n  # Win probability
+            q = 1 - p  # Loss probability
+
+            # Calculate average win/loss
+            avg_win = np.where(n_win > 0, sum_win / n_win, 0.0)
+            avg_loss = np.where(n_loss > 0, -sum_loss / n_loss, 1.0)
+
+            # Calculate odds (b = avg win / avg loss)
+            b = np.where(avg_loss > 0, avg_win / avg_loss, 1.0)
+
+            # Kelly Formula: f* = (bp - q) / b
+            kelly_full = np.where(b > 0, (b * p - q) / b, 0.0)
+
+        # Apply fractional Kelly for safety (typically 25-50%), kept positive
+        # and capped at 30% of portfolio
+        kelly_safe = np.clip(kelly_full * self.kelly_fraction, 0.0, 0.30)
+
+        results = []
+        for i, sample_size in enumerate(n.tolist()):
+            # Determine confidence based on sample size
+            confidence = self._determine_confidence(sample_size)
+            results.append({
+                'kelly_fraction': float(kelly_full[i]),
+                'safe_kelly': float(kelly_safe[i]),
+                'win_probability': float(p[i]),
+                'loss_probability': float(q[i]),
+                'avg_win': float(avg_win[i]),
+                'avg_loss': float(avg_loss[i]),
+                'odds_ratio': float(b[i]),
+                'sample_size': sample_size,
+                'confidence': confidence,
+                'recommendation': self._get_recommendation(float(kelly_safe[i]), confidence)
+            })
+
+        return results
+
+    def _kelly_for_symbols(self, symbols: list, days: int = 180) -> Dict[str, Dict]:
+        """
+        Kelly results for several symbols from a single trade-history query
 
-        # Determine confidence based on sample size
-        confidence = self._determine_confidence(len(trades))
+        Loads all trades once and reduces them per symbol in one groupby,
+        instead of one query + DataFrame per symbol. Shares its cache with
+        calculate_kelly_fraction - only uncached symbols are queried.
+        """
+        results = {}
+        for symbol in symbols:
+            cached = self._cached_result(symbol, days)
+            if cached is not None:
+                results[symbol] = cached
+
+        missing = [symbol for symbol in symbols if symbol not in results]
+        if not missing:
+            return results
+
+        logger.info(f"📊 Calculating Kelly Criterion for {len(missing)} symbols...")
+
+        stats = pd.DataFrame()
+        trades = self._get_trades_dataframe(days, None)
+        if trades is not None:
+            trades = trades[trades['symbol'].isin(missing)]
+            pl = trades['profit_loss'].astype(np.float64)
+            # Categorical symbols - groupby reduces over integer codes, no per-row string hashing
+            stats = pd.DataFrame({
+                'symbol': pd.Categorical(trades['symbol']),
+                'is_win': pl > 0,
+                'is_loss': pl < 0,
+                'win': pl.clip(lower=0),
+                'loss': pl.clip(upper=0)
+            }).groupby('symbol', observed=True, sort=False).agg(
+                n=('is_win', 'size'),
+                n_win=('is_win', 'sum'),
+                n_loss=('is_loss', 'sum'),
+                sum_win=('win', 'sum'),
+                sum_loss=('loss', 'sum')
+            )
+
+        # Kelly math for every symbol with enough trades in one vectorized pass
+        enough = stats[stats['n'] >= MIN_KELLY_TRADES] if len(stats) else stats
+        computed = dict(zip(enough.index, self._kelly_from_stats(
+            enough['n'], enough['n_win'], enough['n_loss'], enough['sum_win'], enough['sum_loss']
+        ))) if len(enough) else {}
+
+        expires_at = time.monotonic() + KELLY_CACHE_TTL
+        for symbol in missing:
+            if symbol in computed:
+                result = computed[symbol]
+                self._print_kelly_results(result, symbol)
+            else:
+                logger.warning(f"⚠️  Insufficient data for {symbol}")
+                result = self._insufficient_data_result()
 
-        result = {
-            'kelly_fraction': kelly_full,
-            'safe_kelly': kelly_safe,
-            'win_probability': p,
-            'loss_probability': q,
-            'avg_win': avg_win,
-            'avg_loss': avg_loss,
-            'odds_ratio': b,
-            'sample_size': len(trades),
-            'confidence': confidence,
-            'recommendation': self._get_recommendation(kelly_safe, confidence)
-        }
+            self._cache_result(symbol, days, result, expires_at)
+            results[symbol] = dict(result)
 
-        self._print_kelly_results(result, symbol)
-        return result
+        # Caller's symbol order
+        return {symbol: results[symbol] for symbol in symbols}
 
     def get_position_size(self,
                          symbol: str,
@@ -188,9 +328,8 @@ class KellyCriterionCalculator:
         allocations = {}
         total_kelly = 0
 
-        # Calculate Kelly for each symbol
-        for symbol in symbols:
-            kelly_result = self.calculate_kelly_fraction(symbol)
+        # Calculate Kelly for each symbol (one trade-history query for all of them)
+        for symbol, kelly_result in self._kelly_for_symbols(symbols).items():
             kelly = kelly_result['safe_kelly']
 
             if kelly > 0.05:  # Only include if Kelly > 5%
@@ -232,17 +371,27 @@ class KellyCriterionCalculator:
         return sorted_allocations
 
     def _get_trades_dataframe(self, days: int, symbol: Optional[str]) -> Optional[pd.DataFrame]:
-        """Get trades as DataFrame"""
+        """Get closed trades as DataFrame (None if fewer than MIN_KELLY_TRADES)"""
         try:
             if symbol:
                 trades = self.db.get_trade_history(days=days, symbol=symbol)
             else:
                 trades = self.db.get_trade_history(days=days)
 
-            if not trades:
+            # Length check first - no DataFrame built for a sample we'd reject
+            count = len(trades) if trades is not None else 0
+            if count >= MIN_KELLY_TRADES:
+                trades = trades if isinstance(trades, pd.DataFrame) else pd.DataFrame(trades)
+
+                # Open trades have no profit_loss yet - they are neither wins nor losses
+                trades = trades[trades['profit_loss'].notna()]
+                count = len(trades)
+
+            if count < MIN_KELLY_TRADES:
+                logger.warning(f"⚠️  Insufficient data: {count} closed trades")
                 return None
 
-            return pd.DataFrame(trades)
+            return trades
         except Exception as e:
             logger.error(f"Error loading trades: {e}")
             return None
@@ -270,60 +419,80 @@ class KellyCriterionCalculator:
             return "Very Aggressive: Maximum positions - high risk"
 
     def _print_kelly_results(self, result: Dict, symbol: Optional[str]):
-        """Print Kelly calculation results"""
+        """Print Kelly calculation results (one log record)"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         symbol_str = f" for {symbol}" if symbol else ""
-        logger.info(f"\n{'='*60}")
-        logger.info(f"KELLY CRITERION RESULTS{symbol_str}")
-        logger.info(f"{'='*60}")
-        logger.info(f"Sample Size: {result['sample_size']} trades")
-        logger.info(f"Confidence: {result['confidence'].upper()}")
-        logger.info("")
-        logger.info(f"Win Probability: {result['win_probability']:.1%}")
-        logger.info(f"Avg Win: ${result['avg_win']:.2f}")
-        logger.info(f"Avg Loss: ${result['avg_loss']:.2f}")
-        logger.info(f"Odds Ratio (b): {result['odds_ratio']:.2f}")
-        logger.info("")
-        logger.info(f"Full Kelly: {result['kelly_fraction']:.1%}")
-        logger.info(f"Safe Kelly ({self.kelly_fraction:.0%} of full): {result['safe_kelly']:.1%}")
-        logger.info("")
-        logger.info(f"Recommendation: {result['recommendation']}")
-        logger.info(f"{'='*60}")
+        lines = [
+            f"\n{'='*60}",
+            f"KELLY CRITERION RESULTS{symbol_str}",
+            f"{'='*60}",
+            f"Sample Size: {result['sample_size']} trades",
+            f"Confidence: {result['confidence'].upper()}",
+            "",
+            f"Win Probability: {result['win_probability']:.1%}",
+            f"Avg Win: ${result['avg_win']:.2f}",
+            f"Avg Loss: ${result['avg_loss']:.2f}",
+            f"Odds Ratio (b): {result['odds_ratio']:.2f}",
+            "",
+            f"Full Kelly: {result['kelly_fraction']:.1%}",
+            f"Safe Kelly ({self.kelly_fraction:.0%} of full): {result['safe_kelly']:.1%}",
+            "",
+            f"Recommendation: {result['recommendation']}",
+            f"{'='*60}",
+        ]
+        logger.info("\n".join(lines))
 
     def _print_position_size(self, result: Dict):
-        """Print position sizing results"""
-        logger.info(f"\n{'='*60}")
-        logger.info(f"POSITION SIZE for {result['symbol']}")
-        logger.info(f"{'='*60}")
-        logger.info(f"Kelly Fraction: {result['kelly_fraction']:.1%}")
-        logger.info(f"Position Size: ${result['position_size_usd']:,.2f}")
-        logger.info(f"Recommended Contracts: {result['contracts']}")
-        logger.info(f"Max Contracts: {result['max_contracts']}")
-        logger.info(f"Win Probability: {result['win_probability']:.1%}")
-        logger.info(f"Confidence: {result['confidence'].upper()}")
-        logger.info("")
-        logger.info(f"💡 {result['recommendation']}")
-        logger.info(f"{'='*60}")
+        """Print position sizing results (one log record)"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        lines = [
+            f"\n{'='*60}",
+            f"POSITION SIZE for {result['symbol']}",
+            f"{'='*60}",
+            f"Kelly Fraction: {result['kelly_fraction']:.1%}",
+            f"Position Size: ${result['position_size_usd']:,.2f}",
+            f"Recommended Contracts: {result['contracts']}",
+            f"Max Contracts: {result['max_contracts']}",
+            f"Win Probability: {result['win_probability']:.1%}",
+            f"Confidence: {result['confidence'].upper()}",
+            "",
+            f"💡 {result['recommendation']}",
+            f"{'='*60}",
+        ]
+        logger.info("\n".join(lines))
 
     def _print_allocation(self, allocations: Dict, portfolio_value: float):
-        """Print portfolio allocation"""
-        logger.info(f"\n{'='*60}")
-        logger.info(f"PORTFOLIO ALLOCATION")
-        logger.info(f"{'='*60}")
-        logger.info(f"Total Portfolio: ${portfolio_value:,.2f}")
-        logger.info(f"Number of Positions: {len(allocations)}")
-        logger.info("")
+        """Print portfolio allocation (one log record)"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        lines = [
+            f"\n{'='*60}",
+            f"PORTFOLIO ALLOCATION",
+            f"{'='*60}",
+            f"Total Portfolio: ${portfolio_value:,.2f}",
+            f"Number of Positions: {len(allocations)}",
+            "",
+        ]
 
         total_allocated = 0
         for symbol, data in allocations.items():
-            logger.info(f"{symbol:6} - {data['position_pct']:5.1f}% "
-                       f"(${data['position_size_usd']:10,.2f}) - "
-                       f"{data['confidence']} confidence")
+            lines.append(f"{symbol:6} - {data['position_pct']:5.1f}% "
+                         f"(${data['position_size_usd']:10,.2f}) - "
+                         f"{data['confidence']} confidence")
             total_allocated += data['position_size_usd']
 
-        logger.info("")
-        logger.info(f"Total Allocated: ${total_allocated:,.2f} ({total_allocated/portfolio_value:.1%})")
-        logger.info(f"Cash Reserve: ${portfolio_value - total_allocated:,.2f}")
-        logger.info(f"{'='*60}")
+        lines += [
+            "",
+            f"Total Allocated: ${total_allocated:,.2f} ({total_allocated/portfolio_value:.1%})",
+            f"Cash Reserve: ${portfolio_value - total_allocated:,.2f}",
+            f"{'='*60}",
+        ]
+        logger.info("\n".join(lines))
 
 
 def main():
@@ -0,0 +1,59 @@
+"""
+Test Suite for Covered Calls Backtester
+Tests for the simulation kernels (no market data download)
+"""
+
+import unittest
+import numpy as np
+
+from covered_calls_backtester import (
+    CoveredCallBacktester, _simulate_covered_calls, warmup_kernels
+)
+
+
+class TestSimulationKernel(unittest.TestCase):
+    """Test the covered call simulation kernel"""
+
+    def test_rising_prices_always_assigned(self):
+        """Steadily rising prices get assigned on every trade"""
+        closes = np.linspace(100.0, 200.0, 31)
+        n_trades, entry_idx, expiry_idx, strikes, _, assigned, stock_gains, _, final_entry = \
+            _simulate_covered_calls(closes, 0.0, 4, 0.5, 100)
+
+        self.assertEqual(n_trades, 6)
+        self.assertTrue(assigned[:n_trades].all())
+        np.testing.assert_array_equal(entry_idx[:n_trades], [0, 5, 10, 15, 20, 25])
+        np.testing.assert_array_equal(expiry_idx[:n_trades], entry_idx[:n_trades] + 4)
+        # First trade is ATM at the entry price - no stock gain
+        self.assertEqual(stock_gains[0], 0.0)
+        self.assertEqual(final_entry, strikes[n_trades - 1])
+
+    def test_flat_prices_never_assigned(self):
+        """Flat prices below the OTM strike expire worthless"""
+        closes = np.full(20, 50.0)
+        n_trades, _, _, _, premiums, assigned, stock_gains, missed_gains, _ = \
+            _simulate_covered_calls(closes, 0.05, 5, 0.3, 100)
+
+        self.assertEqual(n_trades, 3)
+        self.assertFalse(assigned[:n_trades].any())
+        self.assertEqual(stock_gains[:n_trades].sum(), 0.0)
+        self.assertEqual(missed_gains[:n_trades].sum(), 0.0)
+        self.assertTrue((premiums[:n_trades] >= 0.10).all())
+
+    def test_not_enough_data(self):
+        """No trades when the series is shorter than one expiry"""
+        n_trades = _simulate_covered_calls(np.full(5, 10.0), 0.05, 30, 0.5, 100)[0]
+        self.assertEqual(n_trades, 0)
+
+    def test_premium_estimate_floor(self):
+        """Far OTM premium estimate is floored at $0.10"""
+        backtester = CoveredCallBacktester.__new__(CoveredCallBacktester)
+        self.assertEqual(backtester.estimate_option_premium(100.0, 500.0, 7, 0.2), 0.10)
+
+    def test_warmup(self):
+        """Warm-up runs with or without numba"""
+        warmup_kernels()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
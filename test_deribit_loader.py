@@ -0,0 +1,77 @@
+"""
+Test Suite for the Deribit connector
+The Deribit client is replaced by an in-memory fake (no network)
+"""
+
+import asyncio
+import sys
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+# The tests never use the real client - only its module has to import
+try:
+    import deribit_wrapper
+except ImportError:
+    sys.modules['deribit_wrapper'] = MagicMock()
+
+from deribit_loader import DeribitConnector, DeribitConfig
+
+
+class FakeDeribitClient:
+    """A 20-strike BTC call chain with slow (10 ms) ticker requests"""
+
+    def get_index_price(self, index_name):
+        return {'index_price': 60000.0}
+
+    def get_instruments(self, currency, kind='option'):
+        expiration = (datetime.utcnow() + timedelta(days=20)).strftime('%d%b%y').upper()
+        return [
+            {'instrument_name': f'{currency}-{expiration}-{60000 + k * 1000}-C',
+             'bid_price': 0.02, 'ask_price': 0.03, 'last_price': 0.025,
+             'volume': 10, 'open_interest': 100, 'mark_iv': 60.0}
+            for k in range(20)
+        ]
+
+    def get_ticker(self, instrument_name):
+        time.sleep(0.01)
+        return {'greeks': {'delta': 0.3, 'gamma': 1e-5, 'theta': -50.0, 'vega': 30.0}}
+
+
+class TestAsyncWrappers(unittest.TestCase):
+    """Test the async wrappers around the blocking connector calls"""
+
+    def setUp(self):
+        self.connector = DeribitConnector(DeribitConfig(max_concurrency=4))
+        self.connector.client = FakeDeribitClient()
+        self.connector.connected = True
+        self.addCleanup(self.connector.disconnect)
+
+    def test_concurrent_server_greeks_do_not_deadlock(self):
+        """More concurrent scans than pool workers, each fanning out ticker requests"""
+        async def scan_all():
+            return await asyncio.wait_for(asyncio.gather(*(
+                self.connector.calculate_covered_call_premium_async('BTC', server_greeks=True)
+                for _ in range(8)
+            )), timeout=20)
+
+        results = asyncio.run(scan_all())
+
+        self.assertEqual(len(results), 8)
+        for strategies in results:
+            self.assertTrue(strategies)
+            self.assertTrue(all(s['delta'] == 0.3 for s in strategies))
+
+    def test_disconnect_stops_pools(self):
+        """Disconnect shuts the worker pools down"""
+        pools = (self.connector._pool, self.connector._fanout_pool)
+        self.connector.disconnect()
+
+        for pool in pools:
+            with self.assertRaises(RuntimeError):
+                pool.submit(time.sleep, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Test Suite for the earnings calendar and its on-disk cache
+yfinance is patched out - no network
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from earnings_calendar import EarningsCache, EarningsCalendar
+
+
+def fake_ticker(earnings_date=None, error=None):
+    """yf.Ticker stand-in: calendar dict with an earnings date, or failing requests"""
+    ticker = MagicMock()
+    if error is not None:
+        type(ticker).calendar = PropertyMock(side_effect=error)
+        type(ticker).info = PropertyMock(side_effect=error)
+    else:
+        ticker.calendar = {'Earnings Date': earnings_date}
+    return ticker
+
+
+class TempDbMixin:
+    """Gives each test its own cache database"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.db_path = os.path.join(tmp_dir.name, 'earnings.db')
+
+
+class TestEarningsCache(TempDbMixin, unittest.TestCase):
+    """Test the SQLite TTL cache"""
+
+    def test_hit_and_miss(self):
+        """Unknown symbols return the default, stored ones their value"""
+        cache = EarningsCache(self.db_path)
+        self.assertEqual(cache.get('AAPL', 'missing'), 'missing')
+
+        cache.set('AAPL', '2030-01-30T00:00:00')
+        self.assertEqual(cache.get('AAPL', 'missing'), '2030-01-30T00:00:00')
+
+        # Persisted - a new instance on the same file sees it
+        self.assertEqual(EarningsCache(self.db_path).get('AAPL'), '2030-01-30T00:00:00')
+
+    def test_ttl_expiry(self):
+        """Entries expire after ttl seconds"""
+        cache = EarningsCache(self.db_path, ttl=60)
+        cache.set('AAPL', '2030-01-30T00:00:00')
+
+        with patch('earnings_calendar.time.time', return_value=time.time() + 61):
+            self.assertEqual(cache.get('AAPL', 'missing'), 'missing')
+
+    def test_none_uses_miss_ttl(self):
+        """A cached 'no date' is served, but only for the short miss_ttl"""
+        cache = EarningsCache(self.db_path, ttl=3600, miss_ttl=60)
+        cache.set('AAPL', None)
+        self.assertIsNone(cache.get('AAPL', 'missing'))
+
+        with patch('earnings_calendar.time.time', return_value=time.time() + 61):
+            self.assertEqual(cache.get('AAPL', 'missing'), 'missing')
+
+
+class TestEarningsCalendar(TempDbMixin, unittest.TestCase):
+    """Test earnings checks with yfinance patched out"""
+
+    def test_cached_date_skips_yfinance(self):
+        """A cached upcoming date is used without a request"""
+        calendar = EarningsCalendar(self.db_path)
+        upcoming = datetime.now() + timedelta(days=10)
+        calendar.cache.set('AAPL', upcoming.isoformat())
+
+        with patch('earnings_calendar.yf.Ticker') as ticker:
+            result = calendar.check_before_trade('AAPL', 30)
+
+        ticker.assert_not_called()
+        self.assertFalse(result['safe'])
+
+    def test_past_cached_date_is_refetched(self):
+        """A cached date that has already passed is dropped and fetched again"""
+        calendar = EarningsCalendar(self.db_path)
+        calendar.cache.set('AAPL', (datetime.now() - timedelta(days=3)).isoformat())
+        upcoming = datetime.now() + timedelta(days=60)
+
+        with patch('earnings_calendar.yf.Ticker', return_value=fake_ticker(upcoming)) as ticker:
+            result = calendar.check_before_trade('AAPL', 30)
+
+        ticker.assert_called_once_with('AAPL')
+        self.assertTrue(result['safe'])
+        self.assertEqual(result['earnings_date'], upcoming.strftime('%Y-%m-%d'))
+        self.assertEqual(calendar.cache.get('AAPL'), upcoming.isoformat())
+
+    def test_check_portfolio(self):
+        """Every position is evaluated; a failed lookup allows the trade with a warning"""
+        calendar = EarningsCalendar(self.db_path)
+        tickers = {
+            'AAPL': fake_ticker(datetime.now() + timedelta(days=10)),
+            'MSFT': fake_ticker(datetime.now() + timedelta(days=90)),
+            'TSLA': fake_ticker(error=ConnectionError('rate limited')),
+        }
+
+        with patch('earnings_calendar.yf.Ticker', side_effect=tickers.get):
+            results = calendar.check_portfolio([('AAPL', 30), ('MSFT', 30), ('TSLA', 30)])
+
+        self.assertFalse(results['AAPL']['safe'])
+        self.assertTrue(results['MSFT']['safe'])
+        self.assertTrue(results['TSLA']['safe'])
+        self.assertIn('Could not check earnings', results['TSLA']['reason'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Test Suite for the chain Greeks kernel
+Compares against the closed-form Black-Scholes values from scipy
+"""
+
+import unittest
+import numpy as np
+from scipy.stats import norm
+
+from _greeks_numba import bs_call_greeks
+
+
+class TestChainGreeks(unittest.TestCase):
+    """Test the vectorized Black-Scholes call Greeks"""
+
+    def test_matches_black_scholes(self):
+        """Kernel agrees with scipy's normal CDF/PDF formulas"""
+        spot, r = 100.0, 0.05
+        strikes = np.array([90.0, 100.0, 110.0])
+        ttes = np.array([30, 60, 90]) / 365
+        ivs = np.array([0.2, 0.35, 0.5])
+
+        delta, gamma, theta, vega = bs_call_greeks(spot, strikes, ttes, ivs, r)
+
+        sqrt_t = np.sqrt(ttes)
+        d1 = (np.log(spot / strikes) + (r + 0.5 * ivs ** 2) * ttes) / (ivs * sqrt_t)
+        d2 = d1 - ivs * sqrt_t
+        np.testing.assert_allclose(delta, norm.cdf(d1))
+        np.testing.assert_allclose(gamma, norm.pdf(d1) / (spot * ivs * sqrt_t))
+        np.testing.assert_allclose(
+            theta,
+            (-(spot * norm.pdf(d1) * ivs) / (2 * sqrt_t) - r * strikes * np.exp(-r * ttes) * norm.cdf(d2)) / 365
+        )
+        np.testing.assert_allclose(vega, spot * norm.pdf(d1) * sqrt_t / 100)
+
+    def test_expired_and_zero_iv_are_nan(self):
+        """No Greeks for expired or zero-IV contracts"""
+        delta, gamma, theta, vega = bs_call_greeks(
+            100.0, np.array([100.0, 100.0]), np.array([0.0, 0.1]), np.array([0.3, 0.0]), 0.05
+        )
+        for values in (delta, gamma, theta, vega):
+            self.assertTrue(np.isnan(values).all())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+"""
+Test Suite for the IBKR statement to portfolio CSV converter
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import ibkr_portfolio_converter
+from ibkr_portfolio_converter import PYMUPDF_AVAILABLE, parse_ibkr_pdf, _extract_pages_text
+
+
+class TestParseTransactions(unittest.TestCase):
+    """Test Buy/Sell line parsing and position netting"""
+
+    def parse(self, *pages):
+        with patch('ibkr_portfolio_converter._extract_pages_text', return_value=list(pages)):
+            return parse_ibkr_pdf('statement.pdf')
+
+    def test_price_formats(self):
+        """Plain, '$'-prefixed and 'USD'-suffixed prices all count"""
+        portfolio = self.parse(
+            "2025-01-02  TSLA  Buy  10  250.00\n"
+            "2025-01-03  TSLA  Buy  10  $260.00\n"
+            "2025-01-04  MSTY  Buy  1,000  20.50USD\n"
+        )
+
+        self.assertEqual(portfolio['TSLA']['quantity'], 20)
+        self.assertEqual(portfolio['TSLA']['avg_cost'], 255.00)
+        self.assertEqual(portfolio['MSTY']['quantity'], 1000)
+        self.assertEqual(portfolio['MSTY']['total_cost'], 20500.00)
+
+    def test_lowercase_symbol_and_sells(self):
+        """Lowercase tickers are upper-cased; sells reduce and closed positions drop out"""
+        portfolio = self.parse(
+            "tsla Buy 10 $250.00\n",
+            "TSLA Sell 4 $300.00\nBRK.B Buy 5 400.00\nBRK.B Sell 5 410.00\n"
+        )
+
+        self.assertEqual(portfolio['TSLA']['quantity'], 6)
+        self.assertNotIn('BRKB', portfolio)
+
+
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF not installed")
+class TestExtractPagesText(unittest.TestCase):
+    """Test statement text extraction (serial and process-pool paths)"""
+
+    def write_pdf(self, page_count: int) -> str:
+        import fitz
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = os.path.join(tmp_dir.name, 'statement.pdf')
+        with fitz.open() as doc:
+            for i in range(page_count):
+                doc.new_page().insert_text((72, 72), f"PAGE{i} TSLA Buy 1 250.00")
+            doc.save(path)
+        return path
+
+    def assert_pages_in_order(self, pages, page_count):
+        self.assertEqual(len(pages), page_count)
+        for i, text in enumerate(pages):
+            self.assertIn(f"PAGE{i} ", text)
+
+    def test_short_statement(self):
+        """Short statements are extracted in-process, one entry per page"""
+        self.assert_pages_in_order(_extract_pages_text(self.write_pdf(3)), 3)
+
+    def test_long_statement_in_parallel(self):
+        """Long statements are split across worker processes and reassembled in page order"""
+        page_count = ibkr_portfolio_converter._PARALLEL_MIN_PAGES + 5
+        path = self.write_pdf(page_count)
+
+        with patch('ibkr_portfolio_converter.os.cpu_count', return_value=2), \
+                patch('ibkr_portfolio_converter.ProcessPoolExecutor',
+                      wraps=ibkr_portfolio_converter.ProcessPoolExecutor) as pool:
+            pages = _extract_pages_text(path)
+
+        pool.assert_called_once_with(max_workers=2)
+        self.assert_pages_in_order(pages, page_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
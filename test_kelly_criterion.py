@@ -0,0 +1,156 @@
+"""
+Test Suite for Kelly Criterion position sizing and its result cache
+Runs on synthetic trade histories - no real trades database
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from kelly_criterion import KELLY_CACHE_TTL, KellyCriterionCalculator
+from trade_analytics import TradeDatabase
+
+
+class FakeTradeDatabase:
+    """get_trade_history over an in-memory DataFrame; counts queries"""
+
+    def __init__(self, trades: pd.DataFrame):
+        self.trades = trades
+        self.revision = 0
+        self.queries = 0
+
+    def get_trade_history(self, symbol=None, days=30, status=None):
+        self.queries += 1
+        if symbol:
+            return self.trades[self.trades['symbol'] == symbol].reset_index(drop=True)
+        return self.trades.copy()
+
+
+def synthetic_trades(seed=7):
+    """Closed trades for three symbols, a thin one (< MIN_KELLY_TRADES) and a few open trades"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for symbol, n, win_rate in [('AAPL', 60, 0.7), ('MSFT', 45, 0.55), ('TSLA', 80, 0.4), ('NVDA', 8, 0.9)]:
+        wins = rng.random(n) < win_rate
+        pl = np.where(wins, rng.uniform(50, 400, n), -rng.uniform(100, 900, n))
+        frames.append(pd.DataFrame({'symbol': symbol, 'profit_loss': pl}))
+    # Open trades - no P&L yet
+    frames.append(pd.DataFrame({'symbol': ['AAPL', 'TSLA'], 'profit_loss': [np.nan, np.nan]}))
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestKellyForSymbols(unittest.TestCase):
+    """Batch path must match the per-symbol path"""
+
+    def test_batch_matches_per_symbol(self):
+        symbols = ['AAPL', 'MSFT', 'TSLA', 'NVDA', 'AMZN']
+
+        batch = KellyCriterionCalculator(FakeTradeDatabase(synthetic_trades()))._kelly_for_symbols(symbols)
+        single = KellyCriterionCalculator(FakeTradeDatabase(synthetic_trades()))
+
+        self.assertEqual(list(batch), symbols)
+        for symbol in symbols:
+            expected = single.calculate_kelly_fraction(symbol=symbol)
+            with self.subTest(symbol=symbol):
+                self.assertEqual(set(batch[symbol]), set(expected))
+                for field, value in expected.items():
+                    if isinstance(value, float):
+                        self.assertAlmostEqual(batch[symbol][field], value, places=9, msg=field)
+                    else:
+                        self.assertEqual(batch[symbol][field], value, msg=field)
+
+    def test_batch_queries_once_and_reuses_cache(self):
+        db = FakeTradeDatabase(synthetic_trades())
+        kelly = KellyCriterionCalculator(db)
+
+        kelly._kelly_for_symbols(['AAPL', 'MSFT'])
+        self.assertEqual(db.queries, 1)
+
+        # Cached symbols are served without a query, by both paths
+        kelly._kelly_for_symbols(['AAPL', 'MSFT'])
+        kelly.calculate_kelly_fraction(symbol='AAPL')
+        self.assertEqual(db.queries, 1)
+
+        # Only the uncached symbol triggers a query
+        kelly._kelly_for_symbols(['AAPL', 'TSLA'])
+        self.assertEqual(db.queries, 2)
+
+
+class TestKellyCache(unittest.TestCase):
+    """TTL expiry, clear_cache and invalidation on trade writes"""
+
+    def setUp(self):
+        self.db = FakeTradeDatabase(synthetic_trades())
+        self.kelly = KellyCriterionCalculator(self.db)
+
+    def test_cached_within_ttl(self):
+        first = self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        first['kelly_fraction'] = 99.0  # Callers get a copy
+
+        second = self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        self.assertEqual(self.db.queries, 1)
+        self.assertNotEqual(second['kelly_fraction'], 99.0)
+
+    def test_ttl_expiry(self):
+        with patch('kelly_criterion.time.monotonic', return_value=1000.0):
+            self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        with patch('kelly_criterion.time.monotonic', return_value=1000.0 + KELLY_CACHE_TTL - 1):
+            self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        self.assertEqual(self.db.queries, 1)
+
+        with patch('kelly_criterion.time.monotonic', return_value=1000.0 + KELLY_CACHE_TTL + 1):
+            self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        self.assertEqual(self.db.queries, 2)
+
+    def test_clear_cache(self):
+        self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        self.kelly.clear_cache()
+        self.kelly.calculate_kelly_fraction(symbol='AAPL')
+        self.assertEqual(self.db.queries, 2)
+
+    def test_new_trade_invalidates_cache(self):
+        before = self.kelly.calculate_kelly_fraction(symbol='NVDA')
+        self.assertEqual(before['sample_size'], 0)  # Insufficient data
+
+        # A batch of closed trades lands in the database
+        extra = pd.DataFrame({'symbol': 'NVDA', 'profit_loss': np.full(20, 150.0)})
+        self.db.trades = pd.concat([self.db.trades, extra], ignore_index=True)
+        self.db.revision += 1
+
+        after = self.kelly.calculate_kelly_fraction(symbol='NVDA')
+        self.assertEqual(self.db.queries, 2)
+        self.assertEqual(after['sample_size'], 28)
+
+
+class TestTradeDatabaseRevision(unittest.TestCase):
+    """TradeDatabase writes bump the revision the Kelly cache is keyed on"""
+
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.db = TradeDatabase(self.db_path)
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_record_and_close_bump_revision(self):
+        start = self.db.revision
+        trade_id = self.db.record_trade({
+            'symbol': 'AAPL',
+            'action': 'SELL',
+            'quantity': 100,
+            'strike': 180.0,
+            'premium': 250.0
+        })
+        self.assertEqual(self.db.revision, start + 1)
+
+        self.db.update_trade_status(trade_id, 'CLOSED', close_price=0.5, profit_loss=200.0)
+        self.assertEqual(self.db.revision, start + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -118,6 +118,8 @@ class TradeDatabase:
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Bumped on every write through this instance - lets callers drop derived caches
+        self.revision = 0
         self.init_database()
     
     def init_database(self):
@@ -155,6 +157,7 @@ class TradeDatabase:
             self._update_daily_performance(conn, trade_data.get('symbol'))
             
             conn.commit()
+            self.revision += 1
             return trade_id
     
     def update_trade_status(
@@ -188,6 +191,7 @@ class TradeDatabase:
             # Update daily performance
             self._update_daily_performance(conn)
             conn.commit()
+            self.revision += 1
     
     def get_open_positions(self) -> pd.DataFrame:
         """Get all open covered call positions"""